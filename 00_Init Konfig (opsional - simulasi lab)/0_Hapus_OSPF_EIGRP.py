@@ -3,6 +3,7 @@ import concurrent.futures
 import json
 import os
 import re
+import sys
 
 # Router Admin (akses awal dari laptop)
 router_admin = {
@@ -16,6 +17,13 @@ router_admin = {
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 json_path = os.path.join(BASE_DIR, "01_Isi Manual", "router_list.json")
 
+# Modul bersama (limiter konkurensi aimd.py) ada di folder 02-1_Scripts (Rule Based)
+sys.path.insert(0, os.path.join(BASE_DIR, "02-1_Scripts (Rule Based)"))
+from aimd import AIMDLimiter
+
+MAX_WORKERS = 32
+limiter = AIMDLimiter(initial=5, maximum=MAX_WORKERS)
+
 # Load router_list.json
 with open(json_path) as f:
     router_list = json.load(f)
@@ -24,7 +32,7 @@ with open(json_path) as f:
 # ====== CLEAR CONFIG ====== #
 def clear_config(router_name, target_ip):
     try:
-        with ConnectHandler(**router_admin) as admin_conn:
+        with limiter.slot(), ConnectHandler(**router_admin) as admin_conn:
             admin_conn.find_prompt()
             print(f"[+] SSH ke {router_name} ({target_ip})")
 
@@ -86,6 +94,7 @@ def clear_config(router_name, target_ip):
 
 # ====== MAIN ====== #
 if __name__ == "__main__":
-    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
         futures = [executor.submit(clear_config, rname, ip) for rname, ip in router_list.items()]
         concurrent.futures.wait(futures)
+    print(limiter.laporan())
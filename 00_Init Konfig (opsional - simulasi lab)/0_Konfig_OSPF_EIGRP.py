@@ -2,6 +2,7 @@ from netmiko import ConnectHandler
 import concurrent.futures
 import json
 import os
+import sys
 
 # Router Admin (akses awal dari laptop)
 router_admin = {
@@ -14,6 +15,13 @@ router_admin = {
 # ====== LOAD FILE JSON ====== #
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+# Modul bersama (limiter konkurensi aimd.py) ada di folder 02-1_Scripts (Rule Based)
+sys.path.insert(0, os.path.join(BASE_DIR, "02-1_Scripts (Rule Based)"))
+from aimd import AIMDLimiter
+
+MAX_WORKERS = 32
+limiter = AIMDLimiter(initial=5, maximum=MAX_WORKERS)
+
 # router_list.json di folder 01_Isi Manual
 router_list_path = os.path.join(BASE_DIR, "01_Isi Manual", "router_list.json")
 with open(router_list_path) as f:
@@ -120,7 +128,7 @@ def generate_config(router_name: str, interfaces):
 # ====== PUSH CONFIG ====== #
 def push_config(router_name, target_ip):
     try:
-        with ConnectHandler(**router_admin) as admin_conn:
+        with limiter.slot(), ConnectHandler(**router_admin) as admin_conn:
             admin_conn.find_prompt()
             print(f"[+] SSH ke {router_name} ({target_ip})")
 
@@ -160,6 +168,7 @@ def push_config(router_name, target_ip):
 
 # ====== MAIN ====== #
 if __name__ == "__main__":
-    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
         futures = [executor.submit(push_config, rname, ip) for rname, ip in router_list.items()]
         concurrent.futures.wait(futures)
+    print(limiter.laporan())
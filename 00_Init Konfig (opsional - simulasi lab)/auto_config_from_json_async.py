@@ -2,6 +2,7 @@ from netmiko import ConnectHandler
 import concurrent.futures
 import json
 import os
+import sys
 import time
 
 # ==================== ROUTER ADMIN ==================== #
@@ -15,6 +16,13 @@ router_admin = {
 # ==================== LOAD FILE JSON ==================== #
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+# Modul bersama (limiter konkurensi aimd.py) ada di folder 02-1_Scripts (Rule Based)
+sys.path.insert(0, os.path.join(BASE_DIR, "02-1_Scripts (Rule Based)"))
+from aimd import AIMDLimiter
+
+MAX_WORKERS = 32
+limiter = AIMDLimiter(initial=5, maximum=MAX_WORKERS)
+
 router_list_path = os.path.join(BASE_DIR, "01_Isi Manual", "router_list.json")
 with open(router_list_path) as f:
     router_list = json.load(f)
@@ -144,7 +152,7 @@ def generate_config(router_name, data):
 # ==================== PUSH CONFIG VIA ADMIN ==================== #
 def push_config(router_name, target_ip):
     try:
-        with ConnectHandler(**router_admin) as admin_conn:
+        with limiter.slot(), ConnectHandler(**router_admin) as admin_conn:
             admin_conn.find_prompt()
             print(f"[+] SSH ke {router_name} ({target_ip})")
 
@@ -181,7 +189,8 @@ def push_config(router_name, target_ip):
 # ==================== MAIN EXECUTION ==================== #
 if __name__ == "__main__":
     print(f"=== Mulai konfigurasi dari topologi_{topo_index}.json ===\n")
-    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
         futures = [executor.submit(push_config, rname, ip) for rname, ip in router_list.items()]
         concurrent.futures.wait(futures)
+    print(limiter.laporan())
     print("\n=== Semua router selesai dikonfigurasi ===")
@@ -1,7 +1,14 @@
-from netmiko import ConnectHandler
 import os
 import json
+import time
+import argparse
 import concurrent.futures
+from sharding import ShardedPools, load_jump_hosts
+from collector import ambil_router, collect
+from checkpoint import Checkpoint, dengan_retry
+from manifest import Manifest
+from stream_pipeline import StreamingParser
+from telemetry import Telemetry
 
 # Router Admin (akses awal dari laptop)
 router_admin = {
@@ -15,6 +22,7 @@ router_admin = {
 script_dir = os.path.dirname(__file__)
 project_root = os.path.abspath(os.path.join(script_dir, ".."))
 base_dir = os.path.join(project_root, "03_Output", "rawdata")
+telemetry_dir = os.path.join(project_root, "03_Output", "telemetry")
 
 commands = {
     "show interfaces": "interfaces",
@@ -32,40 +40,33 @@ path = os.path.join(project_root, "01_Isi Manual", "router_list.json")
 with open(path) as f:
     router_list = json.load(f)
 
+# Jump host opsional (lebih dari satu router admin), kalau file tidak ada → router_admin saja
+jump_hosts_path = os.path.join(project_root, "01_Isi Manual", "jump_hosts.json")
 
-# ====== AMBIL DATA ====== #
-def ambil_data(router_name, mgmt_ip):
-    try:
-        print(f"[+] SSH ke {router_name} ({mgmt_ip})")
-
-        # SSH ke Router Admin
-        with ConnectHandler(**router_admin) as admin_conn:
-            admin_conn.find_prompt()
+# Konkurensi adaptif per jump host: mulai 5 sesi, naik sampai MAX_WORKERS selama router admin sehat
+MAX_WORKERS = 32
 
-            # Nested SSH ke router target
-            admin_conn.write_channel(f"ssh -l cisco {mgmt_ip}\n")
-            admin_conn.read_until_pattern("Password:")
-            admin_conn.write_channel("cisco\n")
-            admin_conn.read_until_pattern(r"#")
 
-            # Disable paging
-            admin_conn.write_channel("terminal length 0\n")
-            admin_conn.read_until_pattern(r"#")
+# ====== AMBIL DATA ====== #
+def ambil_data(shards, router_name, mgmt_ip, batch=False, manifest=None, checkpoint=None, retries=3,
+               sink=None, archive=True):
+    def percobaan():
+        # Tunggu slot konkurensi, pinjam sesi jump host dari pool (failover kalau jump host down),
+        # lalu nested SSH, jalankan semua command & simpan hasil
+        return shards.jalankan(router_name, lambda admin_conn, rec: ambil_router(
+            admin_conn, router_name, mgmt_ip, commands, base_dir,
+            batch=batch, manifest=manifest, checkpoint=checkpoint, sink=sink, archive=archive, rec=rec))
 
-            # Jalankan semua command & simpan hasil
-            for cmd, folder in commands.items():
-                result = admin_conn.send_command(cmd, expect_string=r"#")
-                if result.strip():
-                    filename = f"{router_name}_{cmd.replace(' ', '_').replace('|', '').replace('/', '')}.txt"
-                    path = os.path.join(base_dir, folder, filename)
-                    with open(path, "w") as f:
-                        f.write(result)
+    try:
+        print(f"[+] SSH ke {router_name} ({mgmt_ip})")
 
-            # Exit dari router target
-            admin_conn.write_channel("exit\n")
-            admin_conn.read_until_pattern(r"#")
+        # Error → ulangi dengan backoff; command yang sudah selesai tidak diambil ulang
+        status = dengan_retry(percobaan, percobaan=retries, label=router_name)
 
-        print(f"[✓] Selesai: {router_name}")
+        if status == "selesai":
+            print(f"[✓] Selesai: {router_name}")
+        else:
+            print(f"[=] Dilewati: {router_name} ({status})")
 
     except Exception as e:
         print(f"[!] Error {router_name}: {e}")
@@ -73,6 +74,94 @@ def ambil_data(router_name, mgmt_ip):
 
 # ====== MAIN ====== #
 if __name__ == "__main__":
-    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-        futures = [executor.submit(ambil_data, rname, ip) for rname, ip in router_list.items()]
-        concurrent.futures.wait(futures)
+    parser = argparse.ArgumentParser(description="Ambil raw data show command dari semua router")
+    parser.add_argument("--engine", choices=["thread", "async"], default="thread",
+                        help="thread = ThreadPool biasa, async = engine asyncio untuk inventory besar")
+    parser.add_argument("--limit-per-host", type=int, default=50,
+                        help="(async) maksimal sesi bersamaan per jump host")
+    parser.add_argument("--cmd-timeout", type=float, default=60,
+                        help="(async) batas waktu per command (detik)")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="(async) konkurensi per jump host diatur AIMD, maksimal --limit-per-host")
+    parser.add_argument("--batch", action="store_true",
+                        help="kirim semua show command dalam satu round trip per router")
+    parser.add_argument("--incremental", action="store_true",
+                        help="hanya ambil ulang router yang konfigurasinya berubah (lihat rawdata/manifest.json)")
+    parser.add_argument("--resume", action="store_true",
+                        help="lanjutkan run sebelumnya, hanya ambil (router, command) yang belum ada di checkpoint")
+    parser.add_argument("--retries", type=int, default=3,
+                        help="jumlah percobaan per router sebelum dianggap gagal")
+    parser.add_argument("--stream-json", metavar="PATH",
+                        help="parse output langsung saat datang & tulis topologi JSON ke PATH (tanpa 2_Pembuatan_JSON.py)")
+    parser.add_argument("--no-archive", action="store_true",
+                        help="(dengan --stream-json) jangan simpan file .txt rawdata")
+    # Target alternatif (mis. simulator lokal 05_Benchmark/ios_simulator.py)
+    parser.add_argument("--admin-host", default=router_admin["host"], help="IP/host router admin (jump host)")
+    parser.add_argument("--admin-port", type=int, default=22)
+    parser.add_argument("--device-type", default=router_admin["device_type"],
+                        help="device_type netmiko router admin (cisco_ios / cisco_ios_telnet)")
+    parser.add_argument("--router-list", default=path, help="path router_list.json")
+    parser.add_argument("--jump-hosts", default=jump_hosts_path,
+                        help="path jump_hosts.json (beberapa router admin, mapping router → jump host)")
+    parser.add_argument("--output-dir", default=base_dir, help="folder output rawdata")
+    args = parser.parse_args()
+
+    router_admin.update(host=args.admin_host, port=args.admin_port, device_type=args.device_type)
+    jump_hosts, mapping = load_jump_hosts(args.jump_hosts, router_admin)
+    if args.router_list != path:
+        with open(args.router_list) as f:
+            router_list = json.load(f)
+    if args.output_dir != base_dir:
+        base_dir = args.output_dir
+        for folder in set(commands.values()):
+            os.makedirs(os.path.join(base_dir, folder), exist_ok=True)
+
+    manifest = Manifest(base_dir) if args.incremental else None
+    checkpoint = Checkpoint(base_dir, resume=args.resume)
+    sink = StreamingParser(commands) if args.stream_json else None
+    archive = not (args.no_archive and args.stream_json)
+    telemetry = Telemetry()
+
+    if args.engine == "async":
+        hasil = collect(router_list, jump_hosts, commands, base_dir, mapping=mapping,
+                        limit_per_host=args.limit_per_host, cmd_timeout=args.cmd_timeout,
+                        batch=args.batch, manifest=manifest, adaptive=args.adaptive,
+                        checkpoint=checkpoint, retries=args.retries, sink=sink, archive=archive,
+                        telemetry=telemetry)
+        gagal = [r for r, err in hasil.items() if err is not None]
+        print(f"[i] {len(hasil) - len(gagal)}/{len(hasil)} router berhasil")
+    else:
+        shards = ShardedPools(jump_hosts, size=MAX_WORKERS, mapping=mapping, adaptive=True,
+                              telemetry=telemetry)
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS * len(jump_hosts)) as executor:
+                futures = [executor.submit(ambil_data, shards, rname, ip, args.batch, manifest, checkpoint, args.retries,
+                                           sink, archive)
+                           for rname, ip in router_list.items()]
+                concurrent.futures.wait(futures)
+        finally:
+            shards.close()
+        for baris in shards.laporan():
+            print(baris)
+        if manifest is not None:
+            manifest.simpan()
+
+    if sink is not None:
+        sink.lengkapi_dari_arsip(router_list, base_dir)
+        sink.tulis(args.stream_json, router_list)
+
+    # Telemetry: simpan JSON + ringkasan p50/p95/p99
+    telemetry_file = os.path.join(telemetry_dir, f"telemetry_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    telemetry.simpan(telemetry_file)
+    print("\n=== Latency koleksi (detik) ===")
+    for baris in telemetry.ringkasan():
+        print(baris)
+    print(f"[✓] Telemetry disimpan ke {telemetry_file}\n")
+
+    # Ringkasan (router, command) yang masih kurang
+    kurang = checkpoint.belum_lengkap(router_list, commands)
+    checkpoint.close()
+    if kurang:
+        for rname, cmds in kurang.items():
+            print(f"[!] Belum lengkap: {rname} ({', '.join(cmds)})")
+        print("[i] Jalankan ulang dengan --resume untuk mengambil sisanya saja")
@@ -1,273 +1,327 @@
 import os
 import re
+import sys
 import json
+import time
+import argparse
+import concurrent.futures
+
+try:
+    import resource     # tidak ada di Windows → peak RSS tidak dilaporkan
+except ImportError:
+    resource = None
+
+import parser_engine
+from parse_cache import ParseCache
+from snapshot_kolom import path_kolom, tulis_kolom
+from topologi_model import dari_dict
 
 # === Direktori input/output === #
 ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-base_dir = os.path.join(ROOT_DIR, "03_Output", "rawdata")
-
-config_dir = os.path.join(base_dir, "config")
-interfaces_dir = os.path.join(base_dir, "interfaces")
-ospf_dir = os.path.join(base_dir, "ospf")
-ospf_config_dir = os.path.join(base_dir, "ospf_config")
-cdp_dir = os.path.join(base_dir, "cdp")
-proto_dir = os.path.join(base_dir, "ip protocols")
+base_dir = os.path.join(ROOT_DIR, "03_Output", "rawdata")   # berisi folder config, interfaces, ospf, ospf_config, cdp, ip protocols
 
 # === Folder output (otomatis dibuat jika belum ada) === #
 data_rule_based_dir = os.path.join(ROOT_DIR, "03_Output", "Data_Rule_Based")
 os.makedirs(data_rule_based_dir, exist_ok=True)
 
-# === Ubah nama file output manual sesuai topologi === #
-output_file = os.path.join(data_rule_based_dir, "topologi_101.json")  #! <---------- ubah nama filenya sesuai topologi ke berapa
-
-
-# === Parser helper === #
-def parse_config_interface(config_output):
-    """Parse 'show run | section interface' → ambil IP & OSPF auth key"""
-    interfaces = {}
-    current_intf = None
-
-    for raw_line in config_output.splitlines():
-        line = raw_line.strip()
-
-        if line.startswith("interface"):
-            current_intf = line.split()[1]
-            interfaces[current_intf] = {}
-
-        elif current_intf:
-            if line.startswith("ip address"):
-                parts = line.split()
-                if len(parts) >= 4:
-                    interfaces[current_intf]["ip"] = parts[2]
-                    interfaces[current_intf]["subnet"] = parts[3]
-
-            if line.startswith("ip ospf authentication-key"):
-                key = line.split()[-1]
-                if "ospf" not in interfaces[current_intf]:
-                    interfaces[current_intf]["ospf"] = {"auth_key": {}}
-                interfaces[current_intf]["ospf"]["auth_key"] = {"simple": key}
-
-            elif line.startswith("ip ospf message-digest-key"):
-                parts = line.split()
-                if len(parts) >= 5:
-                    key_id = parts[3]
-                    key_val = parts[-1]
-                    if "ospf" not in interfaces[current_intf]:
-                        interfaces[current_intf]["ospf"] = {"auth_key": {}}
-                    interfaces[current_intf]["ospf"]["auth_key"][key_id] = key_val
-
-            elif line.startswith("ip ospf authentication") and "authentication-key" not in line:
-                if "ospf" not in interfaces[current_intf]:
-                    interfaces[current_intf]["ospf"] = {}
-                if "auth_key" not in interfaces[current_intf]["ospf"]:
-                    interfaces[current_intf]["ospf"]["auth_key"] = {}
+# === Nomor topologi default (bisa diganti lewat --topologi N) === #
+TOPOLOGI_DEFAULT = 101
+output_file = os.path.join(data_rule_based_dir, f"topologi_{TOPOLOGI_DEFAULT}.json")
+
+# === Cache hasil parse (key = hash isi file rawdata + versi parser) === #
+cache_file = os.path.join(ROOT_DIR, "03_Output", "parse_cache.sqlite")
+
+
+# === Tabel parser: folder rawdata → (suffix file, fungsi parser) === #
+# Dipakai versi parser_engine (grammar regex terkompilasi, satu pass per output).
+# Parser lama per baris ada di 05_Benchmark/parser_referensi.py → bench_parser.py cek hasilnya identik.
+PARSERS = {
+    "config": ("show_run__section_interface", parser_engine.parse_config_interface),
+    "interfaces": ("show_interfaces", parser_engine.parse_show_interfaces),
+    "ospf": ("show_ip_ospf_interface", parser_engine.parse_show_ip_ospf_interface),
+    "ospf_config": ("show_run__section_router_ospf", parser_engine.parse_show_run_ospf_config),
+    "cdp": ("show_cdp_neighbor", parser_engine.parse_show_cdp_neighbor),
+    "ip protocols": ("show_ip_protocols", parser_engine.parse_show_ip_protocols),
+}
+
+
+def path_router(raw_dir, router):
+    """{folder: path file rawdata} satu router"""
+    return {folder: os.path.join(raw_dir, folder, f"{router}_{suffix}.txt") for folder, (suffix, _) in PARSERS.items()}
+
 
+def baca_router(raw_dir, router):
+    """Baca 6 file rawdata satu router → {folder: teks} (FileNotFoundError kalau tidak lengkap)"""
+    outputs = {}
+    for folder, path in path_router(raw_dir, router).items():
+        with open(path) as f:
+            outputs[folder] = f.read()
+    return outputs
+
+
+def parse_output(folder, text):
+    """Jalankan parser yang sesuai untuk output satu command (str atau bytes-like)"""
+    return PARSERS[folder][1](text)
+
+
+def parse_path(folder, path):
+    """Parse file rawdata langsung dari mmap/bytes (tanpa f.read() → str → splitlines)"""
+    return parser_engine.parse_file(PARSERS[folder][1], path)
+
+
+def gabung_router(parsed):
+    """Gabungkan hasil 6 parser ({folder: hasil parse}) → entry router di topologi JSON"""
+    interfaces = parsed["config"]
+    mtu_data = parsed["interfaces"]
+    ospf_data = parsed["ospf"]
+    router_id_conf, redistribute_conf, passive = parsed["ospf_config"]
+    cdp_data = parsed["cdp"]
+    protocols, redistribute_proto, router_id_proto = parsed["ip protocols"]
+
+    # === Gabungkan data per interface === #
     for intf, data in interfaces.items():
-        if "ospf" in data and "auth_key" not in data["ospf"]:
-            data["ospf"]["auth_key"] = {}
-
-    return interfaces
-
-
-def parse_show_interfaces(interfaces_output):
-    """Parse 'show interfaces' → ambil MTU"""
-    mtu_data = {}
-    current_intf = None
-
-    for line in interfaces_output.splitlines():
-        if re.match(r"^(FastEthernet|GigabitEthernet|Loopback)", line):
-            current_intf = line.split()[0]
-        elif "MTU" in line and current_intf:
-            match = re.search(r"MTU (\d+) bytes", line)
-            if match:
-                mtu_data[current_intf] = int(match.group(1))
-    return mtu_data
-
-
-def parse_show_ip_ospf_interface(ospf_output):
-    """Parse 'show ip ospf interface' → area, hello/dead, net type, ospf auth"""
-    ospf_data = {}
-    current_intf = None
-
-    for line in ospf_output.splitlines():
-        if re.match(r"^(FastEthernet|GigabitEthernet|Loopback)", line):
-            parts = line.split()
-            current_intf = parts[0]
-            ospf_data[current_intf] = {}
-            ospf_data[current_intf]["ospf auth"] = "none"
-
-        if current_intf:
-            if "Internet Address" in line and "Area" in line:
-                area = re.search(r"Area (\d+)", line).group(1)
-                ospf_data[current_intf]["area"] = int(area)
-
-            if "Timer intervals" in line:
-                hello = re.search(r"Hello (\d+)", line).group(1)
-                dead = re.search(r"Dead (\d+)", line).group(1)
-                ospf_data[current_intf]["Hello"] = int(hello)
-                ospf_data[current_intf]["Dead"] = int(dead)
-
-            if "Network Type" in line:
-                net_type = re.search(r"Network Type (\S+)", line).group(1)
-                ospf_data[current_intf]["Network Type"] = net_type.rstrip(",").capitalize()
-
-            if "Simple password authentication enabled" in line:
-                ospf_data[current_intf]["ospf auth"] = "simple"
-            elif "Message digest authentication enabled" in line:
-                ospf_data[current_intf]["ospf auth"] = "message-digest"
-
-    return ospf_data
-
-
-def parse_show_run_ospf_config(ospf_config_output):
-    """Parse 'show run | section router ospf' → router-id, redistribute, passive"""
-    router_id = None
-    redistribute = False
-    passive = []
-
-    for line in ospf_config_output.splitlines():
-        line = line.strip()
-        if "router-id" in line:
-            router_id = line.split()[1]
-        if line.startswith("redistribute eigrp"):
-            if "subnets" in line:
-                redistribute = True
-            else:
-                redistribute = False
-        if "passive-interface" in line:
-            intf = line.split()[1]
-            passive.append(intf)
-
-    return router_id, redistribute, passive
-
-
-def parse_show_cdp_neighbor(cdp_output):
-    """Parse 'show cdp neighbor' → neighbor mapping"""
-    neighbors = {}
-    for line in cdp_output.splitlines():
-        if re.match(r"^\S+\.cisco", line):
-            parts = line.split()
-            device_id = parts[0].split(".")[0]  # contoh: R9.cisco -> R9
-            local_intf = parts[1] + parts[2]    # contoh: Fas 2/0
-            port_id = parts[-2] + " " + parts[-1]  # contoh: Fas 0/1
-
-            # Normalisasi nama
-            if local_intf.startswith("Fas"):
-                local_intf = local_intf.replace("Fas", "FastEthernet")
-            if port_id.startswith("Fas"):
-                port_id = port_id.replace("Fas", "FastEthernet")
-
-            neighbors[local_intf] = {
-                "router": device_id,
-                "interface": port_id
-            }
-    return neighbors
-
-
-def parse_show_ip_protocols(proto_output):
-    """Parse 'show ip protocols' → routing protocols, redistribute, router-id"""
-    protocols = []
-    redistribute = False
-    router_id = None
-
-    for line in proto_output.splitlines():
-        line = line.strip()
-
-        if line.startswith("Routing Protocol is"):
-            if "ospf" in line and "ospf" not in protocols:
-                protocols.append("ospf")
-            if "eigrp" in line and "eigrp" not in protocols:
-                protocols.append("eigrp")
-
-        if line.startswith("Redistributing"):
-            if "subnets" in line:
-                redistribute = True
-            else:
-                redistribute = False
-
-        if "Router ID" in line:
-            parts = line.split()
-            router_id = parts[-1]
-
-    return protocols, redistribute, router_id
+        if intf in mtu_data:
+            data["MTU"] = mtu_data[intf]
+        if intf in ospf_data:
+            if "ospf" not in data:
+                data["ospf"] = {}
+            data["ospf"].update(ospf_data[intf])
+        if intf in passive:
+            if "ospf" not in data:
+                data["ospf"] = {}
+            data["ospf"]["passive"] = True
+        elif "ospf" in data:
+            data["ospf"]["passive"] = False
+        if intf in cdp_data:
+            data["neighbor"] = cdp_data[intf]
+
+    # hanya interface yg punya IP
+    interfaces_clean = {k: v for k, v in interfaces.items() if "ip" in v}
+
+    # pilih router-id
+    router_id = router_id_conf or router_id_proto
+
+    # pilih redistribute (kalau salah satu True → True)
+    redistribute = redistribute_conf or redistribute_proto
+
+    return {
+        "router_id": router_id,
+        "interfaces": interfaces_clean,
+        "routing": {
+            "protocol": protocols,
+            "redistribute": redistribute
+        }
+    }
+
+
+# === Inventory router === #
+def _urutan_router(name):
+    """R2 sebelum R10 (natural sort)"""
+    return [int(t) if t.isdigit() else t for t in re.split(r"(\d+)", name)]
+
+
+def daftar_router(raw_dir, router_list_path=None):
+    """
+    Daftar router yang akan di-parse:
+    - router_list.json (kalau diberikan) → urutan sesuai file
+    - selain itu → router yang punya file di rawdata/config/ (natural sort)
+    """
+    if router_list_path:
+        with open(router_list_path) as f:
+            return list(json.load(f))
+
+    suffix = f"_{PARSERS['config'][0]}.txt"
+    config_dir = os.path.join(raw_dir, "config")
+    routers = [name[:-len(suffix)] for name in os.listdir(config_dir) if name.endswith(suffix)]
+    return sorted(routers, key=_urutan_router)
 
 
 # === Main Processing === #
+def parse_router(raw_dir, router, cache=None):
+    """Baca + parse + gabung satu router (None kalau file tidak lengkap)"""
+    try:
+        if cache is None:
+            paths = path_router(raw_dir, router)
+            parsed = {folder: parse_path(folder, path) for folder, path in paths.items()}
+        else:
+            # output yang isinya tidak berubah diambil dari cache
+            paths = path_router(raw_dir, router)
+            parsed = {folder: cache.parse_file(folder, path, parse_output) for folder, path in paths.items()}
+    except FileNotFoundError:
+        print(f"[!] File untuk {router} tidak lengkap, skip...")
+        return None
+
+    return gabung_router(parsed)
+
+
+# Cache per worker process: tiap process buka koneksi sqlite sendiri (read),
+# entri baru dikirim balik ke proses utama yang menulis ke sqlite
+_worker_cache = None
+
+
+def _init_worker(cache_path):
+    global _worker_cache
+    _worker_cache = ParseCache(cache_path) if cache_path else None
+
+
+def _parse_router_task(args):
+    entry = parse_router(*args, cache=_worker_cache)
+    return entry, _worker_cache.ambil_baru() if _worker_cache else None
+
+
+MIN_ROUTER_PARALEL = 64     # di bawah ini overhead process pool > waktu parsing
+
+
+def build_snapshot(raw_dir, routers=None, workers=1, cache=None):
+    """
+    Parse satu snapshot rawdata → dict topologi {router: {...}}
+    workers > 1 → router di-parse paralel di process pool (urutan hasil tetap sama)
+    cache (ParseCache) → entri baru terkumpul di cache.baru, pemanggil yang simpan()
+    """
+    if routers is None:
+        routers = daftar_router(raw_dir)
+
+    if workers == 1 or len(routers) < MIN_ROUTER_PARALEL:
+        entries = [parse_router(raw_dir, router, cache) for router in routers]
+    else:
+        workers = workers or os.cpu_count()
+        chunksize = max(1, len(routers) // (workers * 4))
+        tasks = [(raw_dir, router) for router in routers]
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                                    initargs=(cache.path if cache else None,)) as executor:
+            entries = []
+            for entry, baru in executor.map(_parse_router_task, tasks, chunksize=chunksize):
+                entries.append(entry)
+                if cache:
+                    cache.tambah(baru)
+
+    return {router: entry for router, entry in zip(routers, entries) if entry is not None}
+
+
+def tulis_snapshot(results, path, kolom=False):
+    with open(path, "w") as f:
+        f.write(json.dumps(results, indent=4))   # satu write, bukan ribuan potongan seperti json.dump
+    # ditulis setelah JSON → mtime .kolom tidak lebih tua, jadi dipakai oleh load_snapshot
+    if kolom:
+        tulis_kolom(dari_dict(results), path_kolom(path))
+
+
+def peak_rss_mb(who="self"):
+    """Peak RSS (MB) proses ini ("self") / child process yang sudah selesai ("children"); None di Windows"""
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF if who == "self" else resource.RUSAGE_CHILDREN)
+    # ru_maxrss: KB di Linux, byte di macOS
+    return usage.ru_maxrss / (1 << 20 if sys.platform == "darwin" else 1 << 10)
+
+
+def _fmt_mb(mb):
+    return "-" if mb is None else f"{mb:.1f}"
+
+
+def ringkasan(results):
+    """(jumlah router, jumlah interface)"""
+    return len(results), sum(len(r["interfaces"]) for r in results.values())
+
+
+# === Batch: banyak snapshot sekaligus === #
+def cari_snapshot(batch_dir):
+    """
+    Subfolder batch_dir yang berisi layout rawdata (config/, interfaces/, ...).
+    Nomor topologi diambil dari angka terakhir di nama folder, contoh:
+    rawdata_snapshots/topologi_7/ → topologi_7.json
+    """
+    snapshots = []
+    for name in os.listdir(batch_dir):
+        path = os.path.join(batch_dir, name)
+        nums = re.findall(r"\d+", name)
+        if os.path.isdir(path) and nums and os.path.isdir(os.path.join(path, "config")):
+            snapshots.append((int(nums[-1]), path))
+    return sorted(snapshots)
+
+
+def _proses_snapshot(args):
+    """Worker process: build + tulis satu snapshot"""
+    topo_num, raw_dir, out_dir, kolom = args
+    t0 = time.perf_counter()
+    # paralel sudah per snapshot → router di dalamnya serial (tidak ada pool di dalam pool)
+    results = build_snapshot(raw_dir, workers=1, cache=_worker_cache)
+    out_path = os.path.join(out_dir, f"topologi_{topo_num}.json")
+    tulis_snapshot(results, out_path, kolom)
+    n_router, n_intf = ringkasan(results)
+    baru = _worker_cache.ambil_baru() if _worker_cache else None
+    # peak RSS worker s.d. snapshot ini (high-water mark, naik hanya kalau snapshot ini lebih berat)
+    return topo_num, out_path, n_router, n_intf, time.perf_counter() - t0, peak_rss_mb(), baru
+
+
+def build_batch(batch_dir, out_dir, workers=None, cache=None, kolom=False):
+    snapshots = cari_snapshot(batch_dir)
+    if not snapshots:
+        print(f"[!] Tidak ada snapshot rawdata di {batch_dir}")
+        return []
+
+    t0 = time.perf_counter()
+    tasks = [(num, path, out_dir, kolom) for num, path in snapshots]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                                initargs=(cache.path if cache else None,)) as executor:
+        hasil = list(executor.map(_proses_snapshot, tasks))
+    durasi = time.perf_counter() - t0
+
+    print(f"{'topologi':<12}{'router':>8}{'interface':>11}{'waktu (s)':>11}{'peak RSS (MB)':>15}")
+    for topo_num, _, n_router, n_intf, dt, rss, baru in hasil:
+        print(f"{'topologi_' + str(topo_num):<12}{n_router:>8}{n_intf:>11}{dt:>11.3f}{_fmt_mb(rss):>15}")
+        if cache:
+            cache.tambah(baru)
+    print(f"[✓] {len(hasil)} snapshot → {out_dir} dalam {durasi:.2f}s ({len(hasil) / durasi:.1f} snapshot/s)")
+    return hasil
+
+
 def main():
-    results = {}
-
-    for i in range(1, 13):
-        router = f"R{i}"
-        try:
-            with open(os.path.join(config_dir, f"{router}_show_run__section_interface.txt")) as f:
-                config_output = f.read()
-
-            with open(os.path.join(interfaces_dir, f"{router}_show_interfaces.txt")) as f:
-                interfaces_output = f.read()
-
-            with open(os.path.join(ospf_dir, f"{router}_show_ip_ospf_interface.txt")) as f:
-                ospf_output = f.read()
-
-            with open(os.path.join(ospf_config_dir, f"{router}_show_run__section_router_ospf.txt")) as f:
-                ospf_config_output = f.read()
-
-            with open(os.path.join(cdp_dir, f"{router}_show_cdp_neighbor.txt")) as f:
-                cdp_output = f.read()
-
-            with open(os.path.join(proto_dir, f"{router}_show_ip_protocols.txt")) as f:
-                proto_output = f.read()
-
-            # === Parsing === #
-            interfaces = parse_config_interface(config_output)
-            mtu_data = parse_show_interfaces(interfaces_output)
-            ospf_data = parse_show_ip_ospf_interface(ospf_output)
-            router_id_conf, redistribute_conf, passive = parse_show_run_ospf_config(ospf_config_output)
-            cdp_data = parse_show_cdp_neighbor(cdp_output)
-            protocols, redistribute_proto, router_id_proto = parse_show_ip_protocols(proto_output)
-
-            # === Gabungkan data per interface === #
-            for intf, data in interfaces.items():
-                if intf in mtu_data:
-                    data["MTU"] = mtu_data[intf]
-                if intf in ospf_data:
-                    if "ospf" not in data:
-                        data["ospf"] = {}
-                    data["ospf"].update(ospf_data[intf])
-                if intf in passive:
-                    if "ospf" not in data:
-                        data["ospf"] = {}
-                    data["ospf"]["passive"] = True
-                elif "ospf" in data:
-                    data["ospf"]["passive"] = False
-                if intf in cdp_data:
-                    data["neighbor"] = cdp_data[intf]
-
-            # hanya interface yg punya IP
-            interfaces_clean = {k: v for k, v in interfaces.items() if "ip" in v}
-
-            # pilih router-id
-            router_id = router_id_conf or router_id_proto
-
-            # pilih redistribute (kalau salah satu True → True)
-            redistribute = redistribute_conf or redistribute_proto
-
-            results[router] = {
-                "router_id": router_id,
-                "interfaces": interfaces_clean,
-                "routing": {
-                    "protocol": protocols,
-                    "redistribute": redistribute
-                }
-            }
-
-        except FileNotFoundError:
-            print(f"[!] File untuk {router} tidak lengkap, skip...")
-            continue
-
-    with open(output_file, "w") as f:
-        json.dump(results, f, indent=4)
-
-    print(f"[✓] Data berhasil digabung ke {output_file}")
+    parser = argparse.ArgumentParser(description="Gabungkan rawdata show command menjadi topologi_N.json")
+    parser.add_argument("--topologi", type=int, default=TOPOLOGI_DEFAULT,
+                        help="nomor topologi untuk nama file output (topologi_N.json)")
+    parser.add_argument("--rawdata", default=base_dir, help="folder rawdata satu snapshot")
+    parser.add_argument("--batch", metavar="DIR",
+                        help="folder berisi banyak snapshot rawdata (subfolder topologi_N/) → semua dibangun paralel")
+    parser.add_argument("--router-list", default=None,
+                        help="router_list.json untuk daftar router (default: semua router yang ada di rawdata)")
+    parser.add_argument("--output-dir", default=data_rule_based_dir, help="folder output topologi_N.json")
+    parser.add_argument("--cache", default=cache_file, help="file sqlite cache hasil parse")
+    parser.add_argument("--no-cache", action="store_true", help="parse ulang semua output tanpa cache")
+    parser.add_argument("--workers", type=int, default=None, help="jumlah proses untuk snapshot (--batch) atau router (default: jumlah core)")
+    parser.add_argument("--kolom", action="store_true",
+                        help="tulis juga topologi_N.kolom (snapshot kolumnar, bisa di-mmap) di sebelah JSON")
+    args = parser.parse_args()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    cache = None if args.no_cache else ParseCache(args.cache)
+
+    if args.batch:
+        hasil = build_batch(args.batch, args.output_dir, args.workers, cache, args.kolom)
+        total_output = sum(h[2] for h in hasil) * len(PARSERS)
+        pakai_pool = True
+    else:
+        out_path = os.path.join(args.output_dir, f"topologi_{args.topologi}.json")
+        routers = daftar_router(args.rawdata, args.router_list)
+        t0 = time.perf_counter()
+        results = build_snapshot(args.rawdata, routers, workers=args.workers, cache=cache)
+        tulis_snapshot(results, out_path, args.kolom)
+
+        n_router, n_intf = ringkasan(results)
+        total_output = n_router * len(PARSERS)
+        pakai_pool = args.workers != 1 and len(routers) >= MIN_ROUTER_PARALEL
+        print(f"[✓] Data berhasil digabung ke {out_path} ({n_router} router, {n_intf} interface, "
+              f"{time.perf_counter() - t0:.2f}s)")
+
+    if cache:
+        n_baru = cache.simpan()
+        print(f"[i] Parse cache: {total_output - n_baru} output dari cache, {n_baru} di-parse ulang ({cache.path})")
+        cache.close()
+
+    rss = peak_rss_mb()
+    if rss is not None:
+        worker = f", {peak_rss_mb('children'):.1f} MB worker terbesar" if pakai_pool else ""
+        print(f"[i] Peak RSS: {rss:.1f} MB proses utama{worker}")
 
 
 if __name__ == "__main__":
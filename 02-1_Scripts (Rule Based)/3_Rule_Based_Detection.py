@@ -1,4 +1,9 @@
-import json, os, re
+import argparse, concurrent.futures, contextlib, io, json, os, re, time
+
+from nama_interface import kanonik, singkat
+from parser_engine import buka_output
+from snapshot_kolom import buka_snapshot
+from topologi_model import indeks_interface
 
 # === Fungsi Dasar === #
 def load_json(filename):
@@ -9,17 +14,18 @@ def write_output(filename, results):
     with open(filename, "w", encoding="utf-8") as f:
         f.write("\n".join(results))
 
+def write_outputs(outputs):
+    """Tulis sekaligus banyak hasil deteksi: [(filename, results), ...]"""
+    for filename, results in outputs:
+        write_output(filename, results)
+
 def short_ifname(iname: str) -> str:
-    """Singkatkan nama interface (FastEthernet0/1 -> Fa0/1)"""
-    return (
-        iname.replace("FastEthernet", "Fa")
-        .replace("GigabitEthernet", "Gi")
-        .replace("Loopback", "Lo")
-    )
+    """Singkatkan nama interface (FastEthernet0/1 -> Fa0/1), lewat tabel nama_interface (di-cache)"""
+    return singkat(iname)
 
 def normalize_ifname(name: str) -> str:
-    """Hilangkan spasi seperti 'FastEthernet 0/1' -> 'FastEthernet0/1'"""
-    return name.replace(" ", "")
+    """Nama kanonik: 'FastEthernet 0/1' / 'Fa0/1' -> 'FastEthernet0/1'"""
+    return kanonik(name)
 
 def has_overlap(dict1, dict2):
     """Cek apakah ada pasangan key-id dan key yang sama"""
@@ -28,158 +34,201 @@ def has_overlap(dict1, dict2):
             return True
     return False
 
-# === RULE 1: Cek Neighbor Attributes === #
-def check_neighbors(routers):
-    results = []
+# === Atribut yang dibandingkan antar neighbor: (label di output, atribut OspfAttrs / None = MTU interface) === #
+NEIGHBOR_ATTRS = [
+    ("Hello", "hello"),
+    ("Dead", "dead"),
+    ("area", "area"),
+    ("Network Type", "network_type"),
+    ("MTU", None),
+    ("passive", "passive"),
+    ("ospf auth", "auth"),
+]
+
+# === Index link sekali per snapshot === #
+def bangun_link(routers, hanya=None):
+    """
+    Daftar link OSPF unik [(rname, iname, idata, nrouter, match_intf, ndata)], urutan = urutan
+    router/interface di snapshot. Interface neighbor dicari lewat index (router, id interface)
+    yang dibangun sekali → O(jumlah interface), bukan scan semua interface neighbor per link.
+    hanya = set router → hanya link yang salah satu ujungnya di set itu (deteksi inkremental).
+    """
+    indeks = indeks_interface(routers)
+    links = []
     checked_pairs = set()
 
     for rname, rdata in routers.items():
-        for iname, idata in rdata["interfaces"].items():
+        for iname, idata in rdata.interfaces.items():
             # --- Hanya cek interface yang punya OSPF ---
-            if "ospf" not in idata:
+            if idata.ospf is None:
                 continue
             if iname.startswith("Loopback") or iname == "FastEthernet0/0":
                 continue
-            if "neighbor" not in idata:
+            if idata.neighbor is None:
                 continue
 
-            nrouter = idata["neighbor"]["router"]
-            nintf_raw = idata["neighbor"]["interface"]
-            nintf = normalize_ifname(nintf_raw)
-
+            nrouter = idata.neighbor.router
             if nrouter not in routers:
                 continue
-
-            # --- Cari interface neighbor yang cocok ---
-            match_intf = None
-            for intf in routers[nrouter]["interfaces"].keys():
-                if normalize_ifname(intf) == nintf:
-                    match_intf = intf
-                    break
-
-            if not match_intf:
+            if hanya is not None and rname not in hanya and nrouter not in hanya:
                 continue
 
-            ndata = routers[nrouter]["interfaces"][match_intf]
+            # --- Cari interface neighbor yang cocok (satu lookup integer di index) ---
+            match_intf = indeks[nrouter].get(idata.neighbor.interface_id)
+            if match_intf is None:
+                continue
+            ndata = routers[nrouter].interfaces[match_intf]
 
             # --- Skip kalau neighbor tidak punya OSPF ---
-            if "ospf" not in ndata:
+            if ndata.ospf is None:
                 print(f"[⚠️] Warning: {nrouter} interface {match_intf} tidak punya key 'ospf' (skip)")
                 continue
 
             # --- Hindari perbandingan ganda (A-B dan B-A) ---
-            pair_key = tuple(sorted([(rname, iname), (nrouter, match_intf)]))
+            a, b = (rname, iname), (nrouter, match_intf)
+            pair_key = (a, b) if a <= b else (b, a)
             if pair_key in checked_pairs:
                 continue
             checked_pairs.add(pair_key)
 
-            # === Perbandingan atribut utama === #
-            for key in ["Hello", "Dead", "area", "Network Type", "MTU", "passive", "ospf auth"]:
-                val1 = idata.get("ospf", {}).get(key) if key != "MTU" else idata.get("MTU")
-                val2 = ndata.get("ospf", {}).get(key) if key != "MTU" else ndata.get("MTU")
-
-                # --- PASSIVE khusus (tampilkan format berbeda) ---
-                if key == "passive":
-                    if val1 != val2 or (val1 is True and val2 is True):
-                        results.append(f"=== Mismatch antara {rname} dan {nrouter} ===")
-                        results.append("=========================================================")
-                        results.append("- passive Mismatch :")
-                        results.append(f"\t* {rname} {short_ifname(iname)} : {val1}")
-                        results.append(f"\t* {nrouter} {short_ifname(match_intf)} : {val2}")
-                        results.append("=========================================================")
-                        # --- kondisi keduanya True
-                        if val1 is True and val2 is True:
-                            results.append("+ Solusi :")
-                            results.append(f"\t* Matikan passive interface pada interface {short_ifname(iname)} di {rname} dan interface {short_ifname(match_intf)} di {nrouter}")
-                        # --- kondisi beda
-                        elif val1 is True and val2 is False:
-                            results.append(f"+ Solusi :\n\t* Matikan passive interface pada interface {short_ifname(iname)} di {rname}")
-                        elif val2 is True and val1 is False:
-                            results.append(f"+ Solusi :\n\t* Matikan passive interface pada interface {short_ifname(match_intf)} di {nrouter}")
-                        results.append("=========================================================\n")
-                        continue  # skip lanjut ke format default
-
-                # --- Default mismatch ---
-                if val1 != val2:
-                    results.append(f"=== Mismatch antara {rname} dan {nrouter} ===")
-                    results.append("=========================================================")
-                    results.append(f"- {key} Mismatch :")
-                    results.append(f"\t* {rname} {short_ifname(iname)} : {val1}")
-                    results.append(f"\t* {nrouter} {short_ifname(match_intf)} : {val2}")
-                    results.append("=========================================================")
-                    results.append(f"+ Solusi :\n\t* Samakan nilai {key} pada {rname} dan {nrouter}")
-                    results.append("=========================================================\n")
-
-            # === AUTH KEY MISMATCH === #
-            key1 = idata.get("ospf", {}).get("auth_key", {})
-            key2 = ndata.get("ospf", {}).get("auth_key", {})
-
-            if key1 or key2:
-                # --- Simple vs MD5 mismatch ---
-                if ("simple" in key1 and "simple" not in key2) or ("simple" in key2 and "simple" not in key1):
-                    results.append(f"=== Mismatch antara {rname} dan {nrouter} ===")
-                    results.append("=========================================================")
-                    results.append("- auth_key Mismatch :")
-                    results.append(f"\t* {rname} {short_ifname(iname)} :")
-                    for k, v in key1.items():
-                        results.append(f"\t\t* {k} : {v}")
-                    results.append(f"\t* {nrouter} {short_ifname(match_intf)} :")
-                    for k, v in key2.items():
-                        results.append(f"\t\t* {k} : {v}")
-                    results.append("=========================================================")
-                    results.append("+ Solusi :")
-                    results.append(f"\t* {rname} dan {nrouter} memiliki jenis Authentication yang berbeda")
-                    results.append(f"\t* Samakan jenis Authentication dan Authentication Key")
-                    results.append("=========================================================\n")
-
-                # --- Simple key mismatch ---
-                elif "simple" in key1 or "simple" in key2:
-                    if key1.get("simple") != key2.get("simple"):
-                        results.append(f"=== Mismatch antara {rname} dan {nrouter} ===")
-                        results.append("=========================================================")
-                        results.append("- auth_key Mismatch :")
-                        results.append(f"\t* {rname} {short_ifname(iname)} : {key1.get('simple')}")
-                        results.append(f"\t* {nrouter} {short_ifname(match_intf)} : {key2.get('simple')}")
-                        results.append("=========================================================")
-                        results.append("+ Solusi :")
-                        results.append(f"\t* {rname} dan {nrouter} memiliki Authentication Key yang berbeda")
-                        results.append(f"\t* Samakan Authentication Key")
-                        results.append("=========================================================\n")
-
-                # --- MD5 / multi-key mismatch ---
-                elif key1 != key2:
-                    results.append(f"=== Mismatch antara {rname} dan {nrouter} ===")
-                    results.append("=========================================================")
-                    results.append("- auth_key Mismatch :")
-                    results.append(f"\t* {rname} {short_ifname(iname)} :")
-                    for k, v in key1.items():
-                        results.append(f"\t\t* {k} : {v}")
-                    results.append(f"\t* {nrouter} {short_ifname(match_intf)} :")
-                    for k, v in key2.items():
-                        results.append(f"\t\t* {k} : {v}")
-                    results.append("=========================================================")
-                    results.append("+ Solusi :")
-                    results.append(f"\t* {rname} dan {nrouter} memiliki Authentication Key yang berbeda")
-                    results.append(f"\t* Samakan Authentication Key antara kedua router")
-                    results.append("=========================================================\n")
+            links.append((rname, iname, idata, nrouter, match_intf, ndata))
+    return links
 
-    return results
+
+# === RULE 1: Cek Neighbor Attributes === #
+def mismatch_atribut(key, val1, val2):
+    """Nilai beda → mismatch; passive juga dilaporkan kalau keduanya True"""
+    return val1 != val2 or (key == "passive" and val1 is True and val2 is True)
+
+
+def laporan_atribut(results, link, key, val1, val2):
+    """Tulis temuan satu atribut pada satu link (mismatch_atribut sudah dicek pemanggil)"""
+    rname, iname, _, nrouter, match_intf, _ = link
+
+    # --- PASSIVE khusus (tampilkan format berbeda) ---
+    if key == "passive":
+        results.append(f"=== Mismatch antara {rname} dan {nrouter} ===")
+        results.append("=========================================================")
+        results.append("- passive Mismatch :")
+        results.append(f"\t* {rname} {short_ifname(iname)} : {val1}")
+        results.append(f"\t* {nrouter} {short_ifname(match_intf)} : {val2}")
+        results.append("=========================================================")
+        # --- kondisi keduanya True
+        if val1 is True and val2 is True:
+            results.append("+ Solusi :")
+            results.append(f"\t* Matikan passive interface pada interface {short_ifname(iname)} di {rname} dan interface {short_ifname(match_intf)} di {nrouter}")
+        # --- kondisi beda
+        elif val1 is True and val2 is False:
+            results.append(f"+ Solusi :\n\t* Matikan passive interface pada interface {short_ifname(iname)} di {rname}")
+        elif val2 is True and val1 is False:
+            results.append(f"+ Solusi :\n\t* Matikan passive interface pada interface {short_ifname(match_intf)} di {nrouter}")
+        results.append("=========================================================\n")
+        return
+
+    # --- Default mismatch ---
+    results.append(f"=== Mismatch antara {rname} dan {nrouter} ===")
+    results.append("=========================================================")
+    results.append(f"- {key} Mismatch :")
+    results.append(f"\t* {rname} {short_ifname(iname)} : {val1}")
+    results.append(f"\t* {nrouter} {short_ifname(match_intf)} : {val2}")
+    results.append("=========================================================")
+    results.append(f"+ Solusi :\n\t* Samakan nilai {key} pada {rname} dan {nrouter}")
+    results.append("=========================================================\n")
+
+
+def cek_auth_key(results, link):
+    """AUTH KEY MISMATCH pada satu link"""
+    rname, iname, idata, nrouter, match_intf, ndata = link
+    key1 = idata.ospf.auth_key or {}
+    key2 = ndata.ospf.auth_key or {}
+
+    if not (key1 or key2):
+        return
+
+    # --- Simple vs MD5 mismatch ---
+    if ("simple" in key1 and "simple" not in key2) or ("simple" in key2 and "simple" not in key1):
+        results.append(f"=== Mismatch antara {rname} dan {nrouter} ===")
+        results.append("=========================================================")
+        results.append("- auth_key Mismatch :")
+        results.append(f"\t* {rname} {short_ifname(iname)} :")
+        for k, v in key1.items():
+            results.append(f"\t\t* {k} : {v}")
+        results.append(f"\t* {nrouter} {short_ifname(match_intf)} :")
+        for k, v in key2.items():
+            results.append(f"\t\t* {k} : {v}")
+        results.append("=========================================================")
+        results.append("+ Solusi :")
+        results.append(f"\t* {rname} dan {nrouter} memiliki jenis Authentication yang berbeda")
+        results.append(f"\t* Samakan jenis Authentication dan Authentication Key")
+        results.append("=========================================================\n")
+
+    # --- Simple key mismatch ---
+    elif "simple" in key1 or "simple" in key2:
+        if key1.get("simple") != key2.get("simple"):
+            results.append(f"=== Mismatch antara {rname} dan {nrouter} ===")
+            results.append("=========================================================")
+            results.append("- auth_key Mismatch :")
+            results.append(f"\t* {rname} {short_ifname(iname)} : {key1.get('simple')}")
+            results.append(f"\t* {nrouter} {short_ifname(match_intf)} : {key2.get('simple')}")
+            results.append("=========================================================")
+            results.append("+ Solusi :")
+            results.append(f"\t* {rname} dan {nrouter} memiliki Authentication Key yang berbeda")
+            results.append(f"\t* Samakan Authentication Key")
+            results.append("=========================================================\n")
+
+    # --- MD5 / multi-key mismatch ---
+    elif key1 != key2:
+        results.append(f"=== Mismatch antara {rname} dan {nrouter} ===")
+        results.append("=========================================================")
+        results.append("- auth_key Mismatch :")
+        results.append(f"\t* {rname} {short_ifname(iname)} :")
+        for k, v in key1.items():
+            results.append(f"\t\t* {k} : {v}")
+        results.append(f"\t* {nrouter} {short_ifname(match_intf)} :")
+        for k, v in key2.items():
+            results.append(f"\t\t* {k} : {v}")
+        results.append("=========================================================")
+        results.append("+ Solusi :")
+        results.append(f"\t* {rname} dan {nrouter} memiliki Authentication Key yang berbeda")
+        results.append(f"\t* Samakan Authentication Key antara kedua router")
+        results.append("=========================================================\n")
+
+
+def rule_atribut(key, attr):
+    """Rule link untuk satu atribut NEIGHBOR_ATTRS"""
+    def cek(results, link):
+        idata, ndata = link[2], link[5]
+        val1 = getattr(idata.ospf, attr) if attr else idata.mtu
+        val2 = getattr(ndata.ospf, attr) if attr else ndata.mtu
+        if mismatch_atribut(key, val1, val2):
+            laporan_atribut(results, link, key, val1, val2)
+    return cek
+
+
+def check_neighbors(routers, links=None):
+    """routers = {nama: Router} (topologi_model); links = hasil bangun_link (dibangun kalau None)"""
+    return Evaluator(scope_rules("link")).jalankan(routers, links)
 
 
 # === RULE 2: Cek Redistribute === #
+def cek_redistribute(results, router):
+    rname, rdata = router
+    prots = rdata.protocols
+    need_redist = len(prots) > 1
+    if need_redist and not rdata.redistribute:
+        results.append(f"=== Mismatch pada {rname} ===")
+        results.append("=========================================================")
+        results.append("- Redistribute Mismatch :")
+        results.append(f"\t* {rname} belum melakukan redistribute atau command kurang \"subnets\"")
+        results.append("=========================================================")
+        results.append("+ Solusi :\n\t* Tambahkan command \"redistribute eigrp <as number> subnets\"")
+        results.append("=========================================================\n")
+
+
 def check_redistribute(routers):
     results = []
-    for rname, rdata in routers.items():
-        prots = rdata["routing"]["protocol"]
-        need_redist = len(prots) > 1
-        if need_redist and not rdata["routing"]["redistribute"]:
-            results.append(f"=== Mismatch pada {rname} ===")
-            results.append("=========================================================")
-            results.append("- Redistribute Mismatch :")
-            results.append(f"\t* {rname} belum melakukan redistribute atau command kurang \"subnets\"")
-            results.append("=========================================================")
-            results.append("+ Solusi :\n\t* Tambahkan command \"redistribute eigrp <as number> subnets\"")
-            results.append("=========================================================\n")
+    for router in routers.items():
+        cek_redistribute(results, router)
     return results
 
 
@@ -190,8 +239,8 @@ def check_router_id(routers):
     all_ids = {}
 
     for rname, rdata in routers.items():
-        if "ospf" in rdata["routing"]["protocol"]:
-            rid = rdata.get("router_id")
+        if "ospf" in rdata.protocols:
+            rid = rdata.router_id
             if rid:
                 ids.setdefault(rid, []).append(rname)
                 all_ids[rname] = rid
@@ -216,8 +265,204 @@ def check_router_id(routers):
     return results
 
 
+# === REGISTRY RULE === #
+SCOPES = ("link", "router", "global")   # urutan evaluasi = urutan blok di hasil deteksi
+
+
+class Rule:
+    """
+    Satu rule deteksi. fn(results, subjek) menambahkan baris temuan ke results.
+    Subjek tergantung scope:
+    - "link"   : (rname, iname, idata, nrouter, match_intf, ndata) dari bangun_link
+    - "router" : (rname, Router)
+    - "global" : {nama: Router} seluruh topologi
+    """
+    __slots__ = ("nama", "scope", "fn")
+
+    def __init__(self, nama, scope, fn):
+        if scope not in SCOPES:
+            raise ValueError(f"scope rule {nama!r} harus salah satu dari {SCOPES}")
+        self.nama = nama
+        self.scope = scope
+        self.fn = fn
+
+
+RULES = []
+
+
+def daftar_rule(nama, scope, fn):
+    """Daftarkan rule baru; urutan pendaftaran = urutan temuan di dalam satu subjek"""
+    RULES.append(Rule(nama, scope, fn))
+    return fn
+
+
+def scope_rules(scope):
+    return [rule for rule in RULES if rule.scope == scope]
+
+
+for _key, _attr in NEIGHBOR_ATTRS:
+    daftar_rule(f"neighbor {_key}", "link", rule_atribut(_key, _attr))
+daftar_rule("neighbor auth_key", "link", cek_auth_key)
+daftar_rule("redistribute", "router", cek_redistribute)
+daftar_rule("router id duplikat", "global", lambda results, routers: results.extend(check_router_id(routers)))
+
+
+class Evaluator:
+    """
+    Jalankan rule per scope dalam satu traversal: setiap link (dan setiap router)
+    dikunjungi sekali, semua rule scope itu dievaluasi di kunjungan yang sama.
+    profil=True → waktu per rule ikut dicatat (statistik()).
+    """
+
+    def __init__(self, rules=None, profil=False):
+        self.rules = list(RULES if rules is None else rules)
+        self.profil = profil
+        self.per_scope = {scope: [rule for rule in self.rules if rule.scope == scope] for scope in SCOPES}
+        # {nama rule: [jumlah evaluasi, jumlah temuan, detik]}, terakumulasi antar jalankan()
+        self.stat = {rule.nama: [0, 0, 0.0] for rule in self.rules}
+
+    def _evaluasi(self, rules, subjek, results):
+        fns = [(rule.fn, self.stat[rule.nama]) for rule in rules]
+        for item in subjek:
+            for fn, stat in fns:
+                n = len(results)
+                if self.profil:
+                    t0 = time.perf_counter()
+                    fn(results, item)
+                    stat[2] += time.perf_counter() - t0
+                else:
+                    fn(results, item)
+                stat[0] += 1
+                if len(results) != n:
+                    stat[1] += sum(1 for line in results[n:] if line.startswith("- "))
+
+    def jalankan(self, routers, links=None):
+        """Semua rule → list baris hasil deteksi (link, lalu router, lalu global)"""
+        results = []
+        per_scope = self.per_scope
+        if per_scope["link"]:
+            if links is None:
+                links = bangun_link(routers)
+            self._evaluasi(per_scope["link"], links, results)
+        if per_scope["router"]:
+            self._evaluasi(per_scope["router"], routers.items(), results)
+        if per_scope["global"]:
+            self._evaluasi(per_scope["global"], [routers], results)
+        return results
+
+    def evaluasi(self, scope, item):
+        """Semua rule satu scope pada satu subjek → baris temuan subjek itu saja"""
+        results = []
+        self._evaluasi(self.per_scope[scope], (item,), results)
+        return results
+
+    def gabung(self, stat):
+        """Tambahkan stat Evaluator lain (mis. dari worker process) ke stat ini"""
+        for nama, (evaluasi, temuan, detik) in stat.items():
+            total = self.stat.setdefault(nama, [0, 0, 0.0])
+            total[0] += evaluasi
+            total[1] += temuan
+            total[2] += detik
+
+    def statistik(self):
+        """[(nama, scope, evaluasi, temuan, detik)] urut dari yang paling mahal"""
+        rows = [(rule.nama, rule.scope, *self.stat[rule.nama]) for rule in self.rules]
+        return sorted(rows, key=lambda row: row[4], reverse=True)
+
+
+def deteksi_topologi(routers, evaluator=None):
+    """Jalankan semua rule → list baris hasil deteksi"""
+    return (evaluator or Evaluator()).jalankan(routers)
+
+
+# === RUNNER BANYAK TOPOLOGI === #
+# Jumlah worker diskalakan ke total ukuran JSON: deteksi serial ±25-50 MB/s, start process pool
+# + kirim hasil ±10-50 ms → tiap worker perlu minimal ±0.3 s kerja supaya paralel lebih cepat
+MIN_BYTE_PER_WORKER = 8 * 1024 * 1024
+
+
+def deteksi_file(input_path, mode="rule", evaluator=None):
+    """
+    Satu topologi_N.json → (baris hasil deteksi, statistik inkremental / None)
+    mode: "rule" (Evaluator), "vektor" (deteksi_vektor, butuh numpy), "inkremental" (diff dengan topologi_N.deteksi)
+    """
+    evaluator = evaluator or Evaluator()
+    if mode == "inkremental":
+        import deteksi_inkremental
+        inkremental = deteksi_inkremental.DeteksiInkremental(evaluator)
+        state_path = deteksi_inkremental.path_state(input_path)
+        ada_state = inkremental.muat(state_path)
+        with buka_output(input_path) as buf:    # mmap; hanya router yang berubah yang di-decode
+            results = inkremental.jalankan(buf)
+        inkremental.simpan(state_path)
+        return results, inkremental.statistik if ada_state else None
+
+    with buka_snapshot(input_path) as routers:     # topologi_N.kolom (mmap) kalau ada, ditutup setelah deteksi
+        if mode == "vektor":
+            import deteksi_vektor
+            return deteksi_vektor.deteksi_topologi_vektor(routers), None
+        return deteksi_topologi(routers, evaluator), None
+
+
+def _deteksi_task(args):
+    """Worker: deteksi satu file; stdout (warning) ditangkap supaya dicetak berurutan oleh proses utama"""
+    input_path, mode, profil = args
+    evaluator = Evaluator(profil=profil)
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        results, statistik = deteksi_file(input_path, mode, evaluator)
+    return results, statistik, evaluator.stat, out.getvalue()
+
+
+def jumlah_worker(json_paths, workers=None):
+    """
+    Worker yang benar-benar dipakai: maksimal `workers` (default jumlah core), tidak lebih dari
+    jumlah core, dan dibatasi total ukuran file / MIN_BYTE_PER_WORKER (arsip kecil → serial).
+    """
+    n_core = os.cpu_count() or 1
+    total = sum(os.path.getsize(path) for path in json_paths)
+    return max(1, min(workers or n_core, n_core, len(json_paths), total // MIN_BYTE_PER_WORKER))
+
+
+def deteksi_banyak(json_paths, mode="rule", profil=False, workers=None):
+    """
+    Yield (baris hasil, statistik inkremental, stat rule, log stdout) per file, urutan = json_paths.
+    jumlah_worker > 1 → file dibagi ke process pool per chunk (executor.map menjaga urutan hasil).
+    """
+    tasks = [(path, mode, profil) for path in json_paths]
+    workers = jumlah_worker(json_paths, workers)
+    if workers == 1:
+        yield from map(_deteksi_task, tasks)
+        return
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_deteksi_task, tasks, chunksize=chunksize)
+
+
 # === MAIN PROGRAM === #
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Deteksi mismatch OSPF pada semua topologi_N.json")
+    parser.add_argument("--vektor", action="store_true",
+                        help="bandingkan atribut neighbor dengan array numpy (hasil sama, butuh numpy)")
+    parser.add_argument("--profil", action="store_true",
+                        help="catat waktu & jumlah temuan per rule (semua topologi), tampilkan di akhir")
+    parser.add_argument("--inkremental", action="store_true",
+                        help="diff dengan snapshot run sebelumnya (topologi_N.deteksi), hanya rule yang terdampak dijalankan ulang")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="maksimal proses untuk deteksi banyak topologi (default: jumlah core, 1 = serial); "
+                             "dibatasi jumlah core dan ukuran arsip (MIN_BYTE_PER_WORKER)")
+    args = parser.parse_args()
+
+    mode = "inkremental" if args.inkremental else "rule"
+    if args.vektor and (args.profil or args.inkremental):
+        print(f"[!] {'--inkremental' if args.inkremental else '--profil'} memakai engine per rule, --vektor diabaikan")
+    elif args.vektor:
+        import deteksi_vektor
+        if deteksi_vektor.tersedia():
+            mode = "vektor"
+        else:
+            print("[!] numpy tidak terpasang, --vektor diabaikan (pakai engine per link)")
+
     ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     data_rule_based_dir = os.path.join(ROOT_DIR, "03_Output", "Data_Rule_Based")
     hasil_dir = os.path.join(ROOT_DIR, "03_Output", "Hasil_Rule_Based")
@@ -228,19 +473,37 @@ if __name__ == "__main__":
     if not json_files:
         print("[!] Tidak ada file JSON ditemukan di Data_Rule_Based/")
     else:
-        for json_file in json_files:
-            input_path = os.path.join(data_rule_based_dir, json_file)
+        evaluator = Evaluator(profil=args.profil)   # stat rule semua worker digabung di sini
+        t0 = time.perf_counter()
+        json_paths = [os.path.join(data_rule_based_dir, f) for f in json_files]
+        workers = jumlah_worker(json_paths, args.workers)
+        hasil = deteksi_banyak(json_paths, mode, args.profil, workers)
+        outputs = []
+
+        for json_file, (results, statistik, stat, log) in zip(json_files, hasil):
             topo_num = re.findall(r"\d+", json_file)[0]
             output_path = os.path.join(hasil_dir, f"hasil_deteksi_{topo_num}.txt")
-
-            routers = load_json(input_path)
-            results = []
-            results += check_neighbors(routers)
-            results += check_redistribute(routers)
-            results += check_router_id(routers)
+            print(log, end="")
+            evaluator.gabung(stat)
+            if statistik:
+                ulang = ", ".join(f"{scope} {n} (cache {cache})" for scope, (n, cache) in statistik.items())
+                print(f"[i] {json_file}: dievaluasi ulang {ulang}")
 
             if not results:
                 results = [f"[✓] Tidak ditemukan mismatch pada topologi {topo_num}"]
 
-            write_output(output_path, results)
-            print(f"[✓] Deteksi selesai untuk {json_file} → {output_path}")
+            outputs.append((output_path, results))
+            print(f"[✓] Deteksi selesai untuk {json_file}")
+
+        # hasil ditulis sekaligus setelah semua topologi selesai (tidak ada I/O di tengah loop hasil)
+        write_outputs(outputs)
+        durasi = time.perf_counter() - t0
+        print(f"[✓] {len(outputs)} file hasil ditulis ke {hasil_dir}")
+        print(f"[i] {len(json_files)} topologi dalam {durasi:.2f}s ({len(json_files) / durasi:.1f} file/s, {workers} worker)")
+
+        if args.profil:
+            rows = evaluator.statistik()
+            total = sum(row[4] for row in rows) or 1.0
+            print(f"\n{'rule':<26}{'scope':<8}{'evaluasi':>10}{'temuan':>8}{'waktu (ms)':>12}{'%':>7}")
+            for nama, scope, evaluasi, temuan, detik in rows:
+                print(f"{nama:<26}{scope:<8}{evaluasi:>10}{temuan:>8}{detik * 1e3:>12.2f}{detik / total * 100:>7.1f}")
@@ -0,0 +1,107 @@
+import socket
+import threading
+import time
+from contextlib import contextmanager
+
+
+def is_overload(exc):
+    """
+    Error yang menandakan router admin / VTY kewalahan → turunkan konkurensi.
+    Dicek dari nama class & pesan supaya tidak perlu import netmiko di sini
+    (NetmikoTimeoutException, ReadTimeout, '% Connection refused by remote host', dll).
+    """
+    if isinstance(exc, (TimeoutError, socket.timeout, ConnectionRefusedError, ConnectionResetError)):
+        return True
+    nama = type(exc).__name__.lower()
+    pesan = str(exc).lower()
+    return (
+        "timeout" in nama
+        or "timed out" in pesan
+        or "refused" in pesan
+        or "no more vty" in pesan
+        or "reset by peer" in pesan
+    )
+
+
+class AIMDLimiter:
+    """
+    Pengatur konkurensi adaptif (Additive Increase / Multiplicative Decrease):
+    - setiap sesi sukses dengan latency normal → limit naik ~1 per 'window'
+    - timeout / session refused / latency melonjak → limit dikali `decrease`
+    Thread-safe, dipakai lewat `with limiter.slot(): ...`.
+    """
+
+    def __init__(self, initial=5, minimum=1, maximum=32, decrease=0.5, latency_factor=3.0, cooldown=2.0):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+        self.cooldown = cooldown
+
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._cond = threading.Condition()
+        self._latency_dasar = None
+        self._terakhir_turun = 0.0
+
+        self.peak = initial
+        self.sukses = 0
+        self.gagal = 0
+        self.backoff = 0
+
+    @property
+    def limit(self):
+        return max(self.minimum, int(self._limit))
+
+    def _naik(self, latency):
+        # latency dasar = rata-rata bergerak dari sesi sehat
+        if self._latency_dasar is None:
+            self._latency_dasar = latency
+        elif latency > self._latency_dasar * self.latency_factor:
+            self._turun()
+            return
+        else:
+            self._latency_dasar = 0.9 * self._latency_dasar + 0.1 * latency
+
+        self._limit = min(self.maximum, self._limit + 1.0 / max(self._limit, 1.0))
+        self.peak = max(self.peak, self.limit)
+
+    def _turun(self):
+        # satu kali turun per cooldown, supaya satu burst error tidak menjatuhkan limit ke minimum
+        now = time.monotonic()
+        if now - self._terakhir_turun < self.cooldown:
+            return
+        self._terakhir_turun = now
+        self._limit = max(self.minimum, self._limit * self.decrease)
+        self.backoff += 1
+
+    @contextmanager
+    def slot(self):
+        with self._cond:
+            while self._in_flight >= self.limit:
+                self._cond.wait()
+            self._in_flight += 1
+
+        mulai = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            with self._cond:
+                self.gagal += 1
+                if is_overload(e):
+                    self._turun()
+            raise
+        else:
+            with self._cond:
+                self.sukses += 1
+                self._naik(time.monotonic() - mulai)
+        finally:
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+    def laporan(self):
+        return (
+            f"[i] Konkurensi akhir: {self.limit} (puncak {self.peak}, batas {self.minimum}-{self.maximum}) | "
+            f"sukses {self.sukses}, gagal {self.gagal}, backoff {self.backoff}x"
+        )
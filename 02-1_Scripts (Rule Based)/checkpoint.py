@@ -0,0 +1,69 @@
+import json
+import os
+import random
+import threading
+import time
+
+NAMA_JOURNAL = "checkpoint.jsonl"
+
+
+class Checkpoint:
+    """
+    Journal pasangan (router, command) yang sudah selesai diambil.
+    Disimpan append-only di 03_Output/rawdata/checkpoint.jsonl → aman kalau
+    proses mati di tengah jalan; run `--resume` hanya mengambil yang belum ada.
+    """
+
+    def __init__(self, base_dir, resume=False):
+        self.path = os.path.join(base_dir, NAMA_JOURNAL)
+        self._lock = threading.Lock()
+        self.done = set()
+
+        if resume and os.path.exists(self.path):
+            with open(self.path) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # baris terakhir bisa terpotong kalau proses mati
+                    self.done.add((entry["router"], entry["cmd"]))
+        else:
+            open(self.path, "w").close()
+
+        self._file = open(self.path, "a")
+
+    def sisa(self, router_name, commands):
+        """Command yang belum selesai untuk router ini → dict {cmd: folder}"""
+        return {cmd: folder for cmd, folder in commands.items() if (router_name, cmd) not in self.done}
+
+    def catat(self, router_name, cmd):
+        with self._lock:
+            self.done.add((router_name, cmd))
+            self._file.write(json.dumps({"router": router_name, "cmd": cmd, "waktu": time.strftime("%Y-%m-%d %H:%M:%S")}) + "\n")
+            self._file.flush()
+
+    def belum_lengkap(self, router_list, commands):
+        """{router: [cmd, ...]} yang masih kurang setelah run selesai"""
+        kurang = {}
+        for router_name in router_list:
+            cmds = list(self.sisa(router_name, commands))
+            if cmds:
+                kurang[router_name] = cmds
+        return kurang
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+def dengan_retry(fn, percobaan=3, jeda_awal=1.0, jeda_maks=30.0, label=""):
+    """Jalankan fn(); kalau error ulangi dengan exponential backoff + jitter"""
+    for i in range(percobaan):
+        try:
+            return fn()
+        except Exception as e:
+            if i == percobaan - 1:
+                raise
+            jeda = min(jeda_maks, jeda_awal * (2 ** i)) * random.uniform(0.5, 1.0)
+            print(f"[~] {label} gagal ({e}), coba lagi dalam {jeda:.1f}s ({i + 2}/{percobaan})")
+            time.sleep(jeda)
@@ -0,0 +1,243 @@
+import asyncio
+import concurrent.futures
+import os
+import re
+import time
+import uuid
+
+from checkpoint import dengan_retry
+from manifest import ambil_fingerprint
+from sharding import ShardedPools
+from ssh_pool import masuk_router, keluar_router
+
+
+# ====== HELPER RAWDATA ====== #
+def nama_file(router_name, cmd):
+    """Nama file rawdata, contoh: R1 + 'show run | section interface' → R1_show_run__section_interface.txt"""
+    return f"{router_name}_{cmd.replace(' ', '_').replace('|', '').replace('/', '')}.txt"
+
+
+def simpan_output(base_dir, folder, router_name, cmd, result):
+    """Simpan output command ke 03_Output/rawdata/<folder>/ (output kosong tidak disimpan)"""
+    if not result.strip():
+        return None
+    path = os.path.join(base_dir, folder, nama_file(router_name, cmd))
+    with open(path, "w") as f:
+        f.write(result)
+    return path
+
+
+# ====== BATCH MODE ====== #
+def pecah_batch(output, cmds, token):
+    """
+    Pecah output gabungan batch → {cmd: output}.
+    Setiap command diawali baris penanda '! BATCH-<token>-<i>' (komentar IOS,
+    di-echo router tanpa efek). Hasil per command = teks setelah baris echo
+    command sampai prompt sebelum penanda berikutnya (sama seperti send_command).
+    """
+    penanda = re.compile(rf"^(.*?)! BATCH-{token}-(\d+|END)[^\n]*$", re.M)
+    matches = list(penanda.finditer(output))
+
+    hasil = {}
+    for m, m_next in zip(matches, matches[1:]):
+        if m.group(2) == "END":
+            break
+        cmd = cmds[int(m.group(2))]
+        segmen = output[m.end():m_next.start()].lstrip("\r\n")
+
+        # buang baris echo command ("R1#show interfaces")
+        baris_echo, _, sisa = segmen.partition("\n")
+        if not baris_echo.rstrip().endswith(cmd):
+            sisa = segmen
+
+        # prompt router target ada di depan penanda berikutnya
+        hasil[cmd] = sisa + m_next.group(1)
+    return hasil
+
+
+def jalankan_batch(admin_conn, cmds, cmd_timeout=None):
+    """Kirim semua command dalam satu write channel, baca sekali sampai penanda END"""
+    token = uuid.uuid4().hex[:8]
+    baris = []
+    for i, cmd in enumerate(cmds):
+        baris.append(f"! BATCH-{token}-{i}")
+        baris.append(cmd)
+    baris.append(f"! BATCH-{token}-END")
+    admin_conn.write_channel("\n".join(baris) + "\n")
+
+    pola = rf"! BATCH-{token}-END[^\n]*\n[^\n]*#"
+    timeout = (cmd_timeout or 10) * len(cmds)
+    output = admin_conn.read_until_pattern(pola, read_timeout=timeout)
+    return pecah_batch(output.replace("\r\n", "\n"), cmds, token)
+
+
+def ambil_router(admin_conn, router_name, mgmt_ip, commands, base_dir, cmd_timeout=None, batch=False,
+                 manifest=None, checkpoint=None, sink=None, archive=True, rec=None):
+    """
+    Nested SSH ke satu router, jalankan semua command, simpan hasil (blocking).
+    - manifest   : mode incremental, router dengan fingerprint sama di-skip (pakai file cache)
+    - checkpoint : hanya command yang belum tercatat selesai yang dijalankan
+    - sink       : callable(router, cmd, output) dipanggil begitu output datang (mis. StreamingParser)
+    - archive    : False → output tidak disimpan sebagai .txt di rawdata
+    - rec        : record Telemetry → waktu nested SSH & durasi/ukuran output per command dicatat
+    Return status: "selesai", "tidak berubah" atau "sudah lengkap".
+    """
+    semua = commands
+    if checkpoint is not None:
+        commands = checkpoint.sisa(router_name, commands)
+        if not commands:
+            return "sudah lengkap"
+
+    t0 = time.perf_counter()
+    masuk_router(admin_conn, mgmt_ip)
+    if rec is not None:
+        rec["nested_ssh_s"] = round(time.perf_counter() - t0, 4)
+
+    fingerprint = None
+    if manifest is not None:
+        fingerprint = ambil_fingerprint(admin_conn, cmd_timeout)
+        if manifest.tidak_berubah(router_name, fingerprint):
+            keluar_router(admin_conn)
+            if checkpoint is not None:
+                for cmd in commands:
+                    checkpoint.catat(router_name, cmd)
+            return "tidak berubah"
+
+    paths = []
+    if batch:
+        # satu round trip untuk semua command
+        t0 = time.perf_counter()
+        hasil = jalankan_batch(admin_conn, list(commands), cmd_timeout)
+        if rec is not None:
+            rec["commands"].append({"cmd": "(batch)", "durasi_s": round(time.perf_counter() - t0, 4),
+                                    "bytes": sum(len(v) for v in hasil.values())})
+        for cmd, folder in commands.items():
+            if archive:
+                paths.append(simpan_output(base_dir, folder, router_name, cmd, hasil.get(cmd, "")))
+            if sink is not None and cmd in hasil:
+                sink(router_name, cmd, hasil[cmd])
+            if checkpoint is not None and cmd in hasil:
+                checkpoint.catat(router_name, cmd)
+    else:
+        for cmd, folder in commands.items():
+            t0 = time.perf_counter()
+            if cmd_timeout is None:
+                result = admin_conn.send_command(cmd, expect_string=r"#")
+            else:
+                result = admin_conn.send_command(cmd, expect_string=r"#", read_timeout=cmd_timeout)
+            if rec is not None:
+                rec["commands"].append({"cmd": cmd, "durasi_s": round(time.perf_counter() - t0, 4),
+                                        "bytes": len(result)})
+            if archive:
+                paths.append(simpan_output(base_dir, folder, router_name, cmd, result))
+            if sink is not None:
+                sink(router_name, cmd, result)
+            if checkpoint is not None:
+                checkpoint.catat(router_name, cmd)
+
+    keluar_router(admin_conn)
+
+    if manifest is not None:
+        # manifest mencatat set command lengkap: file command yang selesai di run sebelumnya
+        # (di-skip checkpoint) ikut didaftarkan supaya run incremental berikutnya mengecek semuanya
+        if archive:
+            for cmd, folder in semua.items():
+                if cmd not in commands:
+                    path = os.path.join(base_dir, folder, nama_file(router_name, cmd))
+                    paths.append(path if os.path.exists(path) else None)
+        manifest.catat(router_name, fingerprint, paths)
+    return "selesai"
+
+
+# ====== ASYNC ENGINE ====== #
+class AsyncCollector:
+    """
+    Engine koleksi berbasis asyncio untuk inventory besar.
+    - jump_hosts      : {nama: device netmiko} → router admin yang dipakai
+    - mapping         : {router: nama jump host} opsional, sisanya dibagi pakai hash (+ failover)
+    - limit_per_host  : maksimal sesi nested SSH bersamaan per jump host
+    - cmd_timeout     : batas waktu (detik) per command di router target
+    - batch           : kirim semua command dalam satu round trip
+    - manifest        : Manifest → mode incremental (router tidak berubah di-skip)
+    - adaptive        : konkurensi per jump host diatur AIMDLimiter (maks limit_per_host)
+    - checkpoint      : Checkpoint → (router, command) yang selesai dicatat, sisanya di-retry
+    - retries         : jumlah percobaan per router (exponential backoff)
+    - sink / archive  : lihat ambil_router (pipeline streaming ke parser)
+    - telemetry       : Telemetry → waktu connect, nested SSH & per command dicatat
+    Netmiko bersifat blocking, jadi setiap sesi dijalankan di thread pool
+    yang ukurannya = total limit semua jump host.
+    """
+
+    def __init__(self, jump_hosts, commands, base_dir, limit_per_host=50, cmd_timeout=60, batch=False,
+                 manifest=None, adaptive=False, checkpoint=None, retries=3,
+                 sink=None, archive=True, mapping=None, telemetry=None, connect=None):
+        self.jump_hosts = jump_hosts
+        self.commands = commands
+        self.base_dir = base_dir
+        self.limit_per_host = limit_per_host
+        self.cmd_timeout = cmd_timeout
+        self.batch = batch
+        self.manifest = manifest
+        self.checkpoint = checkpoint
+        self.retries = retries
+        self.sink = sink
+        self.archive = archive
+        self.shards = ShardedPools(jump_hosts, size=limit_per_host, mapping=mapping, adaptive=adaptive,
+                                   telemetry=telemetry, connect=connect)
+
+        for folder in set(commands.values()):
+            os.makedirs(os.path.join(base_dir, folder), exist_ok=True)
+
+    def _percobaan(self, router_name, mgmt_ip):
+        return self.shards.jalankan(router_name, lambda admin_conn, rec: ambil_router(
+            admin_conn, router_name, mgmt_ip, self.commands, self.base_dir,
+            self.cmd_timeout, self.batch, self.manifest, self.checkpoint, self.sink, self.archive, rec))
+
+    def _kerja(self, router_name, mgmt_ip):
+        return dengan_retry(lambda: self._percobaan(router_name, mgmt_ip),
+                            percobaan=self.retries, label=router_name)
+
+    async def _satu_router(self, loop, executor, sems, router_name, mgmt_ip):
+        # semaphore per jump host utama. Saat failover pemanggil di pool cadangan bisa > limit_per_host:
+        # pool tidak membuka lebih dari `size` sesi, sisanya menunggu di Condition pool dan dibangunkan
+        # tiap kali sesi dikembalikan atau dibuang (sesi rusak membebaskan slot untuk sesi baru)
+        async with sems[self.shards.utama(router_name)]:
+            try:
+                status = await loop.run_in_executor(executor, self._kerja, router_name, mgmt_ip)
+                if status == "selesai":
+                    print(f"[✓] Selesai: {router_name}")
+                else:
+                    print(f"[=] Dilewati: {router_name} ({status})")
+                return router_name, None
+            except Exception as e:
+                print(f"[!] Error {router_name}: {e}")
+                return router_name, e
+
+    async def run(self, router_list):
+        """Koleksi semua router → {router: None (sukses) / exception}"""
+        loop = asyncio.get_running_loop()
+        sems = {name: asyncio.Semaphore(self.limit_per_host) for name in self.jump_hosts}
+        max_threads = self.limit_per_host * len(self.jump_hosts)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_threads) as executor:
+            try:
+                tasks = [
+                    self._satu_router(loop, executor, sems, rname, ip)
+                    for rname, ip in router_list.items()
+                ]
+                hasil = await asyncio.gather(*tasks)
+            finally:
+                self.shards.close()
+                if self.manifest is not None:
+                    self.manifest.simpan()
+
+        for baris in self.shards.laporan():
+            print(baris)
+
+        return dict(hasil)
+
+
+def collect(router_list, jump_hosts, commands, base_dir, **kwargs):
+    """Entry point library (sync): jalankan AsyncCollector sampai selesai"""
+    engine = AsyncCollector(jump_hosts, commands, base_dir, **kwargs)
+    return asyncio.run(engine.run(router_list))
@@ -0,0 +1,241 @@
+import hashlib
+import importlib
+import json
+import os
+import re
+import sys
+
+import nama_interface
+from topologi_model import Router
+
+deteksi = importlib.import_module("3_Rule_Based_Detection")
+
+# Naikkan kalau format state berubah; perubahan rule/teks laporan sudah ikut sidik_rules()
+VERSI_STATE = 2
+KUNCI_STATE = {"versi", "rules", "urutan", "sidik", "atribut", "ditunjuk", "menunjuk", "link", "router", "global"}
+
+_INDENT = re.compile(rb"\{\r?\n([ \t]+)\"")
+
+
+def path_state(json_path):
+    """topologi_N.json → topologi_N.deteksi (state deteksi inkremental, di folder yang sama)"""
+    return os.path.splitext(json_path)[0] + ".deteksi"
+
+
+# ====== POTONG SNAPSHOT PER ROUTER (tanpa decode) ====== #
+def potong_router(buf):
+    """
+    Isi topologi_N.json (bytes / mmap) → {router: bytes JSON router}, tanpa decode seluruh file.
+    Key level atas dicari dengan regex berdasarkan indentasi baris pertama (json.dumps indent=N);
+    string JSON tidak bisa memuat newline, jadi pola ini tidak mungkin cocok di level yang lebih dalam.
+    File tanpa indentasi → decode penuh lalu di-dump ulang per router.
+    """
+    m = _INDENT.match(buf)
+    if m is None:
+        return {name: json.dumps(d).encode() for name, d in json.loads(bytes(buf)).items()}
+
+    key = re.compile(rb"\n" + re.escape(m.group(1)) + rb"(\"(?:[^\"\\\n]|\\.)*\"): ")
+    hasil = {}
+    awal = None
+    for m in key.finditer(buf):
+        if awal is not None:
+            hasil[name] = buf[awal:m.start()].rstrip().rstrip(b",")
+        raw = m.group(1)
+        name = json.loads(raw) if b"\\" in raw else raw[1:-1].decode()
+        awal = m.end()
+    if awal is not None:
+        hasil[name] = buf[awal:buf.rfind(b"}")].rstrip()
+    return hasil
+
+
+def sidik(potongan):
+    return hashlib.sha256(potongan).hexdigest()
+
+
+def sidik_rules(rules):
+    """
+    Hash nama + bytecode fungsi rule + source modul tempat rule dan helper laporannya
+    (laporan_atribut, short_ifname → nama_interface) didefinisikan. Logika atau teks laporan
+    berubah → sidik berubah → state lama tidak dipakai lagi.
+    """
+    h = hashlib.sha256(str(VERSI_STATE).encode())
+    files = {deteksi.__file__, nama_interface.__file__}
+    for rule in rules:
+        h.update(rule.nama.encode())
+        h.update(rule.fn.__code__.co_code)
+        modul = sys.modules.get(rule.fn.__module__)
+        if getattr(modul, "__file__", None):
+            files.add(modul.__file__)
+    for path in sorted(os.path.realpath(f) for f in files):
+        with open(path, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def tunjuk(d):
+    """Router yang ditunjuk neighbor (CDP) interface-interface satu router JSON"""
+    return sorted({intf["neighbor"]["router"] for intf in d["interfaces"].values() if "neighbor" in intf})
+
+
+def atribut_router(d):
+    """Nilai level router yang dibaca rule global (router id duplikat)"""
+    return [d.get("router_id"), list(d["routing"]["protocol"]), d["routing"]["redistribute"]]
+
+
+# ====== DETEKSI INKREMENTAL ====== #
+class DeteksiInkremental:
+    """
+    Deteksi ulang satu topologi dari diff terhadap snapshot run sebelumnya.
+    Diff per router = sidik (sha256) potongan teks JSON router itu, jadi router yang tidak
+    berubah tidak di-decode dan tidak dibangun objek modelnya. Temuan disimpan per subjek rule;
+    yang dievaluasi ulang hanya:
+    - link   : link yang salah satu ujungnya router berubah (dicari ulang di router berubah + tetangganya);
+               cache hanya menyimpan link yang punya temuan, link bersih tidak perlu diingat
+    - router : router yang berubah
+    - global : router id duplikat, hanya kalau router_id / protocol suatu router berubah atau router
+               bertambah/hilang (Solusi mencantumkan router ID semua router, jadi semua grup di-render ulang)
+    Hasil identik dengan deteksi_topologi; warning neighbor tanpa OSPF hanya dicetak untuk link terdampak.
+    """
+
+    def __init__(self, evaluator=None):
+        self.evaluator = evaluator or deteksi.Evaluator()
+        self.rules = sidik_rules(self.evaluator.rules)
+        self.state = None
+        self.statistik = {}     # {scope: (dievaluasi ulang, diambil dari cache)} untuk jalankan() terakhir
+
+    def muat(self, path):
+        """
+        Baca state (JSON) dari file; state rusak / versi lama / rule berbeda diabaikan (deteksi penuh).
+        Sengaja bukan pickle: file ada di folder data, isinya tidak boleh bisa menjalankan kode.
+        """
+        try:
+            with open(path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if not isinstance(state, dict) or state.keys() != KUNCI_STATE or state["versi"] != VERSI_STATE \
+                or state["rules"] != self.rules:
+            return False
+        # menunjuk disimpan sebagai list → set supaya bisa di-update
+        state["menunjuk"] = {rname: set(asal) for rname, asal in state["menunjuk"].items()}
+        self.state = state
+        return True
+
+    def simpan(self, path):
+        state = dict(self.state, menunjuk={rname: sorted(asal) for rname, asal in self.state["menunjuk"].items()})
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(json.dumps(state))     # json.dumps pakai encoder C, json.dump tidak
+        os.replace(tmp, path)
+
+    def jalankan(self, buf):
+        """buf = isi topologi_N.json (bytes / mmap) → list baris hasil deteksi"""
+        ev = self.evaluator
+        potongan = potong_router(buf)
+        urutan = list(potongan)
+
+        lama = self.state
+        if lama is None or [r for r in lama["urutan"] if r in potongan] != [r for r in urutan if r in lama["sidik"]]:
+            # --- tanpa state (atau urutan router berubah): semua router dianggap baru ---
+            lama = {"urutan": [], "sidik": {}, "atribut": {}, "ditunjuk": {}, "menunjuk": {},
+                    "link": [], "router": {}, "global": None}
+        sidik_baru = {rname: sidik(p) for rname, p in potongan.items()}
+        sidik_lama = lama["sidik"]
+        berubah = {rname for rname in sidik_lama.keys() | sidik_baru.keys()
+                   if sidik_lama.get(rname) != sidik_baru.get(rname)}
+
+        data = {}       # dict JSON router yang perlu di-decode saja
+
+        def router_json(rname):
+            if rname not in data:
+                data[rname] = json.loads(potongan[rname])
+            return data[rname]
+
+        # --- indeks tunjuk (siapa ber-neighbor ke siapa) diperbarui hanya untuk router berubah ---
+        atribut = dict(lama["atribut"])
+        ditunjuk = dict(lama["ditunjuk"])
+        menunjuk = {rname: set(s) for rname, s in lama["menunjuk"].items()}
+        for rname in berubah:
+            for nrouter in ditunjuk.pop(rname, ()):
+                menunjuk[nrouter].discard(rname)
+            atribut.pop(rname, None)
+            if rname in potongan:
+                d = router_json(rname)
+                atribut[rname] = atribut_router(d)
+                ditunjuk[rname] = tunjuk(d)
+                for nrouter in ditunjuk[rname]:
+                    menunjuk.setdefault(nrouter, set()).add(rname)
+
+        # --- router terdampak = berubah + yang menunjuk ke / ditunjuk oleh router berubah ---
+        terdampak = set()
+        for rname in berubah:
+            terdampak.update(ditunjuk.get(rname, ()))
+            terdampak |= menunjuk.get(rname, set())
+        terdampak = (terdampak | berubah) & potongan.keys()
+        posisi = {rname: i for i, rname in enumerate(urutan)} if berubah else {}
+        routers = {rname: Router.from_dict(rname, router_json(rname))
+                   for rname in sorted(terdampak, key=posisi.__getitem__)}
+
+        links = self._link(routers, berubah, posisi, lama["link"])
+        router_lines = self._router(routers, berubah, lama["router"])
+
+        # --- global: hanya kalau atribut level router berubah (butuh model semua router) ---
+        lines_global = lama["global"]
+        kotor = lines_global is None or any(atribut.get(r) != lama["atribut"].get(r) for r in berubah)
+        if ev.per_scope["global"] and kotor:
+            semua = {rname: routers.get(rname) or Router.from_dict(rname, router_json(rname)) for rname in urutan}
+            lines_global = ev.evaluasi("global", semua)
+        dievaluasi = int(kotor and bool(ev.per_scope["global"]))
+        self.statistik["global"] = (dievaluasi, 1 - dievaluasi)
+
+        results = []
+        for _, _, _, lines in links:
+            results += lines
+        for rname in urutan:
+            results += router_lines.get(rname, ())
+        results += lines_global or []
+
+        self.state = {"versi": VERSI_STATE, "rules": self.rules, "urutan": urutan, "sidik": sidik_baru,
+                      "atribut": atribut, "ditunjuk": ditunjuk, "menunjuk": menunjuk,
+                      "link": links, "router": router_lines, "global": lines_global}
+        return results
+
+    def _link(self, routers, berubah, posisi, cache):
+        """
+        Link bertemuan [[router, posisi interface, kunci, baris temuan]] urut seperti bangun_link:
+        temuan lama yang tidak menyentuh router berubah + link hasil cari ulang di router terdampak.
+        """
+        ev = self.evaluator
+        if not ev.per_scope["link"] or not berubah:
+            self.statistik["link"] = (0, len(cache))
+            return cache
+
+        links = [e for e in cache if e[2][0] not in berubah and e[2][2] not in berubah]
+        n_cache, n_eval = len(links), 0
+        indeks = {rname: {iname: i for i, iname in enumerate(r.interfaces)} for rname, r in routers.items()}
+        for link in deteksi.bangun_link(routers, hanya=berubah):
+            lines = ev.evaluasi("link", link)
+            n_eval += 1
+            if lines:
+                links.append([link[0], indeks[link[0]][link[1]], [link[0], link[1], link[3], link[4]], lines])
+        # urutan bangun_link = (urutan router, urutan interface) sisi yang pertama ditemui
+        links.sort(key=lambda e: (posisi[e[0]], e[1]))
+        self.statistik["link"] = (n_eval, n_cache)
+        return links
+
+    def _router(self, routers, berubah, cache):
+        ev = self.evaluator
+        if not ev.per_scope["router"] or not berubah:
+            self.statistik["router"] = (0, len(cache))
+            return cache
+        # sama seperti link, hanya router yang punya temuan yang disimpan
+        hasil = {rname: lines for rname, lines in cache.items() if rname not in berubah}
+        n_cache, n_eval = len(hasil), 0
+        for rname in berubah:
+            if rname in routers:
+                lines = ev.evaluasi("router", (rname, routers[rname]))
+                n_eval += 1
+                if lines:
+                    hasil[rname] = lines
+        self.statistik["router"] = (n_eval, n_cache)
+        return hasil
@@ -0,0 +1,154 @@
+import importlib
+
+try:
+    import numpy as np
+except ImportError:     # numpy opsional: tanpa numpy deteksi tetap jalan dengan engine per link
+    np = None
+
+from snapshot_kolom import RouterView
+
+deteksi = importlib.import_module("3_Rule_Based_Detection")
+
+# kolom .kolom untuk tiap atribut NEIGHBOR_ATTRS (urutan sama)
+KOLOM_ATRIBUT = {
+    "Hello": "i_hello",
+    "Dead": "i_dead",
+    "area": "i_area",
+    "Network Type": "i_network_type",
+    "MTU": "i_mtu",
+    "passive": "i_passive",
+    "ospf auth": "i_auth",
+}
+_PASSIVE = [key for key, _ in deteksi.NEIGHBOR_ATTRS].index("passive")
+
+
+def tersedia():
+    return np is not None
+
+
+# ====== TABEL LINK: dua set kolom sejajar (sisi A, sisi B) ====== #
+# Nilai tiap atribut diganti kode integer (kode sama ⇔ nilai sama menurut ==),
+# jadi mismatch = kode_a != kode_b untuk semua link & atribut sekaligus.
+def tabel_link(links):
+    """
+    links (bangun_link) → (kode_a, kode_b [n_link, n_atribut], passive_true [n_link], ada_key [n_link])
+    ada_key = link yang perlu dicek cek_auth_key (auth_key ada dan berbeda)
+    """
+    n_attr = len(deteksi.NEIGHBOR_ATTRS)
+    kode = [{} for _ in range(n_attr)]
+    kol_a = [[] for _ in range(n_attr)]
+    kol_b = [[] for _ in range(n_attr)]
+    ada_key = []
+
+    for _, _, idata, _, _, ndata in links:
+        for j, (_, attr) in enumerate(deteksi.NEIGHBOR_ATTRS):
+            val1 = getattr(idata.ospf, attr) if attr else idata.mtu
+            val2 = getattr(ndata.ospf, attr) if attr else ndata.mtu
+            kol_a[j].append(kode[j].setdefault(val1, len(kode[j])))
+            kol_b[j].append(kode[j].setdefault(val2, len(kode[j])))
+        # auth_key sama persis → ketiga cabang cek_auth_key pasti lolos
+        key1, key2 = idata.ospf.auth_key or {}, ndata.ospf.auth_key or {}
+        ada_key.append(bool(key1 or key2) and key1 != key2)
+
+    shape = (n_attr, len(links))
+    kode_a = np.array(kol_a, dtype=np.int64).reshape(shape).T
+    kode_b = np.array(kol_b, dtype=np.int64).reshape(shape).T
+    true = kode[_PASSIVE].get(True, -2)
+    passive_true = (kode_a[:, _PASSIVE] == true) & (kode_b[:, _PASSIVE] == true)
+    return kode_a, kode_b, passive_true, np.array(ada_key, dtype=bool).reshape(len(links))
+
+
+def tabel_link_kolom(snap):
+    """
+    Sama dengan bangun_link + tabel_link, tapi langsung dari kolom .kolom (mmap, tanpa loop Python):
+    filter interface, resolusi neighbor (i_link) dan dedup A-B/B-A dilakukan dengan operasi array.
+    → (baris_a, baris_b, kode_a, kode_b, passive_true, ada_key)
+    """
+    kol = {name: np.asarray(col) for name, col in snap.kolom.items()}
+    n_string = len(kol["str_offsets"]) - 1
+
+    # --- interface yang di-skip berdasarkan nama (dicek per string unik, bukan per baris) ---
+    lewati = np.zeros(n_string, dtype=bool)
+    for code in np.unique(kol["i_name"]).tolist():
+        name = snap.teks(code)
+        lewati[code] = name.startswith("Loopback") or name == "FastEthernet0/0"
+
+    link = kol["i_link"]
+    ospf = kol["i_ospf"] == 1
+    valid = ospf & ~lewati[kol["i_name"]] & (kol["i_nbr_router"] >= 0) & (link >= 0)
+    nbr_ospf = ospf[np.where(link >= 0, link, 0)]
+
+    # --- neighbor tanpa OSPF: warning yang sama dengan bangun_link, urutan baris ---
+    for row in np.flatnonzero(valid & ~nbr_ospf).tolist():
+        nbr = snap.interface(int(link[row]))
+        print(f"[⚠️] Warning: {snap.interface(row).neighbor.router} interface {nbr.name} tidak punya key 'ospf' (skip)")
+
+    baris_a = np.flatnonzero(valid & nbr_ospf)
+    baris_b = link[baris_a].astype(np.int64)
+
+    # --- dedup pasangan tak berurutan {A, B}, ambil kemunculan pertama ---
+    lo = np.minimum(baris_a, baris_b)
+    hi = np.maximum(baris_a, baris_b)
+    _, pertama = np.unique(lo * len(link) + hi, return_index=True)
+    pertama.sort()
+    baris_a, baris_b = baris_a[pertama], baris_b[pertama]
+
+    kode_a = np.stack([kol[KOLOM_ATRIBUT[key]][baris_a] for key, _ in deteksi.NEIGHBOR_ATTRS], axis=1)
+    kode_b = np.stack([kol[KOLOM_ATRIBUT[key]][baris_b] for key, _ in deteksi.NEIGHBOR_ATTRS], axis=1)
+    passive_true = (kode_a[:, _PASSIVE] == 1) & (kode_b[:, _PASSIVE] == 1)
+
+    # --- auth_key tidak kosong (None = -1, {} = kode string "{}") dan kodenya beda ---
+    # (kode beda belum tentu dict beda, misal urutan key lain → cek_auth_key yang memastikan)
+    auth_key = kol["i_auth_key"]
+    kosong = [code for code in np.unique(auth_key).tolist() if code >= 0 and snap.teks(code) == "{}"]
+    isi = (auth_key >= 0) & ~np.isin(auth_key, kosong)
+    ada_key = (isi[baris_a] | isi[baris_b]) & (auth_key[baris_a] != auth_key[baris_b])
+    return baris_a, baris_b, kode_a, kode_b, passive_true, ada_key
+
+
+# ====== EVALUASI ====== #
+def _laporan(links, kode_a, kode_b, passive_true, ada_key):
+    """Mask mismatch semua link sekaligus → hanya link yang bermasalah dirender (urutan sama dengan engine per link)"""
+    mismatch = kode_a != kode_b
+    mismatch[:, _PASSIVE] |= passive_true
+
+    results = []
+    for i in np.flatnonzero(mismatch.any(axis=1) | ada_key).tolist():
+        link = links(i)
+        _, _, idata, _, _, ndata = link
+        for j in np.flatnonzero(mismatch[i]).tolist():
+            key, attr = deteksi.NEIGHBOR_ATTRS[j]
+            val1 = getattr(idata.ospf, attr) if attr else idata.mtu
+            val2 = getattr(ndata.ospf, attr) if attr else ndata.mtu
+            deteksi.laporan_atribut(results, link, key, val1, val2)
+        if ada_key[i]:
+            deteksi.cek_auth_key(results, link)
+    return results
+
+
+def check_neighbors_vektor(routers, links=None):
+    """Pengganti check_neighbors berbasis array; routers dari .kolom → jalur kolom penuh"""
+    view = next(iter(routers.values()), None)
+    if links is None and isinstance(view, RouterView):
+        snap = view.snapshot
+        baris_a, baris_b, *tabel = tabel_link_kolom(snap)
+
+        def link_kolom(i):
+            a, b = snap.interface(int(baris_a[i])), snap.interface(int(baris_b[i]))
+            return (a.router_name, a.name, a, b.router_name, b.name, b)
+        return _laporan(link_kolom, *tabel)
+
+    if links is None:
+        links = deteksi.bangun_link(routers)
+    if not links:
+        return []
+    return _laporan(links.__getitem__, *tabel_link(links))
+
+
+def deteksi_topologi_vektor(routers):
+    """Sama dengan deteksi_topologi; rule neighbor (per link) lewat array, rule per router tetap sama"""
+    results = []
+    results += check_neighbors_vektor(routers)
+    results += deteksi.check_redistribute(routers)
+    results += deteksi.check_router_id(routers)
+    return results
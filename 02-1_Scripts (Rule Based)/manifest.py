@@ -0,0 +1,86 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+# Command murah untuk sidik jari router:
+# - konfigurasi : baris "Last configuration change" (wajib ada, lihat hitung_fingerprint)
+# - operasional : jumlah neighbor CDP & adjacency OSPF FULL → link/neighbor naik-turun tanpa ubah konfigurasi
+#                 tetap terdeteksi ("| count" supaya hold/dead time yang terus berjalan tidak ikut di-hash)
+PENANDA_KONFIG = "Last configuration change"
+FINGERPRINT_COMMANDS = [
+    f"show running-config | include {PENANDA_KONFIG}",
+    "show cdp neighbors | count",
+    "show ip ospf neighbor | count FULL",
+]
+
+NAMA_MANIFEST = "manifest.json"
+
+
+def hitung_fingerprint(outputs):
+    """
+    Hash dari output command fingerprint (prompt & whitespace diabaikan).
+    Tanpa baris "Last configuration change" (command ditolak / belum pernah dikonfigurasi) → ""
+    = fingerprint kosong, router selalu diambil ulang (lihat Manifest.tidak_berubah).
+    """
+    if not any(PENANDA_KONFIG in out for out in outputs):
+        return ""
+    h = hashlib.sha1()
+    for out in outputs:
+        for line in out.splitlines():
+            line = line.strip()
+            if line and not line.endswith("#"):
+                h.update(line.encode())
+                h.update(b"\n")
+    return h.hexdigest()
+
+
+def ambil_fingerprint(admin_conn, cmd_timeout=None):
+    """Jalankan FINGERPRINT_COMMANDS di router target (sudah nested SSH)"""
+    outputs = []
+    for cmd in FINGERPRINT_COMMANDS:
+        if cmd_timeout is None:
+            outputs.append(admin_conn.send_command(cmd, expect_string=r"#"))
+        else:
+            outputs.append(admin_conn.send_command(cmd, expect_string=r"#", read_timeout=cmd_timeout))
+    return hitung_fingerprint(outputs)
+
+
+class Manifest:
+    """
+    Manifest lokal di 03_Output/rawdata/manifest.json:
+    { "R1": {"fingerprint": "...", "files": ["cdp/R1_show_cdp_neighbor.txt", ...], "waktu": "..."} }
+    """
+
+    def __init__(self, base_dir):
+        self.base_dir = base_dir
+        self.path = os.path.join(base_dir, NAMA_MANIFEST)
+        self._lock = threading.Lock()
+        self.data = {}
+        if os.path.exists(self.path):
+            with open(self.path) as f:
+                self.data = json.load(f)
+
+    def tidak_berubah(self, router_name, fingerprint):
+        """True kalau fingerprint (tidak kosong) sama dan semua file cache masih ada"""
+        entry = self.data.get(router_name)
+        if not fingerprint or not entry or entry.get("fingerprint") != fingerprint:
+            return False
+        return all(os.path.exists(os.path.join(self.base_dir, rel)) for rel in entry.get("files", []))
+
+    def catat(self, router_name, fingerprint, paths):
+        files = [os.path.relpath(p, self.base_dir) for p in paths if p]
+        with self._lock:
+            self.data[router_name] = {
+                "fingerprint": fingerprint,
+                "files": files,
+                "waktu": time.strftime("%Y-%m-%d %H:%M:%S"),
+            }
+
+    def simpan(self):
+        with self._lock:
+            tmp = self.path + ".tmp"
+            with open(tmp, "w") as f:
+                json.dump(self.data, f, indent=4)
+            os.replace(tmp, self.path)
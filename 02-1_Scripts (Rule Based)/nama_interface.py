@@ -0,0 +1,89 @@
+import re
+
+# ====== TABEL KANONIK NAMA INTERFACE IOS ====== #
+# nama lengkap → (singkatan untuk output, semua bentuk yang dipakai IOS di show command / config)
+JENIS_INTERFACE = {
+    "FastEthernet": ("Fa", ("Fa", "Fas", "Fast", "FastEth")),
+    "GigabitEthernet": ("Gi", ("Gi", "Gig", "Giga", "GigE", "GigabitEth")),
+    "TenGigabitEthernet": ("Te", ("Te", "Ten", "TenGig", "TenGigE", "TenGigabitEth")),
+    "TwentyFiveGigE": ("Twe", ("Twe", "TwentyFiveGig")),
+    "FortyGigabitEthernet": ("Fo", ("Fo", "For", "FortyGig", "FortyGigE")),
+    "HundredGigE": ("Hu", ("Hu", "Hun", "HundredGig")),
+    "Ethernet": ("Et", ("Et", "Eth")),
+    "Loopback": ("Lo", ("Lo", "Loop")),
+    "Serial": ("Se", ("Se", "Ser")),
+    "Port-channel": ("Po", ("Po", "Port", "Portchannel")),
+    "Tunnel": ("Tu", ("Tu", "Tun")),
+    "Vlan": ("Vl", ("Vl", "Vla")),
+    "Dialer": ("Di", ("Di", "Dia")),
+    "Virtual-Template": ("Vt", ("Vt", "Virtual-Temp")),
+    "Multilink": ("Mu", ("Mu", "Mul")),
+    "BDI": ("BD", ("BD",)),
+    "Null": ("Nu", ("Nu",)),
+}
+
+# bentuk apa pun (huruf kecil) → nama lengkap
+_LENGKAP = {}
+for _nama, (_, _bentuk) in JENIS_INTERFACE.items():
+    _LENGKAP[_nama.lower()] = _nama
+    for _b in _bentuk:
+        _LENGKAP.setdefault(_b.lower(), _nama)
+
+_PREFIX = re.compile(r"([A-Za-z][A-Za-z-]*)\s*(.*)")
+
+
+def lengkap(jenis):
+    """'Fas' / 'gi' / 'FastEthernet' → nama jenis lengkap (jenis tak dikenal dikembalikan apa adanya)"""
+    return _LENGKAP.get(jenis.lower(), jenis)
+
+
+# ====== KANONIK + ID INTEGER ====== #
+# Cache per nama mentah → hasil dihitung sekali per proses, panggilan berikutnya cukup satu dict lookup
+_kanonik = {}
+_singkat = {}
+_id = {}        # nama kanonik → id
+_nama = []      # id → nama kanonik
+_id_mentah = {}  # nama mentah → id
+
+
+def kanonik(name):
+    """'Fas 0/1', 'Fa0/1', 'FastEthernet 0/1' → 'FastEthernet0/1'"""
+    hasil = _kanonik.get(name)
+    if hasil is None:
+        m = _PREFIX.fullmatch(name.strip())
+        hasil = lengkap(m.group(1)) + m.group(2).replace(" ", "") if m else name.replace(" ", "")
+        _kanonik[name] = hasil
+    return hasil
+
+
+def singkat(name):
+    """'FastEthernet0/1' / 'Fas 0/1' → 'Fa0/1' (untuk output deteksi)"""
+    hasil = _singkat.get(name)
+    if hasil is None:
+        nama = kanonik(name)
+        m = _PREFIX.fullmatch(nama)
+        if m and m.group(1) in JENIS_INTERFACE:
+            nama = JENIS_INTERFACE[m.group(1)][0] + m.group(2)
+        hasil = _singkat[name] = nama
+    return hasil
+
+
+def id_interface(name):
+    """
+    Nama interface (bentuk apa pun) → id integer; bentuk berbeda dari interface yang
+    sama mendapat id yang sama. Id hanya berlaku di dalam satu proses (jangan disimpan).
+    """
+    hasil = _id_mentah.get(name)
+    if hasil is None:
+        nama = kanonik(name)
+        hasil = _id.get(nama)
+        if hasil is None:
+            hasil = _id[nama] = len(_nama)
+            _nama.append(nama)
+        _id_mentah[name] = hasil
+    return hasil
+
+
+def nama_interface(id_):
+    """id integer → nama kanonik"""
+    return _nama[id_]
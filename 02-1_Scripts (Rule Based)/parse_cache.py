@@ -0,0 +1,98 @@
+import hashlib
+import json
+import os
+import sqlite3
+
+from parser_engine import PARSER_VERSION, buka_output
+
+
+class ParseCache:
+    """
+    Cache persisten hasil parse per output show command (sqlite3).
+    key = PARSER_VERSION + folder + sha256(isi file) → output yang tidak berubah
+    tidak di-parse ulang; ganti grammar cukup naikkan PARSER_VERSION.
+
+    Supaya file yang tidak disentuh tidak perlu dibaca & di-hash ulang, dicatat juga
+    indeks path → (size, mtime_ns, key); kalau stat file masih sama, key langsung dipakai.
+
+    Hasil disimpan sebagai teks JSON (hasil parser cuma dict/list/str/int), bukan pickle:
+    membuka file cache tidak boleh bisa menjalankan kode. Tuple hasil parser kembali sebagai list.
+
+    Entri baru ditampung dulu (self.baru / self.indeks_baru) lalu ditulis sekaligus
+    lewat simpan(), supaya worker process cukup membaca cache dan proses utama yang menulis.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        # tabel lama parse_cache (BLOB pickle) tidak dibaca lagi
+        self.conn.execute("CREATE TABLE IF NOT EXISTS hasil_parse (key TEXT PRIMARY KEY, hasil TEXT)")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS file_index "
+                          "(path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, key TEXT)")
+        self.conn.commit()
+        self.baru = []          # [(key, JSON hasil)] belum ditulis
+        self.indeks_baru = []   # [(path, size, mtime_ns, key)] belum ditulis
+
+    @staticmethod
+    def kunci(folder, text):
+        """text = str atau bytes-like (isi file / mmap, di-hash tanpa disalin)"""
+        data = text.encode() if isinstance(text, str) else text
+        return f"v{PARSER_VERSION}:{folder}:{hashlib.sha256(data).hexdigest()}"
+
+    def _ambil(self, key):
+        row = self.conn.execute("SELECT hasil FROM hasil_parse WHERE key = ?", (key,)).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def parse(self, folder, text, parse_fn, key=None):
+        """Hasil parse_fn(folder, text) dari cache, atau parse lalu tampung sebagai entri baru"""
+        key = key or self.kunci(folder, text)
+        hasil = self._ambil(key)
+        if hasil is not None:
+            return hasil
+
+        hasil = parse_fn(folder, text)
+        # serialisasi sekarang: gabung_router nanti mengubah dict hasil parse di tempat
+        self.baru.append((key, json.dumps(hasil)))
+        return hasil
+
+    def parse_file(self, folder, path, parse_fn):
+        """
+        Seperti parse(), tapi mulai dari path: stat sama dengan indeks → file tidak dibaca.
+        FileNotFoundError diteruskan ke pemanggil.
+        """
+        st = os.stat(path)
+        row = self.conn.execute("SELECT size, mtime_ns, key FROM file_index WHERE path = ?", (path,)).fetchone()
+        if row is not None and row[0] == st.st_size and row[1] == st.st_mtime_ns:
+            hasil = self._ambil(row[2])
+            if hasil is not None:
+                return hasil
+
+        with buka_output(path) as data:
+            key = self.kunci(folder, data)
+            self.indeks_baru.append((path, st.st_size, st.st_mtime_ns, key))
+            return self.parse(folder, data, parse_fn, key)
+
+    def ambil_baru(self):
+        """Serahkan entri baru (dipakai worker untuk dikirim ke proses utama)"""
+        baru = (self.baru, self.indeks_baru)
+        self.baru, self.indeks_baru = [], []
+        return baru
+
+    def tambah(self, baru):
+        """Terima entri baru hasil ambil_baru() dari worker"""
+        self.baru.extend(baru[0])
+        self.indeks_baru.extend(baru[1])
+
+    def simpan(self):
+        """Tulis entri baru dalam satu transaksi → jumlah output yang di-parse ulang"""
+        rows, indeks = self.ambil_baru()
+        with self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO hasil_parse (key, hasil) VALUES (?, ?)", rows)
+            self.conn.executemany("INSERT OR REPLACE INTO file_index (path, size, mtime_ns, key) "
+                                  "VALUES (?, ?, ?, ?)", indeks)
+        return len(rows)
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,276 @@
+import mmap
+import os
+import re
+from contextlib import contextmanager
+
+from nama_interface import lengkap
+
+# Naikkan setiap kali grammar/handler berubah → entri parse_cache lama otomatis tidak terpakai
+PARSER_VERSION = 2
+
+
+# ====== ENGINE ====== #
+class Grammar:
+    """
+    Grammar satu show command = tabel (nama rule, pola regex).
+    Semua pola digabung jadi satu regex yang dikompilasi sekali; finditer
+    menyapu seluruh output dalam satu pass di C, baris yang tidak cocok dengan
+    rule mana pun tidak pernah masuk ke Python. Rule yang cocok dikenali dari
+    m.lastgroup → handler dipilih di parser.
+
+    Aturan pola:
+    - diawali satu karakter literal: "\n" untuk rule awal baris (startswith),
+      atau huruf pertama kata kunci untuk rule "kata kunci di mana saja di baris"
+      Kata kunci yang selalu jadi token pertama baris ditulis literal setelah "\n[ \t]*";
+      lookahead "\n(?=[^\n]*kata kunci)" menyapu tiap baris dua kali, pakai hanya kalau
+      posisi kata kunci di baris memang tidak tetap.
+      Karakter pertama ini ditaruh di luar group rule supaya regex bisa lompat
+      langsung ke kandidat posisi (prefix/charset scan) tanpa mencoba tiap karakter.
+    - menghabiskan sisa baris ([^\n]*) → satu baris hanya memicu satu rule.
+    - urutan rule = prioritas (alternasi dicoba dari kiri), seperti rantai if/elif.
+    - group di dalam pola bernama (?P<...>), unik, dan tidak sama dengan nama rule.
+    """
+
+    def __init__(self, rules):
+        self.rules = [name for name, _ in rules]
+        branches = []
+        for name, pattern in rules:
+            n = 2 if pattern.startswith("\\") else 1
+            branches.append(f"{pattern[:n]}(?P<{name}>{pattern[n:]})")
+        self.regex = re.compile("|".join(branches), re.M)
+        # versi bytes: dipakai langsung di atas mmap / bytes file tanpa decode seluruh output
+        self.regex_bytes = re.compile("|".join(branches).encode(), re.M)
+
+    def scan(self, text):
+        """Yield (nama rule, match) sesuai urutan baris; text = str atau bytes-like (bytes, mmap)"""
+        if not isinstance(text, str):
+            yield from self._scan_bytes(text)
+            return
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        # "\n" di depan supaya baris pertama juga dianggap awal baris
+        for m in self.regex.finditer("\n" + text):
+            yield m.lastgroup, m
+
+    def _scan_bytes(self, buf):
+        """
+        Scan zero-copy: finditer langsung di buffer. Hanya baris pertama yang disalin
+        (diberi "\n" di depan), sisanya dicocokkan mulai dari "\n" pertama di buffer.
+        Group di-decode per match → handler tetap menerima str.
+        """
+        if buf.find(b"\r") != -1:
+            yield from self.scan(bytes(buf).decode())   # CRLF jarang → jalur str biasa
+            return
+        nl = buf.find(b"\n")
+        if nl == -1:
+            nl = len(buf)
+        for m in self.regex_bytes.finditer(b"\n" + buf[:nl]):
+            yield m.lastgroup, _BytesMatch(m)
+        for m in self.regex_bytes.finditer(buf, nl):
+            yield m.lastgroup, _BytesMatch(m)
+
+
+class _BytesMatch:
+    """Match bytes → group() mengembalikan str seperti match di jalur str"""
+    __slots__ = ("_m",)
+
+    def __init__(self, m):
+        self._m = m
+
+    def group(self, name=0):
+        value = self._m.group(name)
+        return None if value is None else value.decode()
+
+
+# ====== INPUT FILE ====== #
+# Output lebih kecil dari ini cukup dibaca biasa (mmap + munmap lebih mahal dari read kecil)
+BATAS_MMAP = 1 << 20
+
+
+@contextmanager
+def buka_output(path):
+    """
+    Isi file rawdata sebagai bytes-like untuk Grammar.scan:
+    file besar → mmap read-only (zero-copy, tidak ada str/list baris sebesar file),
+    file kecil → bytes hasil read. FileNotFoundError diteruskan.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < BATAS_MMAP:
+            yield f.read()
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def parse_file(parse_fn, path):
+    """parse_fn langsung di atas isi file (lihat buka_output)"""
+    with buka_output(path) as data:
+        return parse_fn(data)
+
+
+_SP = r"[ \t]"
+_LINE = r"[^\n]"
+_INTF = r"(?:FastEthernet|GigabitEthernet|Loopback)"
+
+
+# ====== GRAMMAR PER COMMAND ====== #
+# === show run | section interface === #
+CONFIG_INTERFACE = Grammar([
+    ("interface", rf"\n{_SP}*interface\S*{_SP}+(?P<intf>\S+){_LINE}*"),
+    ("ip_address", rf"\n{_SP}*ip address{_SP}+(?P<ip>\S+){_SP}+(?P<subnet>\S+){_LINE}*"),
+    ("auth_key", rf"\n{_SP}*ip ospf authentication-key(?:{_LINE}*{_SP})?(?P<key>\S+){_SP}*$"),
+    ("md5_key", rf"\n{_SP}*ip ospf message-digest-key{_SP}+(?P<key_id>\S+)"
+                rf"(?:{_SP}+\S+)*?{_SP}+(?P<key_val>\S+){_SP}*$"),
+    ("auth", rf"\n{_SP}*ip ospf authentication{_LINE}*"),
+])
+
+# === show interfaces === #
+SHOW_INTERFACES = Grammar([
+    ("header", rf"\n(?P<intf>{_INTF}\S*){_LINE}*"),
+    ("mtu_line", rf"MTU (?P<mtu>\d+) bytes{_LINE}*"),
+])
+
+# === show ip ospf interface === #
+OSPF_INTERFACE = Grammar([
+    ("header", rf"\n(?P<intf>{_INTF}\S*){_LINE}*"),
+    ("internet_address", rf"Internet Address{_LINE}*?Area (?P<area>\d+){_LINE}*"),
+    ("timer", rf"Timer intervals{_LINE}*?Hello (?P<hello>\d+){_LINE}*?Dead (?P<dead>\d+){_LINE}*"),
+    ("network_type", rf"Network Type (?P<net_type>\S+){_LINE}*"),
+    ("simple", rf"Simple password authentication enabled{_LINE}*"),
+    ("md5", rf"Message digest authentication enabled{_LINE}*"),
+])
+
+# === show run | section router ospf === #
+OSPF_CONFIG = Grammar([
+    ("router_id", rf"\n{_SP}*router-id{_SP}+(?P<rid>\S+){_LINE}*"),
+    ("redistribute", rf"\n{_SP}*redistribute eigrp(?P<redist>{_LINE}*)"),
+    ("passive", rf"\n{_SP}*passive-interface{_SP}+(?P<intf>\S+){_LINE}*"),
+])
+
+# === show cdp neighbor === #
+CDP_NEIGHBOR = Grammar([
+    ("neighbor", rf"\n(?=\S+\.cisco)(?P<device>[^.\s]*){_LINE}*"),
+])
+
+# === show ip protocols === #
+IP_PROTOCOLS = Grammar([
+    ("protocol", rf"\n{_SP}*Routing Protocol is(?P<proto>{_LINE}*)"),
+    ("redistribute", rf"\n{_SP}*Redistributing(?P<redist>{_LINE}*)"),
+    ("router_id", rf"\n(?={_LINE}*Router ID){_LINE}*"),
+])
+
+
+# ====== PARSER (hasil identik dengan 05_Benchmark/parser_referensi.py) ====== #
+def parse_config_interface(config_output):
+    """Parse 'show run | section interface' → ambil IP & OSPF auth key"""
+    interfaces = {}
+    current = None
+
+    for rule, m in CONFIG_INTERFACE.scan(config_output):
+        if rule == "interface":
+            current = interfaces[m.group("intf")] = {}
+        elif current is None:
+            continue
+        elif rule == "ip_address":
+            current["ip"] = m.group("ip")
+            current["subnet"] = m.group("subnet")
+        elif rule == "auth_key":
+            current.setdefault("ospf", {"auth_key": {}})["auth_key"] = {"simple": m.group("key")}
+        elif rule == "md5_key":
+            current.setdefault("ospf", {"auth_key": {}})["auth_key"][m.group("key_id")] = m.group("key_val")
+        else:
+            current.setdefault("ospf", {}).setdefault("auth_key", {})
+
+    return interfaces
+
+
+def parse_show_interfaces(interfaces_output):
+    """Parse 'show interfaces' → ambil MTU"""
+    mtu_data = {}
+    current = None
+
+    for rule, m in SHOW_INTERFACES.scan(interfaces_output):
+        if rule == "header":
+            current = m.group("intf")
+        elif current:
+            mtu_data[current] = int(m.group("mtu"))
+    return mtu_data
+
+
+def parse_show_ip_ospf_interface(ospf_output):
+    """Parse 'show ip ospf interface' → area, hello/dead, net type, ospf auth"""
+    ospf_data = {}
+    current = None
+
+    for rule, m in OSPF_INTERFACE.scan(ospf_output):
+        if rule == "header":
+            current = ospf_data[m.group("intf")] = {"ospf auth": "none"}
+        elif current is None:
+            continue
+        elif rule == "internet_address":
+            current["area"] = int(m.group("area"))
+        elif rule == "timer":
+            current["Hello"] = int(m.group("hello"))
+            current["Dead"] = int(m.group("dead"))
+        elif rule == "network_type":
+            current["Network Type"] = m.group("net_type").rstrip(",").capitalize()
+        elif rule == "simple":
+            current["ospf auth"] = "simple"
+        else:
+            current["ospf auth"] = "message-digest"
+
+    return ospf_data
+
+
+def parse_show_run_ospf_config(ospf_config_output):
+    """Parse 'show run | section router ospf' → router-id, redistribute, passive"""
+    router_id = None
+    redistribute = False
+    passive = []
+
+    for rule, m in OSPF_CONFIG.scan(ospf_config_output):
+        if rule == "router_id":
+            router_id = m.group("rid")
+        elif rule == "redistribute":
+            redistribute = "subnets" in m.group("redist")
+        else:
+            passive.append(m.group("intf"))
+
+    return router_id, redistribute, passive
+
+
+def parse_show_cdp_neighbor(cdp_output):
+    """Parse 'show cdp neighbor' → neighbor mapping"""
+    neighbors = {}
+    for _, m in CDP_NEIGHBOR.scan(cdp_output):
+        parts = m.group("neighbor").split()
+        # Normalisasi nama lewat tabel kanonik (Fas/Gig/Ten/Se/Po... → nama lengkap)
+        local_intf = lengkap(parts[1]) + parts[2]           # contoh: Fas 2/0 → FastEthernet2/0
+        port_id = lengkap(parts[-2]) + " " + parts[-1]      # contoh: Fas 0/1 → FastEthernet 0/1
+
+        neighbors[local_intf] = {
+            "router": m.group("device"),
+            "interface": port_id
+        }
+    return neighbors
+
+
+def parse_show_ip_protocols(proto_output):
+    """Parse 'show ip protocols' → routing protocols, redistribute, router-id"""
+    protocols = []
+    redistribute = False
+    router_id = None
+
+    for rule, m in IP_PROTOCOLS.scan(proto_output):
+        if rule == "protocol":
+            proto = m.group("proto")
+            if "ospf" in proto and "ospf" not in protocols:
+                protocols.append("ospf")
+            if "eigrp" in proto and "eigrp" not in protocols:
+                protocols.append("eigrp")
+        elif rule == "redistribute":
+            redistribute = "subnets" in m.group("redist")
+        else:
+            router_id = m.group(0).split()[-1]
+
+    return protocols, redistribute, router_id
@@ -0,0 +1,112 @@
+import json
+import os
+import threading
+import time
+import zlib
+from contextlib import nullcontext
+
+from aimd import AIMDLimiter
+from ssh_pool import AdminSessionPool, JumpHostDown
+
+
+def load_jump_hosts(path, default_device):
+    """
+    Baca inventory jump host (01_Isi Manual/jump_hosts.json):
+    {
+        "jump_hosts": {"admin1": {"host": "192.168.6.100"}, "admin2": {"host": "192.168.6.101"}},
+        "mapping": {"R1": "admin2"}      # opsional, sisanya dibagi pakai hash
+    }
+    Field yang tidak diisi (username, password, device_type) ikut default_device.
+    File tidak ada → satu jump host = default_device.
+    """
+    if not os.path.exists(path):
+        return {"admin": dict(default_device)}, {}
+    with open(path) as f:
+        data = json.load(f)
+    hosts = {name: {**default_device, **device} for name, device in data["jump_hosts"].items()}
+    mapping = data.get("mapping", {})
+    for router_name, host in mapping.items():
+        if host not in hosts:
+            raise ValueError(f"mapping {router_name} → {host}: jump host tidak ada di jump_hosts")
+    return hosts, mapping
+
+
+class ShardedPools:
+    """
+    Satu AdminSessionPool (+ AIMDLimiter opsional) per jump host.
+    Router dibagi ke jump host lewat mapping eksplisit atau hash nama router;
+    kalau jump host utama tidak bisa dihubungi, router pindah (failover) ke
+    jump host berikutnya di ring. Jump host yang down dicoba lagi setelah `retry_down` detik.
+    """
+
+    def __init__(self, jump_hosts, size=5, mapping=None, adaptive=False, initial=5, retry_down=30.0,
+                 telemetry=None, connect=None):
+        self.names = sorted(jump_hosts)
+        self.mapping = mapping or {}
+        self.retry_down = retry_down
+        self.pools = {name: AdminSessionPool(device, size=size, connect=connect) for name, device in jump_hosts.items()}
+        self.limiters = {}
+        if adaptive:
+            self.limiters = {name: AIMDLimiter(initial=min(initial, size), maximum=size) for name in jump_hosts}
+        self.telemetry = telemetry
+        self._down = {}
+        self._lock = threading.Lock()
+
+    def utama(self, router_name):
+        """Jump host utama untuk router (mapping eksplisit, kalau tidak ada → hash stabil)"""
+        if router_name in self.mapping:
+            return self.mapping[router_name]
+        return self.names[zlib.crc32(router_name.encode()) % len(self.names)]
+
+    def urutan(self, router_name):
+        """Jump host utama lalu sisanya searah ring; yang sedang down ditaruh paling belakang"""
+        i = self.names.index(self.utama(router_name))
+        ring = self.names[i:] + self.names[:i]
+        now = time.monotonic()
+        with self._lock:
+            hidup = [h for h in ring if now - self._down.get(h, -self.retry_down) >= self.retry_down]
+        return hidup + [h for h in ring if h not in hidup]
+
+    def tandai_down(self, host):
+        with self._lock:
+            self._down[host] = time.monotonic()
+
+    def jalankan(self, router_name, fn):
+        """
+        Jalankan fn(admin_conn, rec) lewat jump host router ini, failover kalau jump host down.
+        rec = record Telemetry untuk percobaan ini (None kalau telemetry tidak aktif).
+        """
+        error = None
+        for host in self.urutan(router_name):
+            limiter = self.limiters.get(host)
+            rec = self.telemetry.record(router_name) if self.telemetry else None
+            try:
+                with limiter.slot() if limiter else nullcontext():
+                    t0 = time.perf_counter()
+                    with self.pools[host].session() as admin_conn:
+                        if rec is not None:
+                            rec["jump_host"] = host
+                            rec["connect_s"] = round(time.perf_counter() - t0, 4)
+                        hasil = fn(admin_conn, rec)
+                    if rec is not None:
+                        rec["total_s"] = round(time.perf_counter() - t0, 4)
+                        rec["status"] = "ok"
+                    return hasil
+            except JumpHostDown as e:
+                self.tandai_down(host)
+                print(f"[!] Jump host {host} down ({e}) → {router_name} dialihkan")
+                error = e
+                if rec is not None:
+                    rec["status"] = f"jump host down: {e}"
+            except Exception as e:
+                if rec is not None:
+                    rec["status"] = f"error: {e}"
+                raise
+        raise error
+
+    def laporan(self):
+        return [f"{limiter.laporan()} [{name}]" for name, limiter in self.limiters.items()]
+
+    def close(self):
+        for pool in self.pools.values():
+            pool.close()
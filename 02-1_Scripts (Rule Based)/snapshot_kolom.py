@@ -0,0 +1,404 @@
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from contextlib import contextmanager
+
+from nama_interface import id_interface
+from topologi_model import AuthType, NetworkType, load_topologi, load_topologi_stream
+
+# ====== FORMAT topologi_N.kolom ====== #
+# [magic 8B][versi u32][panjang header u32][header JSON][pad 8B][kolom 1][pad]...[kolom n]
+#
+# Header JSON: jumlah baris + {nama kolom: [typecode array, offset, jumlah item]}.
+# Semua kolom = array fixed-width (byteorder mesin penulis, dicatat di header) yang
+# dibaca langsung dari mmap via memoryview.cast → tidak ada parsing saat load.
+# String di-dictionary-encode: kolom string berisi kode int32 ke tabel string
+# (offset int64 + blob UTF-8), -1 = None. Kode sama ⇔ string sama.
+#
+# Tabel router (satu baris per router, urutan = urutan JSON):
+#   r_name, r_router_id, r_protocols (protocol digabung ","), r_redistribute,
+#   r_intf_start, r_intf_count (rentang baris di tabel interface)
+# Tabel interface (urutan = urutan JSON, dikelompokkan per router):
+#   i_router, i_name, i_ip, i_subnet, i_mtu, i_ospf (0/1), i_auth_key (JSON dict),
+#   i_auth, i_area, i_network_type, i_hello, i_dead, i_passive (-1/0/1),
+#   i_nbr_router, i_nbr_intf,
+#   i_link = baris interface neighbor yang cocok (nama kanonik, pertama ketemu),
+#            -1 kalau neighbor/interface-nya tidak ada di topologi
+MAGIC = b"TOPOKOL\x00"
+VERSI = 1
+_PREFIX = struct.Struct("<8sII")
+
+# JSON lebih besar dari ini di-load streaming (per router) alih-alih json.load sekaligus
+BATAS_STREAM = 64 << 20
+
+KOLOM_ROUTER = (
+    ("r_name", "i"), ("r_router_id", "i"), ("r_protocols", "i"), ("r_redistribute", "b"),
+    ("r_intf_start", "i"), ("r_intf_count", "i"),
+)
+KOLOM_INTERFACE = (
+    ("i_router", "i"), ("i_name", "i"), ("i_ip", "i"), ("i_subnet", "i"), ("i_mtu", "i"),
+    ("i_ospf", "b"), ("i_auth_key", "i"), ("i_auth", "i"), ("i_area", "i"), ("i_network_type", "i"),
+    ("i_hello", "i"), ("i_dead", "i"), ("i_passive", "b"),
+    ("i_nbr_router", "i"), ("i_nbr_intf", "i"), ("i_link", "i"),
+)
+
+
+def path_kolom(json_path):
+    """topologi_N.json → topologi_N.kolom (di folder yang sama)"""
+    return os.path.splitext(json_path)[0] + ".kolom"
+
+
+def _int(value):
+    return -1 if value is None else value
+
+
+def _bool(value):
+    return -1 if value is None else int(value)
+
+
+# ====== TULIS ====== #
+def tulis_kolom(routers, path):
+    """{nama: Router} (topologi_model) → file .kolom (ditulis atomik lewat file .tmp)"""
+    strings = {}
+
+    def kode(value):
+        if value is None:
+            return -1
+        if value not in strings:
+            strings[value] = len(strings)
+        return strings[value]
+
+    kol = {name: array(tc) for name, tc in KOLOM_ROUTER + KOLOM_INTERFACE}
+
+    # --- baris interface per (router, nama) & per (router, id nama kanonik) untuk i_link ---
+    baris = {}
+    baris_id = {}
+    for rname, r in routers.items():
+        for iname, intf in r.interfaces.items():
+            baris[(rname, iname)] = len(baris)
+            baris_id.setdefault((rname, intf.id), baris[(rname, iname)])
+
+    for ri, (rname, r) in enumerate(routers.items()):
+        kol["r_name"].append(kode(rname))
+        kol["r_router_id"].append(kode(r.router_id))
+        kol["r_protocols"].append(kode(",".join(r.protocols)))
+        kol["r_redistribute"].append(int(bool(r.redistribute)))
+        kol["r_intf_start"].append(len(kol["i_name"]))
+        kol["r_intf_count"].append(len(r.interfaces))
+
+        for iname, intf in r.interfaces.items():
+            ospf = intf.ospf
+            nbr = intf.neighbor
+            kol["i_router"].append(ri)
+            kol["i_name"].append(kode(iname))
+            kol["i_ip"].append(kode(intf.ip))
+            kol["i_subnet"].append(kode(intf.subnet))
+            kol["i_mtu"].append(_int(intf.mtu))
+            kol["i_ospf"].append(0 if ospf is None else 1)
+            kol["i_auth_key"].append(-1 if ospf is None or ospf.auth_key is None
+                                     else kode(json.dumps(ospf.auth_key)))
+            kol["i_auth"].append(-1 if ospf is None else kode(ospf.auth))
+            kol["i_area"].append(-1 if ospf is None else _int(ospf.area))
+            kol["i_network_type"].append(-1 if ospf is None else kode(ospf.network_type))
+            kol["i_hello"].append(-1 if ospf is None else _int(ospf.hello))
+            kol["i_dead"].append(-1 if ospf is None else _int(ospf.dead))
+            kol["i_passive"].append(-1 if ospf is None else _bool(ospf.passive))
+            kol["i_nbr_router"].append(-1 if nbr is None else kode(nbr.router))
+            kol["i_nbr_intf"].append(-1 if nbr is None else kode(nbr.interface))
+            kol["i_link"].append(-1 if nbr is None
+                                 else baris_id.get((nbr.router, nbr.interface_id), -1))
+
+    # --- tabel string ---
+    blob = bytearray()
+    offsets = array("q", [0])
+    for s in strings:
+        blob += str(s).encode("utf-8")
+        offsets.append(len(blob))
+    kol["str_offsets"] = offsets
+    kol["str_blob"] = array("B", blob)
+
+    # --- susun header: offset kolom dihitung setelah panjang header diketahui ---
+    def susun(data_start):
+        layout = {}
+        pos = data_start
+        for name, arr in kol.items():
+            pos = (pos + 7) & ~7
+            layout[name] = [arr.typecode, pos, len(arr)]
+            pos += len(arr) * arr.itemsize
+        return json.dumps({"byteorder": sys.byteorder, "n_router": len(routers), "n_interface": len(baris),
+                           "n_string": len(strings), "kolom": layout}).encode("utf-8")
+
+    header = susun(0)
+    while True:
+        data_start = (_PREFIX.size + len(header) + 7) & ~7
+        baru = susun(data_start)
+        if len(baru) == len(header):
+            break
+        header = baru
+    header = baru
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_PREFIX.pack(MAGIC, VERSI, len(header)))
+        f.write(header)
+        for name, arr in kol.items():
+            f.write(b"\0" * (((f.tell() + 7) & ~7) - f.tell()))
+            f.write(arr.tobytes())
+    os.replace(tmp, path)
+
+
+# ====== BACA (mmap, lazy) ====== #
+class KolomSnapshot:
+    """
+    File .kolom yang di-mmap. Kolom numerik dibaca langsung dari page cache;
+    string baru di-decode saat dipakai (lalu di-cache per kode).
+    close() / blok with melepas mmap; view (RouterView dkk.) tidak bisa dipakai lagi setelahnya.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, versi, n_header = _PREFIX.unpack_from(self._mm, 0)
+        if magic != MAGIC or versi != VERSI:
+            raise ValueError(f"{path} bukan file .kolom versi {VERSI}")
+        header = json.loads(self._mm[_PREFIX.size:_PREFIX.size + n_header])
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError(f"{path} ditulis dengan byteorder {header['byteorder']}")
+
+        self.n_router = header["n_router"]
+        self.n_interface = header["n_interface"]
+        buf = memoryview(self._mm)
+        self.kolom = {}
+        for name, (tc, offset, n) in header["kolom"].items():
+            size = array(tc).itemsize
+            self.kolom[name] = buf[offset:offset + n * size].cast(tc)
+        self._teks = [None] * header["n_string"]
+        self._buf = buf
+
+    def close(self):
+        """Lepas memoryview kolom lalu tutup mmap (aman dipanggil berkali-kali)"""
+        if self._mm.closed:
+            return
+        for col in self.kolom.values():
+            col.release()
+        self._buf.release()
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def teks(self, code):
+        """Kode string → str (None untuk -1)"""
+        if code < 0:
+            return None
+        s = self._teks[code]
+        if s is None:
+            off = self.kolom["str_offsets"]
+            s = self._teks[code] = sys.intern(str(self.kolom["str_blob"][off[code]:off[code + 1]], "utf-8"))
+        return s
+
+    def routers(self):
+        """{nama: RouterView} — API sama dengan {nama: Router} dari topologi_model"""
+        names = self.kolom["r_name"]
+        return {self.teks(names[r]): RouterView(self, r) for r in range(self.n_router)}
+
+    def interface(self, i):
+        return InterfaceView(self, i)
+
+
+class RouterView:
+    __slots__ = ("_s", "_r", "_interfaces")
+
+    def __init__(self, snap, r):
+        self._s = snap
+        self._r = r
+        self._interfaces = None
+
+    @property
+    def snapshot(self):
+        """KolomSnapshot asal (untuk engine yang membaca kolom langsung)"""
+        return self._s
+
+    @property
+    def name(self):
+        return self._s.teks(self._s.kolom["r_name"][self._r])
+
+    @property
+    def router_id(self):
+        return self._s.teks(self._s.kolom["r_router_id"][self._r])
+
+    @property
+    def protocols(self):
+        joined = self._s.teks(self._s.kolom["r_protocols"][self._r])
+        return tuple(joined.split(",")) if joined else ()
+
+    @property
+    def redistribute(self):
+        return self._s.kolom["r_redistribute"][self._r] == 1
+
+    @property
+    def interfaces(self):
+        if self._interfaces is None:
+            s = self._s
+            start = s.kolom["r_intf_start"][self._r]
+            names = s.kolom["i_name"]
+            self._interfaces = {s.teks(names[i]): InterfaceView(s, i)
+                                for i in range(start, start + s.kolom["r_intf_count"][self._r])}
+        return self._interfaces
+
+
+class InterfaceView:
+    __slots__ = ("_s", "_i")
+
+    def __init__(self, snap, i):
+        self._s = snap
+        self._i = i
+
+    @property
+    def name(self):
+        return self._s.teks(self._s.kolom["i_name"][self._i])
+
+    @property
+    def id(self):
+        return id_interface(self.name)
+
+    @property
+    def router_name(self):
+        return self._s.teks(self._s.kolom["r_name"][self._s.kolom["i_router"][self._i]])
+
+    @property
+    def ip(self):
+        return self._s.teks(self._s.kolom["i_ip"][self._i])
+
+    @property
+    def subnet(self):
+        return self._s.teks(self._s.kolom["i_subnet"][self._i])
+
+    @property
+    def mtu(self):
+        mtu = self._s.kolom["i_mtu"][self._i]
+        return None if mtu < 0 else mtu
+
+    @property
+    def ospf(self):
+        return OspfView(self._s, self._i) if self._s.kolom["i_ospf"][self._i] else None
+
+    @property
+    def neighbor(self):
+        return None if self._s.kolom["i_nbr_router"][self._i] < 0 else NeighborView(self._s, self._i)
+
+    @property
+    def link(self):
+        """InterfaceView neighbor yang cocok (sudah di-resolve saat tulis) / None"""
+        j = self._s.kolom["i_link"][self._i]
+        return None if j < 0 else InterfaceView(self._s, j)
+
+
+class OspfView:
+    __slots__ = ("_s", "_i")
+
+    def __init__(self, snap, i):
+        self._s = snap
+        self._i = i
+
+    def _int(self, name):
+        value = self._s.kolom[name][self._i]
+        return None if value < 0 else value
+
+    @property
+    def auth_key(self):
+        raw = self._s.teks(self._s.kolom["i_auth_key"][self._i])
+        return None if raw is None else json.loads(raw)
+
+    @property
+    def auth(self):
+        value = self._s.teks(self._s.kolom["i_auth"][self._i])
+        return None if value is None else AuthType(value)
+
+    @property
+    def area(self):
+        return self._int("i_area")
+
+    @property
+    def network_type(self):
+        value = self._s.teks(self._s.kolom["i_network_type"][self._i])
+        return None if value is None else NetworkType(value)
+
+    @property
+    def hello(self):
+        return self._int("i_hello")
+
+    @property
+    def dead(self):
+        return self._int("i_dead")
+
+    @property
+    def passive(self):
+        value = self._s.kolom["i_passive"][self._i]
+        return None if value < 0 else value == 1
+
+
+class NeighborView:
+    __slots__ = ("_s", "_i")
+
+    def __init__(self, snap, i):
+        self._s = snap
+        self._i = i
+
+    @property
+    def router(self):
+        return self._s.teks(self._s.kolom["i_nbr_router"][self._i])
+
+    @property
+    def interface(self):
+        return self._s.teks(self._s.kolom["i_nbr_intf"][self._i])
+
+    @property
+    def interface_id(self):
+        return id_interface(self.interface)
+
+
+# ====== LOAD: .kolom kalau ada, selain itu JSON ====== #
+def _kolom_terbaru(json_path, st):
+    """topologi_N.kolom kalau ada dan tidak lebih tua dari JSON-nya, selain itu None"""
+    kolom = path_kolom(json_path)
+    try:
+        return kolom if os.stat(kolom).st_mtime_ns >= st.st_mtime_ns else None
+    except FileNotFoundError:
+        return None
+
+
+def load_snapshot(json_path):
+    """
+    {nama: Router/RouterView} untuk topologi_N.json. Kalau topologi_N.kolom ada dan
+    tidak lebih tua dari JSON-nya, pakai .kolom (mmap) → tanpa json.load.
+    JSON yang sangat besar (> BATAS_STREAM) di-decode per router (load_topologi_stream):
+    hasilnya tetap dict semua Router, yang dihemat hanya teks JSON & pohon dict utuh.
+    mmap .kolom baru dilepas saat view-nya di-GC; runner yang membuka banyak snapshot
+    sebaiknya pakai buka_snapshot.
+    """
+    st = os.stat(json_path)
+    kolom = _kolom_terbaru(json_path, st)
+    if kolom is not None:
+        return KolomSnapshot(kolom).routers()
+    if st.st_size > BATAS_STREAM:
+        return load_topologi_stream(json_path)
+    return load_topologi(json_path)
+
+
+@contextmanager
+def buka_snapshot(json_path):
+    """load_snapshot dalam blok with: mmap .kolom ditutup begitu blok selesai"""
+    st = os.stat(json_path)
+    kolom = _kolom_terbaru(json_path, st)
+    if kolom is None:
+        yield load_topologi_stream(json_path) if st.st_size > BATAS_STREAM else load_topologi(json_path)
+        return
+    with KolomSnapshot(kolom) as snap:
+        yield snap.routers()
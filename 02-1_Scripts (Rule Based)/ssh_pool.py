@@ -0,0 +1,150 @@
+import threading
+import time
+from contextlib import contextmanager
+
+
+class JumpHostDown(ConnectionError):
+    """Gagal membuka sesi ke router admin (jump host) itu sendiri, bukan ke router target"""
+
+
+# ====== NESTED SSH HELPER ====== #
+def masuk_router(admin_conn, mgmt_ip, username="cisco", password="cisco"):
+    """Nested SSH dari router admin ke router target + disable paging"""
+    admin_conn.write_channel(f"ssh -l {username} {mgmt_ip}\n")
+    admin_conn.read_until_pattern("Password:")
+    admin_conn.write_channel(f"{password}\n")
+    admin_conn.read_until_pattern(r"#")
+
+    admin_conn.write_channel("terminal length 0\n")
+    admin_conn.read_until_pattern(r"#")
+
+
+def keluar_router(admin_conn):
+    """Exit dari router target → kembali ke prompt router admin"""
+    admin_conn.write_channel("exit\n")
+    admin_conn.read_until_pattern(r"#")
+
+
+# ====== SESSION POOL ====== #
+class AdminSessionPool:
+    """
+    Pool berisi N sesi SSH 'hangat' ke router admin (jump host).
+    Worker meminjam satu sesi, melakukan nested SSH ke router target,
+    lalu mengembalikannya → handshake ke router admin hanya dibayar N kali.
+    """
+
+    def __init__(self, device, size=5, connect=None):
+        if connect is None:
+            from netmiko import ConnectHandler
+            connect = ConnectHandler
+
+        self.device = device
+        self.size = size
+        self._connect = connect
+        # _opened (sesi hidup, idle + dipinjam) dan _idle (LIFO) dijaga satu Condition:
+        # setiap sesi dikembalikan / dibuang → satu penunggu dibangunkan
+        self._cond = threading.Condition()
+        self._idle = []
+        self._opened = 0
+        self._closed = False
+
+    def _open(self):
+        try:
+            conn = self._connect(**self.device)
+            conn.find_prompt()
+        except Exception as e:
+            raise JumpHostDown(f"{self.device.get('host')}: {e}") from e
+        return conn
+
+    def _sehat(self, conn):
+        """Cek sesi masih hidup (sesi idle bisa diputus oleh exec-timeout VTY)"""
+        try:
+            return conn.is_alive()
+        except Exception:
+            return False
+
+    def _buang(self, conn):
+        """Tutup sesi rusak; slotnya kosong lagi → bangunkan penunggu supaya bisa buka sesi baru"""
+        with self._cond:
+            self._opened -= 1
+            self._cond.notify()
+        try:
+            conn.disconnect()
+        except Exception:
+            pass
+
+    def acquire(self, timeout=None):
+        """
+        Ambil sesi idle; buka sesi baru kalau pool belum penuh, selain itu tunggu sampai
+        ada sesi yang dikembalikan atau dibuang. TimeoutError kalau lewat `timeout` detik.
+        """
+        batas = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Pool sudah ditutup")
+                    if self._idle:
+                        conn = self._idle.pop()
+                        break
+                    if self._opened < self.size:
+                        self._opened += 1
+                        conn = None
+                        break
+                    sisa = None if batas is None else batas - time.monotonic()
+                    if sisa is not None and sisa <= 0:
+                        raise TimeoutError(f"{self.device.get('host')}: tidak ada sesi bebas dalam {timeout}s")
+                    self._cond.wait(sisa)
+
+            if conn is None:
+                try:
+                    return self._open()
+                except Exception:
+                    with self._cond:
+                        self._opened -= 1
+                        self._cond.notify()
+                    raise
+            if self._sehat(conn):
+                return conn
+            self._buang(conn)
+
+    def release(self, conn, broken=False):
+        """Kembalikan sesi ke pool; sesi rusak langsung dibuang"""
+        with self._cond:
+            if not (broken or self._closed):
+                self._idle.append(conn)
+                self._cond.notify()
+                return
+        self._buang(conn)
+
+    @contextmanager
+    def session(self, timeout=None):
+        conn = self.acquire(timeout=timeout)
+        try:
+            yield conn
+        except Exception:
+            # Posisi channel tidak jelas (bisa masih di router target) → jangan dipakai ulang
+            self.release(conn, broken=True)
+            raise
+        else:
+            self.release(conn)
+
+    def warm_up(self):
+        """Buka semua sesi di awal supaya worker pertama tidak menunggu handshake"""
+        conns = [self.acquire() for _ in range(self.size)]
+        for conn in conns:
+            self.release(conn)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()     # penunggu acquire → RuntimeError, tidak menggantung
+        for conn in idle:
+            self._buang(conn)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
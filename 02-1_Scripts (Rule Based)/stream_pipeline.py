@@ -0,0 +1,63 @@
+import importlib
+import json
+import threading
+
+from topologi_model import Router
+
+# Parser & penggabungan dipakai langsung dari 2_Pembuatan_JSON.py
+pembuatan_json = importlib.import_module("2_Pembuatan_JSON")
+
+
+class StreamingParser:
+    """
+    Sink untuk collector: setiap output command langsung di-parse begitu datang,
+    lalu router digabung (gabung_router) saat keenam output lengkap.
+    Topologi JSON siap begitu router terakhir selesai, tanpa file .txt perantara.
+    Router disimpan sebagai objek topologi_model (slots) → hemat memori untuk ribuan router.
+    """
+
+    def __init__(self, commands):
+        self.commands = commands            # {cmd: folder} sama dengan collector
+        self._lock = threading.Lock()
+        self._parsed = {}                   # {router: {folder: hasil parse}}
+        self.results = {}                   # {router: Router}
+
+    def __call__(self, router_name, cmd, text):
+        folder = self.commands[cmd]
+        if not text.strip():
+            return  # output kosong = sama dengan file tidak ada
+        hasil = pembuatan_json.parse_output(folder, text)
+
+        with self._lock:
+            parsed = self._parsed.setdefault(router_name, {})
+            parsed[folder] = hasil
+            lengkap = len(parsed) == len(pembuatan_json.PARSERS)
+            if lengkap:
+                del self._parsed[router_name]
+        if lengkap:
+            entry = Router.dari_parsed(router_name, parsed)
+            with self._lock:
+                self.results[router_name] = entry
+
+    def lengkapi_dari_arsip(self, router_list, raw_dir):
+        """Router yang di-skip (incremental/resume) → ambil output yang kurang dari rawdata lama"""
+        for router_name in router_list:
+            if router_name in self.results:
+                continue
+            parsed = self._parsed.pop(router_name, {})
+            try:
+                outputs = pembuatan_json.baca_router(raw_dir, router_name)
+            except FileNotFoundError:
+                print(f"[!] File untuk {router_name} tidak lengkap, skip...")
+                continue
+            for folder, text in outputs.items():
+                if folder not in parsed:
+                    parsed[folder] = pembuatan_json.parse_output(folder, text)
+            self.results[router_name] = Router.dari_parsed(router_name, parsed)
+
+    def tulis(self, output_file, router_list):
+        # urutan router mengikuti router_list.json (sama seperti 2_Pembuatan_JSON.py)
+        hasil = {r: self.results[r].to_dict() for r in router_list if r in self.results}
+        with open(output_file, "w") as f:
+            json.dump(hasil, f, indent=4)
+        print(f"[✓] Topologi {len(hasil)} router langsung ditulis ke {output_file}")
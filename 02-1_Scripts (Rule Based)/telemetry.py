@@ -0,0 +1,66 @@
+import json
+import math
+import os
+import threading
+import time
+
+
+def persentil(values, p):
+    """Persentil nearest-rank (p dalam 0-100)"""
+    if not values:
+        return None
+    data = sorted(values)
+    k = max(0, min(len(data) - 1, math.ceil(p / 100 * len(data)) - 1))
+    return data[k]
+
+
+class Telemetry:
+    """
+    Catatan waktu koleksi per percobaan router:
+    {router, jump_host, connect_s, nested_ssh_s, commands: [{cmd, durasi_s, bytes}], total_s, status}
+    - connect_s    : waktu pinjam sesi router admin (termasuk handshake kalau sesi baru)
+    - nested_ssh_s : ssh -l cisco <ip> + login + terminal length 0
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.records = []
+        self.mulai = time.strftime("%Y-%m-%d %H:%M:%S")
+
+    def record(self, router_name):
+        rec = {"router": router_name, "commands": []}
+        with self._lock:
+            self.records.append(rec)
+        return rec
+
+    def simpan(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({"mulai": self.mulai, "selesai": time.strftime("%Y-%m-%d %H:%M:%S"),
+                       "records": self.records}, f, indent=2)
+
+    def ringkasan(self):
+        """Baris ringkasan p50/p95/p99 per tahap & per command + router paling lambat"""
+        per_tahap = {"connect": [], "nested ssh": [], "total router": []}
+        per_cmd = {}
+        for rec in self.records:
+            if "connect_s" in rec:
+                per_tahap["connect"].append(rec["connect_s"])
+            if "nested_ssh_s" in rec:
+                per_tahap["nested ssh"].append(rec["nested_ssh_s"])
+            if "total_s" in rec and rec.get("status") == "ok":
+                per_tahap["total router"].append(rec["total_s"])
+            for c in rec["commands"]:
+                per_cmd.setdefault(c["cmd"], []).append(c["durasi_s"])
+
+        baris = [f"{'tahap / command':<34}{'n':>6}{'p50':>9}{'p95':>9}{'p99':>9}{'maks':>9}"]
+        for nama, values in list(per_tahap.items()) + sorted(per_cmd.items()):
+            if not values:
+                continue
+            p50, p95, p99 = (persentil(values, p) for p in (50, 95, 99))
+            baris.append(f"{nama:<34}{len(values):>6}{p50:>9.3f}{p95:>9.3f}{p99:>9.3f}{max(values):>9.3f}")
+
+        lambat = sorted((r for r in self.records if "total_s" in r), key=lambda r: r["total_s"], reverse=True)[:5]
+        if lambat:
+            baris.append("Router paling lambat: " + ", ".join(f"{r['router']} ({r['total_s']:.2f}s)" for r in lambat))
+        return baris
@@ -0,0 +1,300 @@
+import json
+import re
+import sys
+from enum import Enum
+
+from nama_interface import id_interface
+
+
+# ====== ENUM (nilai di-intern: satu objek per nilai) ====== #
+class _InternEnum(str, Enum):
+    """
+    Enum berbasis str → tetap sama dengan string di JSON ("none" == AuthType.NONE),
+    tercetak apa adanya di f-string, dan nilai yang belum terdaftar (misal network type
+    lain dari IOS) otomatis jadi member baru alih-alih error.
+    """
+    __str__ = str.__str__
+    __format__ = str.__format__
+    __hash__ = str.__hash__
+
+    @classmethod
+    def _missing_(cls, value):
+        if not isinstance(value, str):
+            return None
+        member = str.__new__(cls, value)
+        member._name_ = value.upper()
+        member._value_ = value
+        cls._value2member_map_[value] = member
+        return member
+
+
+class AuthType(_InternEnum):
+    NONE = "none"
+    SIMPLE = "simple"
+    MESSAGE_DIGEST = "message-digest"
+
+
+class NetworkType(_InternEnum):
+    POINT_TO_POINT = "Point_to_point"
+    BROADCAST = "Broadcast"
+    NON_BROADCAST = "Non_broadcast"
+    POINT_TO_MULTIPOINT = "Point_to_multipoint"
+    LOOPBACK = "Loopback"
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+# ====== MODEL ====== #
+class Neighbor:
+    __slots__ = ("router", "interface", "interface_id")
+
+    def __init__(self, router, interface):
+        self.router = _intern(router)
+        self.interface = _intern(interface)
+        self.interface_id = id_interface(interface)     # "FastEthernet 0/1" → id sama dengan FastEthernet0/1
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(d["router"], d["interface"])
+
+    def to_dict(self):
+        return {"router": self.router, "interface": self.interface}
+
+
+class OspfAttrs:
+    """Atribut OSPF satu interface; None = key tidak ada di JSON"""
+    __slots__ = ("auth_key", "auth", "area", "network_type", "hello", "dead", "passive")
+
+    # (key JSON, atribut) — urutan = urutan key yang dihasilkan 2_Pembuatan_JSON.py
+    FIELDS = (
+        ("auth_key", "auth_key"),
+        ("ospf auth", "auth"),
+        ("area", "area"),
+        ("Network Type", "network_type"),
+        ("Hello", "hello"),
+        ("Dead", "dead"),
+        ("passive", "passive"),
+    )
+
+    def __init__(self, auth_key=None, auth=None, area=None, network_type=None, hello=None, dead=None, passive=None):
+        self.auth_key = auth_key
+        self.auth = None if auth is None else AuthType(auth)
+        self.area = area
+        self.network_type = None if network_type is None else NetworkType(network_type)
+        self.hello = hello
+        self.dead = dead
+        self.passive = passive
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(*(d.get(key) for key, _ in cls.FIELDS))
+
+    def to_dict(self):
+        hasil = {}
+        for key, attr in self.FIELDS:
+            value = getattr(self, attr)
+            if value is not None:
+                hasil[key] = value
+        return hasil
+
+
+class Interface:
+    __slots__ = ("name", "id", "ip", "subnet", "mtu", "ospf", "neighbor")
+
+    def __init__(self, name, ip=None, subnet=None, mtu=None, ospf=None, neighbor=None):
+        self.name = _intern(name)
+        self.id = id_interface(name)    # id nama kanonik (nama_interface) untuk join antar router
+        self.ip = ip
+        self.subnet = subnet
+        self.mtu = mtu
+        self.ospf = ospf            # OspfAttrs / None (interface tanpa OSPF)
+        self.neighbor = neighbor    # Neighbor / None
+
+    @classmethod
+    def from_dict(cls, name, d):
+        ospf = d.get("ospf")
+        neighbor = d.get("neighbor")
+        return cls(name, d.get("ip"), d.get("subnet"), d.get("MTU"),
+                   None if ospf is None else OspfAttrs.from_dict(ospf),
+                   None if neighbor is None else Neighbor.from_dict(neighbor))
+
+    def to_dict(self):
+        hasil = {}
+        if self.ip is not None:
+            hasil["ip"] = self.ip
+        if self.subnet is not None:
+            hasil["subnet"] = self.subnet
+        # blok ospf dari config (ada auth_key) dibuat parser sebelum MTU ditambahkan
+        ospf_dulu = self.ospf is not None and self.ospf.auth_key is not None
+        if ospf_dulu:
+            hasil["ospf"] = self.ospf.to_dict()
+        if self.mtu is not None:
+            hasil["MTU"] = self.mtu
+        if self.ospf is not None and not ospf_dulu:
+            hasil["ospf"] = self.ospf.to_dict()
+        if self.neighbor is not None:
+            hasil["neighbor"] = self.neighbor.to_dict()
+        return hasil
+
+
+class Router:
+    __slots__ = ("name", "router_id", "interfaces", "protocols", "redistribute")
+
+    def __init__(self, name, router_id=None, interfaces=None, protocols=(), redistribute=False):
+        self.name = _intern(name)
+        self.router_id = router_id
+        self.interfaces = interfaces if interfaces is not None else {}    # {nama: Interface}
+        self.protocols = tuple(_intern(p) for p in protocols)
+        self.redistribute = redistribute
+
+    @classmethod
+    def from_dict(cls, name, d):
+        interfaces = {_intern(n): Interface.from_dict(n, v) for n, v in d["interfaces"].items()}
+        return cls(name, d.get("router_id"), interfaces, d["routing"]["protocol"], d["routing"]["redistribute"])
+
+    @classmethod
+    def dari_parsed(cls, name, parsed):
+        """Langsung dari hasil 6 parser ({folder: hasil parse}), logika sama dengan gabung_router"""
+        config = parsed["config"]
+        mtu_data = parsed["interfaces"]
+        ospf_data = parsed["ospf"]
+        router_id_conf, redistribute_conf, passive = parsed["ospf_config"]
+        cdp_data = parsed["cdp"]
+        protocols, redistribute_proto, router_id_proto = parsed["ip protocols"]
+
+        interfaces = {}
+        for intf, data in config.items():
+            if "ip" not in data:
+                continue
+            ospf = None
+            if "ospf" in data or intf in ospf_data or intf in passive:
+                ospf = OspfAttrs.from_dict({**data.get("ospf", {}), **ospf_data.get(intf, {})})
+                ospf.passive = intf in passive
+            neighbor = Neighbor.from_dict(cdp_data[intf]) if intf in cdp_data else None
+            interfaces[_intern(intf)] = Interface(intf, data["ip"], data.get("subnet"), mtu_data.get(intf),
+                                                  ospf, neighbor)
+
+        return cls(name, router_id_conf or router_id_proto, interfaces, protocols,
+                   redistribute_conf or redistribute_proto)
+
+    def to_dict(self):
+        return {
+            "router_id": self.router_id,
+            "interfaces": {name: intf.to_dict() for name, intf in self.interfaces.items()},
+            "routing": {
+                "protocol": list(self.protocols),
+                "redistribute": self.redistribute
+            }
+        }
+
+
+# ====== LOAD / DUMP topologi_N.json ====== #
+def dari_dict(data):
+    """{router: dict schema JSON} → {router: Router}"""
+    return {_intern(name): Router.from_dict(name, d) for name, d in data.items()}
+
+
+def indeks_interface(routers):
+    """
+    {router: {id interface: nama interface}} untuk seluruh snapshot, dibangun sekali.
+    Kalau dua nama di satu router jatuh ke id yang sama, yang pertama dipakai.
+    """
+    indeks = {}
+    for rname, r in routers.items():
+        per_id = indeks[rname] = {}
+        for iname, intf in r.interfaces.items():
+            if intf.id not in per_id:
+                per_id[intf.id] = iname
+    return indeks
+
+
+def ke_dict(routers):
+    return {name: r.to_dict() for name, r in routers.items()}
+
+
+def load_topologi(path):
+    with open(path) as f:
+        return dari_dict(json.load(f))
+
+
+def dump_topologi(routers, path):
+    with open(path, "w") as f:
+        f.write(json.dumps(ke_dict(routers), indent=4))
+
+
+# ====== LOAD STREAMING (file topologi sangat besar) ====== #
+_WS = re.compile(r"[ \t\n\r]*")
+
+
+def _entry_router(decoder, buf, pos):
+    """Satu pasangan "router": {...} mulai dari pos → ((nama, dict) / None di akhir objek, pos baru)"""
+    pos = _WS.match(buf, pos).end()
+    if buf[pos] == "}":
+        return None, pos + 1
+    if buf[pos] == ",":
+        pos = _WS.match(buf, pos + 1).end()
+    name, pos = decoder.raw_decode(buf, pos)
+    pos = _WS.match(buf, pos).end()
+    if buf[pos] != ":":
+        raise json.JSONDecodeError("Expecting ':' delimiter", buf, pos)
+    value, pos = decoder.raw_decode(buf, _WS.match(buf, pos + 1).end())
+    return (name, value), pos
+
+
+def iter_router_json(path, chunk_size=1 << 20):
+    """
+    Yield (nama router, dict) satu per satu dari topologi_N.json.
+    File dibaca per chunk; yang ada di memori hanya sisa buffer + satu router,
+    bukan seluruh teks dan seluruh pohon dict seperti json.load.
+    """
+    decoder = json.JSONDecoder()
+    with open(path, encoding="utf-8") as f:
+        # --- lewati whitespace awal (bisa lebih panjang dari satu chunk) ---
+        buf = f.read(chunk_size)
+        pos = _WS.match(buf).end()
+        while pos == len(buf) and buf:
+            buf = f.read(chunk_size)
+            pos = _WS.match(buf).end()
+        if buf[pos:pos + 1] != "{":
+            raise json.JSONDecodeError("Expecting '{'", buf, pos)
+        pos += 1
+        eof = False
+        baca = chunk_size
+        while True:
+            try:
+                entry, pos_baru = _entry_router(decoder, buf, pos)
+            except (json.JSONDecodeError, IndexError) as e:
+                # router belum lengkap di buffer → buang yang sudah dipakai, baca lagi
+                if eof:
+                    if isinstance(e, IndexError):     # file terpotong: buf[pos] lewat akhir data
+                        raise json.JSONDecodeError("Unexpected end of data", buf, pos) from None
+                    raise
+                tambahan = f.read(baca)
+                eof = not tambahan
+                buf = buf[pos:] + tambahan
+                pos = 0
+                baca *= 2       # router raksasa → tidak re-decode berkali-kali
+                continue
+            baca = chunk_size
+            pos = pos_baru
+            if entry is None:
+                return
+            yield entry
+
+
+def iter_topologi(path):
+    """Yield Router satu per satu (dict router langsung dibuang setelah jadi objek)"""
+    for name, d in iter_router_json(path):
+        yield Router.from_dict(name, d)
+
+
+def load_topologi_stream(path):
+    """
+    Sama dengan load_topologi, tapi teks JSON utuh dan pohon dict utuh tidak pernah ada di memori:
+    puncak memori ≈ model Router seluruh topologi + satu router mentah. Model tetap seluruh
+    topologi karena deteksi (join neighbor antar router) butuh semua router sekaligus;
+    pemakai yang cukup satu router per langkah pakai iter_topologi.
+    """
+    return {r.name: r for r in iter_topologi(path)}
@@ -1,23 +1,24 @@
 import os
-import json
+import sys
 import csv
 
-# === Path utama === #
+# Modul bersama (loader snapshot & model topologi) ada di folder 02-1_Scripts (Rule Based)
 ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "02-1_Scripts (Rule Based)"))
+
+from snapshot_kolom import buka_snapshot
+from topologi_model import indeks_interface
+
+# === Path utama === #
 input_dir = os.path.join(ROOT_DIR, "03_Output", "Data_Rule_Based")
 output_dir = os.path.join(ROOT_DIR, "03_Output", "Data_ML")
 
 os.makedirs(output_dir, exist_ok=True)
 
 # === Fungsi bantu === #
-def safe_get(d, keys, default=None):
-    """Ambil nested key dari dict dengan aman."""
-    for k in keys:
-        if isinstance(d, dict) and k in d:
-            d = d[k]
-        else:
-            return default
-    return d
+def atau_none(value):
+    """None (key tidak ada di JSON) → "none"."""
+    return "none" if value is None else value
 
 def format_auth_key(auth_dict):
     """
@@ -38,85 +39,86 @@ for fname in sorted(os.listdir(input_dir)):
         continue
 
     fpath = os.path.join(input_dir, fname)
-    with open(fpath, "r") as f:
-        routers = json.load(f)
-
-    print(f"[✓] Membaca {fname} ({len(routers)} router ditemukan)")
-
-    dataset = []
-    topology_id = fname.split("_")[-1].replace(".json", "")  # contoh: routers_1.json → 1
-
-    for r1_name, r1_data in routers.items():
-        router1_protocols = ",".join(r1_data.get("routing", {}).get("protocol", []))
-        router1_id = r1_data.get("router_id", "none")
-        redis1 = r1_data.get("routing", {}).get("redistribute", False)
-
-        for if1_name, if1_data in r1_data.get("interfaces", {}).items():
-            if "neighbor" not in if1_data:
-                continue
-
-            nbr_router = safe_get(if1_data, ["neighbor", "router"])
-            nbr_intf = safe_get(if1_data, ["neighbor", "interface"])
-            if nbr_router not in routers:
-                continue
-            r2_data = routers[nbr_router]
-
-            # Data router B
-            router2_protocols = ",".join(r2_data.get("routing", {}).get("protocol", []))
-            router2_id = r2_data.get("router_id", "none")
-            redis2 = r2_data.get("routing", {}).get("redistribute", False)
-
-            # Data interface di router B
-            intf2 = r2_data["interfaces"].get(nbr_intf.replace(" ", ""), {})
-            ospf1 = if1_data.get("ospf", {})
-            ospf2 = intf2.get("ospf", {})
-
-            # === Format auth_key dan auth_type === #
-            auth_key_a = format_auth_key(ospf1.get("auth_key", {}))
-            auth_key_b = format_auth_key(ospf2.get("auth_key", {}))
-            auth_type_a = ospf1.get("ospf auth", "none")
-            auth_type_b = ospf2.get("ospf auth", "none")
-
-            # === Buat baris dataset === #
-            row = {
-                "topologi": topology_id,
-
-                "router_a": r1_name,
-                "routing_a": router1_protocols,
-                "router_id_a": router1_id,
-                "redistribute_a": redis1,
-                "interface_a": if1_name,
-                "ip_a": if1_data.get("ip", "none"),
-                "subnet_a": if1_data.get("subnet", "none"),
-                "auth_key_a": auth_key_a,
-                "ospf_auth_a": auth_type_a,
-                "area_a": ospf1.get("area", "none"),
-                "network_type_a": ospf1.get("Network Type", "none"),
-                "hello_a": ospf1.get("Hello", "none"),
-                "dead_a": ospf1.get("Dead", "none"),
-                "passive_a": ospf1.get("passive", "none"),
-                "MTU_a": if1_data.get("MTU", "none"),
-                "neighbor_a": nbr_router,
-
-                "router_b": nbr_router,
-                "routing_b": router2_protocols,
-                "router_id_b": router2_id,
-                "redistribute_b": redis2,
-                "interface_b": nbr_intf,
-                "ip_b": intf2.get("ip", "none"),
-                "subnet_b": intf2.get("subnet", "none"),
-                "auth_key_b": auth_key_b,
-                "ospf_auth_b": auth_type_b,
-                "area_b": ospf2.get("area", "none"),
-                "network_type_b": ospf2.get("Network Type", "none"),
-                "hello_b": ospf2.get("Hello", "none"),
-                "dead_b": ospf2.get("Dead", "none"),
-                "passive_b": ospf2.get("passive", "none"),
-                "MTU_b": intf2.get("MTU", "none"),
-                "neighbor_b": safe_get(intf2, ["neighbor", "router"], "none")
-            }
-
-            dataset.append(row)
+    with buka_snapshot(fpath) as routers:    # topologi_N.kolom (mmap) kalau ada, ditutup setelah baris dataset jadi
+
+        print(f"[✓] Membaca {fname} ({len(routers)} router ditemukan)")
+
+        dataset = []
+        intf_per_id = indeks_interface(routers)   # {router: {id nama kanonik: nama}} → join integer
+        topology_id = fname.split("_")[-1].replace(".json", "")  # contoh: routers_1.json → 1
+
+        for r1_name, r1 in routers.items():
+            router1_protocols = ",".join(r1.protocols)
+            router1_id = r1.router_id
+            redis1 = r1.redistribute
+
+            for if1_name, if1 in r1.interfaces.items():
+                if if1.neighbor is None:
+                    continue
+
+                nbr_router = if1.neighbor.router
+                nbr_intf = if1.neighbor.interface
+                if nbr_router not in routers:
+                    continue
+                r2 = routers[nbr_router]
+
+                # Data router B
+                router2_protocols = ",".join(r2.protocols)
+                router2_id = r2.router_id
+                redis2 = r2.redistribute
+
+                # Data interface di router B (None kalau tidak ada)
+                nama2 = intf_per_id[nbr_router].get(if1.neighbor.interface_id)
+                intf2 = r2.interfaces[nama2] if nama2 is not None else None
+                ospf1 = if1.ospf
+                ospf2 = intf2.ospf if intf2 is not None else None
+
+                # === Format auth_key dan auth_type === #
+                auth_key_a = format_auth_key(ospf1.auth_key if ospf1 else None)
+                auth_key_b = format_auth_key(ospf2.auth_key if ospf2 else None)
+                auth_type_a = atau_none(ospf1.auth if ospf1 else None)
+                auth_type_b = atau_none(ospf2.auth if ospf2 else None)
+
+                # === Buat baris dataset === #
+                row = {
+                    "topologi": topology_id,
+
+                    "router_a": r1_name,
+                    "routing_a": router1_protocols,
+                    "router_id_a": router1_id,
+                    "redistribute_a": redis1,
+                    "interface_a": if1_name,
+                    "ip_a": atau_none(if1.ip),
+                    "subnet_a": atau_none(if1.subnet),
+                    "auth_key_a": auth_key_a,
+                    "ospf_auth_a": auth_type_a,
+                    "area_a": atau_none(ospf1.area if ospf1 else None),
+                    "network_type_a": atau_none(ospf1.network_type if ospf1 else None),
+                    "hello_a": atau_none(ospf1.hello if ospf1 else None),
+                    "dead_a": atau_none(ospf1.dead if ospf1 else None),
+                    "passive_a": atau_none(ospf1.passive if ospf1 else None),
+                    "MTU_a": atau_none(if1.mtu),
+                    "neighbor_a": nbr_router,
+
+                    "router_b": nbr_router,
+                    "routing_b": router2_protocols,
+                    "router_id_b": router2_id,
+                    "redistribute_b": redis2,
+                    "interface_b": nbr_intf,
+                    "ip_b": atau_none(intf2.ip if intf2 else None),
+                    "subnet_b": atau_none(intf2.subnet if intf2 else None),
+                    "auth_key_b": auth_key_b,
+                    "ospf_auth_b": auth_type_b,
+                    "area_b": atau_none(ospf2.area if ospf2 else None),
+                    "network_type_b": atau_none(ospf2.network_type if ospf2 else None),
+                    "hello_b": atau_none(ospf2.hello if ospf2 else None),
+                    "dead_b": atau_none(ospf2.dead if ospf2 else None),
+                    "passive_b": atau_none(ospf2.passive if ospf2 else None),
+                    "MTU_b": atau_none(intf2.mtu if intf2 else None),
+                    "neighbor_b": intf2.neighbor.router if intf2 and intf2.neighbor else "none"
+                }
+
+                dataset.append(row)
 
     # === Simpan ke CSV === #
     if len(dataset) == 0:
@@ -0,0 +1,78 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+COLLECTOR = os.path.join(ROOT_DIR, "02-1_Scripts (Rule Based)", "1_Ambil_RawData.py")
+SIMULATOR = os.path.join(BENCH_DIR, "ios_simulator.py")
+
+
+def tunggu_siap(proc):
+    """Tunggu baris '[✓] Simulator ... jalan' dari simulator"""
+    for line in proc.stdout:
+        print(f"    {line.rstrip()}")
+        if "jalan di" in line:
+            return line
+    raise SystemExit("[!] Simulator gagal start")
+
+
+# ====== MAIN ====== #
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark throughput 1_Ambil_RawData.py terhadap simulator lokal")
+    parser.add_argument("--routers", type=int, default=500)
+    parser.add_argument("--port", type=int, default=2222)
+    parser.add_argument("--transport", choices=["auto", "ssh", "telnet"], default="auto")
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--login-latency", type=float, default=0.05)
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    parser.add_argument("--catat", default=os.path.join(BENCH_DIR, "hasil_bench_collector.jsonl"),
+                        help="file JSONL untuk riwayat hasil (deteksi regresi)")
+    parser.add_argument("collector_args", nargs="*",
+                        help="argumen tambahan untuk 1_Ambil_RawData.py, contoh: -- --engine async --batch")
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="bench_collector_")
+    inventory = os.path.join(tmp, "router_list.json")
+
+    sim = subprocess.Popen(
+        [sys.executable, "-u", SIMULATOR, "--routers", str(args.routers), "--port", str(args.port),
+         "--transport", args.transport, "--inventory", inventory,
+         "--latency", str(args.latency), "--login-latency", str(args.login_latency),
+         "--fail-rate", str(args.fail_rate)],
+        stdout=subprocess.PIPE, text=True,
+    )
+    try:
+        info = tunggu_siap(sim)
+        device_type = "cisco_ios_telnet" if "cisco_ios_telnet" in info else "cisco_ios"
+
+        cmd = [sys.executable, COLLECTOR, "--admin-host", "127.0.0.1", "--admin-port", str(args.port),
+               "--device-type", device_type, "--router-list", inventory,
+               "--output-dir", os.path.join(tmp, "rawdata")] + args.collector_args
+
+        print(f"[+] {' '.join(args.collector_args) or '(default)'} → {args.routers} router")
+        t0 = time.perf_counter()
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, check=False)
+        durasi = time.perf_counter() - t0
+    finally:
+        sim.terminate()
+        sim.wait()
+
+    hasil = {
+        "waktu": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "routers": args.routers,
+        "latency": args.latency,
+        "login_latency": args.login_latency,
+        "fail_rate": args.fail_rate,
+        "collector_args": args.collector_args,
+        "durasi_s": round(durasi, 3),
+        "router_per_s": round(args.routers / durasi, 2),
+    }
+    with open(args.catat, "a") as f:
+        f.write(json.dumps(hasil) + "\n")
+
+    print(f"[✓] {durasi:.2f}s → {hasil['router_per_s']} router/s (dicatat di {args.catat})")
@@ -0,0 +1,83 @@
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "02-1_Scripts (Rule Based)"))
+
+from bench_neighbor_lookup import topologi_sintetis
+from parser_engine import buka_output
+from topologi_model import dump_topologi, load_topologi
+
+deteksi = importlib.import_module("3_Rule_Based_Detection")
+import deteksi_inkremental
+
+
+def ukur(fn, *args):
+    with contextlib.redirect_stdout(io.StringIO()):
+        t0 = time.perf_counter()
+        hasil = fn(*args)
+        return time.perf_counter() - t0, hasil
+
+
+def ubah_satu_interface(path, hello):
+    """Ganti Hello satu interface OSPF (router di tengah snapshot) → hanya link router itu yang terdampak"""
+    data = deteksi.load_json(path)
+    rname = list(data)[len(data) // 2]
+    for intf in data[rname]["interfaces"].values():
+        if "ospf" in intf and "neighbor" in intf:
+            intf["ospf"]["Hello"] = hello
+            break
+    with open(path, "w") as f:
+        f.write(json.dumps(data, indent=4))
+
+
+def penuh(path):
+    return deteksi.deteksi_topologi(load_topologi(path))
+
+
+def inkremental(path, state_path):
+    ink = deteksi_inkremental.DeteksiInkremental()
+    ink.muat(state_path)
+    with buka_output(path) as buf:
+        results = ink.jalankan(buf)
+    ink.simpan(state_path)
+    return results, ink.statistik
+
+
+# ====== MAIN ====== #
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load + deteksi penuh vs inkremental (diff dengan state run sebelumnya) setelah satu interface berubah")
+    parser.add_argument("--skala", nargs="+", default=["1000x4", "5000x4", "1000x20"], help="daftar <router>x<link per router>")
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="bench_inkremental_")
+    print(f"{'skala':<11}{'link':>8}{'penuh (s)':>11}{'inkremental (s)':>17}{'speedup':>9}{'link dievaluasi':>17}")
+    try:
+        for skala in args.skala:
+            n_routers, links = (int(x) for x in skala.lower().split("x"))
+            path = os.path.join(tmp, f"topologi_{skala}.json")
+            routers = topologi_sintetis(tmp, n_routers, links)
+            n_link = len(ukur(deteksi.bangun_link, routers)[1])
+            dump_topologi(routers, path)
+            state_path = deteksi_inkremental.path_state(path)
+            ukur(inkremental, path, state_path)            # run pertama: isi state
+
+            ubah_satu_interface(path, 7)
+            t_penuh, hasil = ukur(penuh, path)
+            t_ink, (hasil_ink, statistik) = ukur(inkremental, path, state_path)
+            if hasil != hasil_ink:
+                raise SystemExit(f"[!] Hasil inkremental berbeda pada skala {skala}")
+
+            n_eval = statistik["link"][0]
+            print(f"{skala:<11}{n_link:>8}{t_penuh:>11.3f}{t_ink:>17.3f}{t_penuh / t_ink:>8.1f}x{n_eval:>17}")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    print("[✓] Hasil inkremental identik dengan deteksi penuh")
@@ -0,0 +1,100 @@
+import argparse
+import importlib
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "02-1_Scripts (Rule Based)"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import parser_referensi
+pembuatan_json = importlib.import_module("2_Pembuatan_JSON")
+
+# mode → cara parse satu file
+MODE = {
+    "lama": "f.read() + parser lama (splitlines)",
+    "teks": "f.read() + parser_engine",
+    "mmap": "mmap + parser_engine (zero-copy)",
+}
+
+
+def parse_sekali(mode, folder, path):
+    if mode == "mmap":
+        return pembuatan_json.parse_path(folder, path)
+    with open(path) as f:
+        text = f.read()
+    if mode == "teks":
+        return pembuatan_json.parse_output(folder, text)
+    return getattr(parser_referensi, pembuatan_json.PARSERS[folder][1].__name__)(text)
+
+
+def peak_rss_kb():
+    """
+    Peak RSS proses ini (KB). Di Linux pakai VmHWM: ru_maxrss ikut terbawa dari
+    proses induk lewat fork+exec, VmHWM tidak (dan bisa di-reset via clear_refs).
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def reset_peak_rss():
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def anak(mode, folder, path):
+    """Dijalankan di proses baru → peak RSS hanya milik satu parse ini"""
+    reset_peak_rss()
+    rss_awal = peak_rss_kb()
+    t0 = time.perf_counter()
+    hasil = parse_sekali(mode, folder, path)
+    durasi = time.perf_counter() - t0
+    rss_akhir = peak_rss_kb()
+    print(json.dumps({"durasi": durasi, "rss_awal_kb": rss_awal, "rss_akhir_kb": rss_akhir, "n": len(hasil)}))
+
+
+# ====== MAIN ====== #
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Peak RSS & waktu per parse: f.read()/splitlines vs mmap zero-copy")
+    parser.add_argument("--lines", type=int, default=2_000_000, help="jumlah baris output sintetis")
+    parser.add_argument("--folder", default="interfaces", choices=list(pembuatan_json.PARSERS),
+                        help="jenis output (default: show interfaces)")
+    parser.add_argument("--anak", nargs=3, metavar=("MODE", "FOLDER", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.anak:
+        anak(*args.anak)
+        sys.exit(0)
+
+    from bench_parser import output_besar
+
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        f.write(output_besar(args.folder, args.lines))
+        path = f.name
+    try:
+        ukuran = os.path.getsize(path)
+        print(f"[i] Output sintetis {args.folder}: {ukuran / 1e6:.1f} MB")
+        print(f"{'mode':<38}{'waktu (s)':>10}{'RSS naik (MB)':>15}{'peak RSS (MB)':>15}")
+        for mode, label in MODE.items():
+            out = subprocess.run([sys.executable, __file__, "--anak", mode, args.folder, path],
+                                 check=True, capture_output=True, text=True).stdout
+            h = json.loads(out)
+            naik = (h["rss_akhir_kb"] - h["rss_awal_kb"]) / 1024
+            print(f"{label:<38}{h['durasi']:>10.2f}{naik:>15.1f}{h['rss_akhir_kb'] / 1024:>15.1f}")
+        print("[i] RSS mode mmap = halaman file yang di-map (page cache, bisa dibuang kernel), bukan salinan str")
+    finally:
+        os.remove(path)
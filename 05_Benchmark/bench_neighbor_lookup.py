@@ -0,0 +1,88 @@
+import argparse
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "02-1_Scripts (Rule Based)"))
+
+from gen_show_output import generate
+from topologi_model import dari_dict
+
+pembuatan_json = importlib.import_module("2_Pembuatan_JSON")
+deteksi = importlib.import_module("3_Rule_Based_Detection")
+
+
+def link_linear(routers):
+    """Cara lama check_neighbors: scan semua interface router neighbor + normalize per link, pair_key sorted"""
+    links = []
+    checked_pairs = set()
+    for rname, rdata in routers.items():
+        for iname, idata in rdata.interfaces.items():
+            if idata.ospf is None or iname.startswith("Loopback") or iname == "FastEthernet0/0":
+                continue
+            if idata.neighbor is None or idata.neighbor.router not in routers:
+                continue
+            nrouter = idata.neighbor.router
+            nintf = idata.neighbor.interface.replace(" ", "")
+            match_intf = None
+            for intf in routers[nrouter].interfaces:
+                if intf.replace(" ", "") == nintf:
+                    match_intf = intf
+                    break
+            if not match_intf:
+                continue
+            ndata = routers[nrouter].interfaces[match_intf]
+            if ndata.ospf is None:
+                continue
+            pair_key = tuple(sorted([(rname, iname), (nrouter, match_intf)]))
+            if pair_key in checked_pairs:
+                continue
+            checked_pairs.add(pair_key)
+            links.append((rname, iname, idata, nrouter, match_intf, ndata))
+    return links
+
+
+def ukur(fn, *args, ulang=3):
+    terbaik = float("inf")
+    for _ in range(ulang):
+        t0 = time.perf_counter()
+        hasil = fn(*args)
+        terbaik = min(terbaik, time.perf_counter() - t0)
+    return terbaik, hasil
+
+
+def topologi_sintetis(tmp, n_routers, links):
+    raw_dir = os.path.join(tmp, f"rawdata_{n_routers}x{links}")
+    generate(raw_dir, n_routers, links, mismatch_rate=0.02, seed=1)
+    return dari_dict(pembuatan_json.build_snapshot(raw_dir, workers=1))
+
+
+# ====== MAIN ====== #
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pencarian interface neighbor: scan linear vs index (router, id interface)")
+    parser.add_argument("--skala", nargs="+", default=["5000x4", "1000x20", "200x100", "50x400"],
+                        help="daftar <router>x<link per router> (default: ±10k link per skala)")
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="bench_neighbor_")
+    print(f"{'skala':<11}{'link':>8}{'linear (s)':>12}{'index (s)':>11}{'speedup':>9}{'check_neighbors (s)':>21}")
+    try:
+        for skala in args.skala:
+            n_routers, links = (int(x) for x in skala.lower().split("x"))
+            routers = topologi_sintetis(tmp, n_routers, links)
+
+            t_linear, hasil_linear = ukur(link_linear, routers)
+            t_index, hasil_index = ukur(deteksi.bangun_link, routers)
+            if [l[:2] + l[3:5] for l in hasil_linear] != [l[:2] + l[3:5] for l in hasil_index]:
+                raise SystemExit(f"[!] Daftar link berbeda pada skala {skala}")
+            t_check, _ = ukur(deteksi.check_neighbors, routers, hasil_index, ulang=1)
+
+            print(f"{skala:<11}{len(hasil_index):>8}{t_linear:>12.3f}{t_index:>11.3f}"
+                  f"{t_linear / t_index:>8.1f}x{t_check:>21.3f}")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    print("[✓] Daftar link identik antara scan linear dan index")
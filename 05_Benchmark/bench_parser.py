@@ -0,0 +1,79 @@
+import argparse
+import importlib
+import os
+import re
+import sys
+import time
+
+# Parser ada di folder 02-1_Scripts (Rule Based)
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "02-1_Scripts (Rule Based)"))
+
+import parser_engine
+import parser_referensi
+pembuatan_json = importlib.import_module("2_Pembuatan_JSON")
+
+RAW_DIR = os.path.join(ROOT_DIR, "03_Output", "rawdata")
+
+# folder rawdata → nama fungsi parser (sama di parser_referensi.py dan parser_engine.py)
+FOLDER_PARSER = {folder: fn.__name__ for folder, (_, fn) in pembuatan_json.PARSERS.items()}
+
+
+# ====== OUTPUT SINTETIS ====== #
+def output_besar(folder, target_lines):
+    """
+    Gandakan output asli semua router di satu folder sampai ±target_lines baris.
+    Nomor slot interface diganti per salinan supaya nama interface tetap unik.
+    """
+    suffix = pembuatan_json.PARSERS[folder][0]
+    asli = []
+    for name in sorted(os.listdir(os.path.join(RAW_DIR, folder))):
+        if name.endswith(f"_{suffix}.txt"):
+            with open(os.path.join(RAW_DIR, folder, name)) as f:
+                asli.append(f.read())
+    blok = "\n".join(asli) + "\n"
+    n_blok = max(1, target_lines // blok.count("\n"))
+
+    salinan = []
+    for i in range(n_blok):
+        # FastEthernet0/1 → FastEthernet<i>0/1, Fas 0/1 → Fas <i>0/1
+        salinan.append(re.sub(r"(Ethernet|Loopback|Fas )(\d)", rf"\g<1>{i}\2", blok))
+    return "".join(salinan)
+
+
+def ukur(fn, text, ulang):
+    terbaik = float("inf")
+    for _ in range(ulang):
+        t0 = time.perf_counter()
+        fn(text)
+        terbaik = min(terbaik, time.perf_counter() - t0)
+    return terbaik
+
+
+# ====== MAIN ====== #
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Micro-benchmark parser lama (per baris) vs parser_engine (tabel regex)")
+    parser.add_argument("--lines", type=int, default=200_000, help="jumlah baris sintetis per command")
+    parser.add_argument("--ulang", type=int, default=3, help="ulangi tiap pengukuran, ambil yang tercepat")
+    args = parser.parse_args()
+
+    print(f"{'command':<32}{'baris':>9}{'lama (baris/s)':>17}{'engine (baris/s)':>19}{'speedup':>9}")
+    total_lama = total_engine = 0.0
+    for folder, name in FOLDER_PARSER.items():
+        text = output_besar(folder, args.lines)
+        n_lines = text.count("\n")
+        lama = getattr(parser_referensi, name)
+        engine = getattr(parser_engine, name)
+
+        if lama(text) != engine(text):
+            raise SystemExit(f"[!] Hasil {name} berbeda antara parser lama dan parser_engine")
+
+        t_lama = ukur(lama, text, args.ulang)
+        t_engine = ukur(engine, text, args.ulang)
+        total_lama += t_lama
+        total_engine += t_engine
+        print(f"{name:<32}{n_lines:>9}{n_lines / t_lama:>17,.0f}"
+              f"{n_lines / t_engine:>19,.0f}{t_lama / t_engine:>8.2f}x")
+
+    print(f"[✓] Hasil identik untuk semua command; total {total_lama:.3f}s → {total_engine:.3f}s "
+          f"({total_lama / total_engine:.2f}x)")
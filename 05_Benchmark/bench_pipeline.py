@@ -0,0 +1,167 @@
+import argparse
+import importlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.join(ROOT_DIR, "02-1_Scripts (Rule Based)")
+PEMBUATAN_JSON = os.path.join(SCRIPTS_DIR, "2_Pembuatan_JSON.py")
+
+sys.path.insert(0, SCRIPTS_DIR)
+from gen_show_output import generate
+from snapshot_kolom import buka_snapshot
+
+deteksi = importlib.import_module("3_Rule_Based_Detection")
+
+
+def parse_skala(teks):
+    """'10000x4' → (10000 router, 4 link per router)"""
+    n, links = teks.lower().split("x")
+    return int(n), int(links)
+
+
+# jenis injeksi link (gen_show_output) → judul temuan "- <judul> Mismatch :"
+JUDUL_LINK = {"hello": "Hello", "dead": "Dead", "area": "area", "network": "Network Type",
+              "mtu": "MTU", "passive": "passive", "auth": "ospf auth", "auth_key": "auth_key"}
+
+
+def jalankan_deteksi(json_path):
+    """Sama seperti loop __main__ 3_Rule_Based_Detection.py untuk satu file → (detik, baris hasil)"""
+    t0 = time.perf_counter()
+    with buka_snapshot(json_path) as routers:
+        results = deteksi.deteksi_topologi(routers)
+    return time.perf_counter() - t0, results
+
+
+def baca_temuan(results):
+    """
+    Baris hasil deteksi → list temuan (judul, [subjek]).
+    Subjek = teks setelah "\t* " sampai " :" → "R1 Fa0/1" (link), "R1" (router id), "R1 belum ..." (redistribute).
+    """
+    temuan = []
+    subjek = None       # list subjek temuan yang sedang dibaca
+    for line in "\n".join(results).splitlines():
+        if line.startswith("- ") and line.endswith(" Mismatch :"):
+            subjek = []
+            temuan.append((line[2:-len(" Mismatch :")], subjek))
+        elif line.startswith("="):
+            subjek = None   # blok detail selesai, baris "\t* " sesudahnya milik Solusi
+        elif subjek is not None and line.startswith("\t* "):
+            subjek.append(line[3:].split(" :")[0])
+    return temuan
+
+
+def cek_injeksi(injected, results):
+    """Injeksi (injected.json) yang tidak muncul di hasil deteksi → list deskripsi (kosong = lengkap)"""
+    link, redistribute, router_id = set(), set(), []
+    for judul, subjek in baca_temuan(results):
+        if judul == "Redistribute":
+            redistribute.add(subjek[0].split()[0])
+        elif judul == "Router ID":
+            router_id.append(set(subjek))
+        else:
+            link.add((judul, frozenset(tuple(s.split()) for s in subjek)))
+
+    hilang = []
+    for inj in injected["links"]:
+        (a, ia), (b, ib) = inj["a"], inj["b"]
+        sisi = frozenset([(a, deteksi.short_ifname(ia)), (b, deteksi.short_ifname(ib))])
+        if (JUDUL_LINK[inj["jenis"]], sisi) not in link:
+            hilang.append(f"link {inj['jenis']} {a} {ia} - {b} {ib}")
+    hilang += [f"redistribute {name}" for name in injected["redistribute"] if name not in redistribute]
+    hilang += [f"router-id {r1} = {r2}" for r1, r2 in injected["router_id"]
+               if not any({r1, r2} <= grup for grup in router_id)]
+    return hilang
+
+
+def bench_skala(n_routers, links, args, tmp):
+    raw_dir = os.path.join(tmp, f"rawdata_{n_routers}x{links}")
+    out_dir = os.path.join(tmp, f"json_{n_routers}x{links}")
+
+    t0 = time.perf_counter()
+    routers, injected = generate(raw_dir, n_routers, links, mismatch_rate=args.mismatch_rate,
+                                 redistribute_miss=args.redistribute_miss, dup_router_id=args.dup_router_id,
+                                 seed=args.seed)
+    t_gen = time.perf_counter() - t0
+    n_intf = sum(len(r["interfaces"]) for r in routers.values())
+
+    # === 2_Pembuatan_JSON.py (proses terpisah, persis seperti dipakai user) === #
+    cmd = [sys.executable, PEMBUATAN_JSON, "--rawdata", raw_dir, "--output-dir", out_dir,
+           "--topologi", "1", "--no-cache"]
+    if args.workers:
+        cmd += ["--workers", str(args.workers)]
+    t0 = time.perf_counter()
+    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL)
+    t_build = time.perf_counter() - t0
+
+    # === 3_Rule_Based_Detection.py === #
+    t_detect, results = jalankan_deteksi(os.path.join(out_dir, "topologi_1.json"))
+    temuan = sum(1 for line in results if line.startswith("- "))
+    hilang = cek_injeksi(injected, results)
+
+    n_injeksi = len(injected["links"]) + len(injected["redistribute"]) + len(injected["router_id"])
+    return {
+        "routers": n_routers,
+        "links_per_router": links,
+        "interfaces": n_intf,
+        "generate_s": round(t_gen, 3),
+        "build_json_s": round(t_build, 3),
+        "build_router_per_s": round(n_routers / t_build, 1),
+        "deteksi_s": round(t_detect, 3),
+        "deteksi_router_per_s": round(n_routers / t_detect, 1),
+        "injeksi": n_injeksi,
+        "temuan": temuan,
+        "hilang": hilang,
+    }
+
+
+# ====== MAIN ====== #
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark 2_Pembuatan_JSON.py + 3_Rule_Based_Detection.py "
+                                                 "pada topologi sintetis besar")
+    parser.add_argument("--skala", nargs="+", default=["100x4", "1000x4", "10000x4", "200x200"],
+                        help="daftar <router>x<link per router>")
+    parser.add_argument("--mismatch-rate", type=float, default=0.02)
+    parser.add_argument("--redistribute-miss", type=float, default=0.01)
+    parser.add_argument("--dup-router-id", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=None, help="--workers untuk 2_Pembuatan_JSON.py")
+    parser.add_argument("--simpan-data", action="store_true", help="jangan hapus rawdata/JSON sintetis")
+    parser.add_argument("--catat", default=os.path.join(BENCH_DIR, "hasil_bench_pipeline.jsonl"),
+                        help="file JSONL untuk riwayat hasil (deteksi regresi)")
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="bench_pipeline_")
+    gagal = {}
+    print(f"{'skala':<11}{'interface':>10}{'gen (s)':>9}{'json (s)':>10}{'router/s':>10}"
+          f"{'deteksi (s)':>13}{'router/s':>10}{'temuan/injeksi':>16}")
+    try:
+        for skala in args.skala:
+            n_routers, links = parse_skala(skala)
+            hasil = bench_skala(n_routers, links, args, tmp)
+            hasil["waktu"] = time.strftime("%Y-%m-%d %H:%M:%S")
+            with open(args.catat, "a") as f:
+                f.write(json.dumps(hasil) + "\n")
+            print(f"{skala:<11}{hasil['interfaces']:>10}{hasil['generate_s']:>9.2f}{hasil['build_json_s']:>10.2f}"
+                  f"{hasil['build_router_per_s']:>10.0f}{hasil['deteksi_s']:>13.2f}{hasil['deteksi_router_per_s']:>10.0f}"
+                  f"{str(hasil['temuan']) + '/' + str(hasil['injeksi']):>16}")
+            if hasil["hilang"]:
+                gagal[skala] = hasil["hilang"]
+    finally:
+        if args.simpan_data:
+            print(f"[i] Data sintetis disimpan di {tmp}")
+        else:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    print(f"[✓] Hasil dicatat di {args.catat}")
+    if gagal:
+        for skala, hilang in gagal.items():
+            print(f"[!] {skala}: {len(hilang)} injeksi tidak terdeteksi, contoh: {', '.join(hilang[:5])}")
+        raise SystemExit(1)
+    print("[✓] Semua injeksi (link, redistribute, router-id) muncul di hasil deteksi")
@@ -0,0 +1,79 @@
+import argparse
+import contextlib
+import glob
+import importlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "02-1_Scripts (Rule Based)"))
+
+from bench_neighbor_lookup import topologi_sintetis
+from topologi_model import dump_topologi
+
+deteksi = importlib.import_module("3_Rule_Based_Detection")
+
+DATA_DIR = os.path.join(ROOT_DIR, "03_Output", "Data_Rule_Based")
+
+
+def arsip_sintetis(tmp, n_files, skala):
+    """n_files topologi_N.json identik (satu topologi sintetis di-copy) → daftar path"""
+    n_routers, links = (int(x) for x in skala.lower().split("x"))
+    sumber = os.path.join(tmp, "sumber.json")
+    dump_topologi(topologi_sintetis(tmp, n_routers, links), sumber)
+    paths = []
+    for i in range(1, n_files + 1):
+        path = os.path.join(tmp, f"topologi_{i}.json")
+        shutil.copyfile(sumber, path)
+        paths.append(path)
+    return paths
+
+
+def jalankan(paths, workers):
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        hasil = [results for results, _, _, _ in deteksi.deteksi_banyak(paths, workers=workers)]
+    return time.perf_counter() - t0, hasil
+
+
+# ====== MAIN ====== #
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Throughput runner deteksi banyak topologi: file/s per jumlah worker")
+    parser.add_argument("--files", type=int, default=200, help="jumlah topologi_N.json di arsip sintetis")
+    parser.add_argument("--skala", default="200x4", help="<router>x<link per router> per topologi")
+    parser.add_argument("--workers", type=int, nargs="+", default=None,
+                        help="daftar jumlah worker (default: 1, 2, 4, ... s.d. jumlah core)")
+    parser.add_argument("--arsip", action="store_true",
+                        help="pakai topologi_N.json di 03_Output/Data_Rule_Based, bukan arsip sintetis")
+    args = parser.parse_args()
+
+    n_core = os.cpu_count() or 1
+    daftar = args.workers or sorted({1, *(2 ** i for i in range(1, n_core.bit_length())), n_core})
+    tmp = tempfile.mkdtemp(prefix="bench_runner_")
+    try:
+        if args.arsip:
+            paths = sorted(glob.glob(os.path.join(DATA_DIR, "topologi_*.json")))
+            print(f"[i] {len(paths)} topologi dari {DATA_DIR}, {n_core} core")
+        else:
+            paths = arsip_sintetis(tmp, args.files, args.skala)
+            print(f"[i] {args.files} topologi {args.skala}, {n_core} core")
+        ukuran = sum(os.path.getsize(p) for p in paths)
+        print(f"[i] Total {ukuran / 1e6:.1f} MB → worker efektif dibatasi {ukuran / deteksi.MIN_BYTE_PER_WORKER:.1f}"
+              f" (MIN_BYTE_PER_WORKER) dan jumlah core")
+        print(f"{'worker':>7}{'efektif':>9}{'waktu (s)':>11}{'file/s':>10}{'speedup':>9}")
+        acuan = t_serial = None
+        for workers in daftar:
+            durasi, hasil = jalankan(paths, workers)
+            if acuan is None:
+                acuan, t_serial = hasil, durasi
+            elif hasil != acuan:
+                raise SystemExit(f"[!] Hasil berbeda dengan {workers} worker")
+            efektif = deteksi.jumlah_worker(paths, workers)
+            print(f"{workers:>7}{efektif:>9}{durasi:>11.2f}{len(paths) / durasi:>10.1f}{t_serial / durasi:>8.1f}x")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    print("[✓] Hasil identik untuk semua jumlah worker (urutan file tetap)")
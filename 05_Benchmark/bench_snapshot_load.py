@@ -0,0 +1,84 @@
+import argparse
+import contextlib
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "02-1_Scripts (Rule Based)"))
+
+from snapshot_kolom import KolomSnapshot, path_kolom, tulis_kolom
+from topologi_model import load_topologi
+
+DATA_DIR = os.path.join(ROOT_DIR, "03_Output", "Data_Rule_Based")
+
+
+def siapkan(tmp, n_snapshot):
+    """Salin topologi_N.json yang ada sampai n_snapshot file + tulis .kolom masing-masing"""
+    sumber = sorted(glob.glob(os.path.join(DATA_DIR, "topologi_*.json")))
+    paths = []
+    for i in range(n_snapshot):
+        path = os.path.join(tmp, f"topologi_{i + 1}.json")
+        shutil.copyfile(sumber[i % len(sumber)], path)
+        tulis_kolom(load_topologi(path), path_kolom(path))
+        paths.append(path)
+    return paths
+
+
+def sentuh(routers):
+    """Akses yang sama dengan deteksi: semua atribut OSPF tiap interface"""
+    n = 0
+    for r in routers.values():
+        for intf in r.interfaces.values():
+            if intf.ospf is not None:
+                n += intf.ospf.hello is not None
+    return n
+
+
+def ukur(paths, buka):
+    """buka(path) → context manager yang menghasilkan {nama: router} (ditutup setelah disentuh)"""
+    t0 = time.perf_counter()
+    for path in paths:
+        with buka(path) as routers:
+            sentuh(routers)
+    return time.perf_counter() - t0
+
+
+@contextlib.contextmanager
+def buka_kolom(path):
+    with KolomSnapshot(path_kolom(path)) as snap:
+        yield snap.routers()
+
+
+# ====== MAIN ====== #
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Waktu load topologi_N.json (json.load + model) vs topologi_N.kolom (mmap)")
+    parser.add_argument("--snapshot", type=int, default=10_000, help="jumlah snapshot yang di-load")
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="bench_snapshot_")
+    try:
+        paths = siapkan(tmp, args.snapshot)
+        ukuran_json = sum(os.path.getsize(p) for p in paths)
+        ukuran_kolom = sum(os.path.getsize(path_kolom(p)) for p in paths)
+
+        # baca mentah (tanpa parse) sebagai batas bawah I/O
+        t0 = time.perf_counter()
+        for p in paths:
+            with open(path_kolom(p), "rb") as f:
+                f.read()
+        t_io = time.perf_counter() - t0
+
+        t_json = ukur(paths, lambda p: contextlib.nullcontext(load_topologi(p)))
+        t_kolom = ukur(paths, buka_kolom)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    print(f"{'format':<10}{'ukuran (MB)':>13}{'waktu (s)':>11}{'snapshot/s':>12}")
+    print(f"{'json':<10}{ukuran_json / 1e6:>13.1f}{t_json:>11.2f}{len(paths) / t_json:>12,.0f}")
+    print(f"{'kolom':<10}{ukuran_kolom / 1e6:>13.1f}{t_kolom:>11.2f}{len(paths) / t_kolom:>12,.0f}")
+    print(f"[i] Baca mentah .kolom (batas I/O): {t_io:.2f}s")
+    print(f"[✓] .kolom {t_json / t_kolom:.1f}x lebih cepat dari JSON")
@@ -0,0 +1,110 @@
+import argparse
+import concurrent.futures
+import os
+import sys
+import time
+
+# Modul collector ada di folder 02-1_Scripts (Rule Based)
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "02-1_Scripts (Rule Based)"))
+
+from ssh_pool import AdminSessionPool, masuk_router, keluar_router
+
+COMMANDS = [
+    "show interfaces",
+    "show ip ospf interface",
+    "show run | section interface",
+    "show run | section router ospf",
+    "show cdp neighbor",
+    "show ip protocols",
+]
+
+
+# ====== STAND-IN SSH LOKAL ====== #
+class StandInConnection:
+    """
+    Pengganti ConnectHandler untuk benchmark tanpa lab GNS3:
+    - handshake SSH ke router admin  → sleep `handshake` detik
+    - setiap round trip channel      → sleep `rtt` detik
+    """
+
+    def __init__(self, handshake=0.3, rtt=0.01, **device):
+        time.sleep(handshake)
+        self.rtt = rtt
+
+    def find_prompt(self):
+        time.sleep(self.rtt)
+        return "ADMIN#"
+
+    def is_alive(self):
+        return True
+
+    def write_channel(self, data):
+        pass
+
+    def read_until_pattern(self, pattern, **kwargs):
+        time.sleep(self.rtt)
+        return "#"
+
+    def send_command(self, cmd, **kwargs):
+        time.sleep(self.rtt)
+        return f"output {cmd}\n"
+
+    def disconnect(self):
+        pass
+
+
+def satu_router(conn, mgmt_ip):
+    masuk_router(conn, mgmt_ip)
+    for cmd in COMMANDS:
+        conn.send_command(cmd, expect_string=r"#")
+    keluar_router(conn)
+
+
+def tanpa_pool(device, targets, workers):
+    """Cara lama: handshake baru ke router admin untuk setiap router"""
+    def kerja(ip):
+        conn = StandInConnection(**device)
+        satu_router(conn, ip)
+        conn.disconnect()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as ex:
+        list(ex.map(kerja, targets))
+
+
+def dengan_pool(device, targets, workers):
+    """Cara baru: N sesi hangat dipinjam bergantian oleh worker"""
+    with AdminSessionPool(device, size=workers, connect=StandInConnection) as pool:
+        def kerja(ip):
+            with pool.session() as conn:
+                satu_router(conn, ip)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as ex:
+            list(ex.map(kerja, targets))
+
+
+# ====== MAIN ====== #
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark pool sesi router admin vs handshake per router")
+    parser.add_argument("--routers", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=5)
+    parser.add_argument("--handshake", type=float, default=0.3, help="detik per handshake SSH ke router admin")
+    parser.add_argument("--rtt", type=float, default=0.01, help="detik per round trip channel")
+    args = parser.parse_args()
+
+    device = {"handshake": args.handshake, "rtt": args.rtt}
+    targets = [f"100.100.{i // 250}.{i % 250 + 1}" for i in range(args.routers)]
+
+    print(f"=== {args.routers} router, {args.workers} worker, handshake {args.handshake}s, rtt {args.rtt}s ===")
+
+    t0 = time.perf_counter()
+    tanpa_pool(device, targets, args.workers)
+    t_lama = time.perf_counter() - t0
+    print(f"[i] Tanpa pool   : {t_lama:.2f}s ({args.routers / t_lama:.1f} router/s)")
+
+    t0 = time.perf_counter()
+    dengan_pool(device, targets, args.workers)
+    t_baru = time.perf_counter() - t0
+    print(f"[i] Dengan pool  : {t_baru:.2f}s ({args.routers / t_baru:.1f} router/s)")
+
+    print(f"[✓] Speedup      : {t_lama / t_baru:.2f}x")
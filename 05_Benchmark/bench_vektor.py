@@ -0,0 +1,61 @@
+import argparse
+import contextlib
+import importlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "02-1_Scripts (Rule Based)"))
+
+from bench_neighbor_lookup import topologi_sintetis
+from snapshot_kolom import KolomSnapshot, tulis_kolom
+
+deteksi = importlib.import_module("3_Rule_Based_Detection")
+import deteksi_vektor
+
+
+def ukur(fn, *args):
+    """(detik, hasil, stdout) — stdout ditangkap supaya warning ikut dibandingkan"""
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        t0 = time.perf_counter()
+        hasil = fn(*args)
+        durasi = time.perf_counter() - t0
+    return durasi, hasil, out.getvalue()
+
+
+# ====== MAIN ====== #
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="check_neighbors per link vs mode vektor (numpy), hasil harus identik")
+    parser.add_argument("--skala", nargs="+", default=["5000x4", "200x100"], help="daftar <router>x<link per router>")
+    args = parser.parse_args()
+
+    if not deteksi_vektor.tersedia():
+        raise SystemExit("[!] numpy tidak terpasang")
+
+    tmp = tempfile.mkdtemp(prefix="bench_vektor_")
+    print(f"{'skala':<11}{'link':>8}{'temuan':>8}{'per link (s)':>14}{'vektor (s)':>12}{'vektor .kolom (s)':>19}")
+    try:
+        for skala in args.skala:
+            n_routers, links = (int(x) for x in skala.lower().split("x"))
+            routers = topologi_sintetis(tmp, n_routers, links)
+            path = os.path.join(tmp, f"{skala}.kolom")
+            tulis_kolom(routers, path)
+
+            t_link, hasil, out = ukur(deteksi.check_neighbors, routers)
+            t_vektor, hasil_vektor, out_vektor = ukur(deteksi_vektor.check_neighbors_vektor, routers)
+            with KolomSnapshot(path) as snap:
+                t_kolom, hasil_kolom, out_kolom = ukur(deteksi_vektor.check_neighbors_vektor, snap.routers())
+            if not (hasil == hasil_vektor == hasil_kolom and out == out_vektor == out_kolom):
+                raise SystemExit(f"[!] Hasil mode vektor berbeda pada skala {skala}")
+
+            n_link = len(deteksi.bangun_link(routers))
+            temuan = sum(1 for line in hasil if line.startswith("- "))
+            print(f"{skala:<11}{n_link:>8}{temuan:>8}{t_link:>14.3f}{t_vektor:>12.3f}{t_kolom:>19.3f}")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    print("[✓] Temuan identik antara engine per link dan mode vektor")
@@ -0,0 +1,358 @@
+import argparse
+import json
+import os
+import random
+import time
+
+# === Path default === #
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# folder rawdata → suffix file (sama dengan 1_Ambil_RawData.py / 2_Pembuatan_JSON.py)
+FOLDERS = {
+    "config": "show_run__section_interface",
+    "interfaces": "show_interfaces",
+    "ospf": "show_ip_ospf_interface",
+    "ospf_config": "show_run__section_router_ospf",
+    "cdp": "show_cdp_neighbor",
+    "ip protocols": "show_ip_protocols",
+}
+
+# Jenis mismatch per link (diterapkan ke salah satu sisi) yang bisa diinjeksi
+MISMATCH_LINK = ["hello", "dead", "area", "network", "mtu", "passive", "auth", "auth_key"]
+AREAS = [0, 0, 0, 10, 20]
+AUTH = ["none", "none", "simple", "simple", "md5"]
+
+
+# ====== TOPOLOGI ====== #
+def ip_router(i):
+    """IP management router ke-i (1-based), sama dengan ios_simulator.py"""
+    return f"100.100.{100 + (i - 1) // 254}.{(i - 1) % 254 + 1}"
+
+
+def router_id(i):
+    return f"172.{16 + i // 65536}.{(i // 256) % 256}.{i % 256}"
+
+
+def nama_intf(j):
+    """Interface link ke-j (0-based); FastEthernet0/0 dipakai untuk management"""
+    k = j + 1
+    return f"FastEthernet{k // 16}/{k % 16}"
+
+
+def ip_link(k, sisi):
+    """/30 ke-k dari 10.0.0.0/8 → IP sisi 1 atau 2"""
+    n = (10 << 24) + 4 * k + sisi
+    return f"{n >> 24}.{(n >> 16) & 255}.{(n >> 8) & 255}.{n & 255}"
+
+
+def buat_topologi(n_routers, links_per_router, mismatch_rate=0.05, jenis=None,
+                  eigrp_rate=0.1, redistribute_miss=0.0, dup_router_id=0, seed=1):
+    """
+    Topologi acak (configuration model): tiap router punya ±links_per_router link,
+    kedua ujung link konsisten (IP /30, CDP, area, timer, auth) kecuali yang diinjeksi mismatch.
+    Return (routers, injected) — injected = ground truth untuk cek hasil deteksi.
+    """
+    rnd = random.Random(seed)
+    jenis = jenis or MISMATCH_LINK
+
+    routers = {}
+    for i in range(1, n_routers + 1):
+        eigrp = rnd.random() < eigrp_rate
+        routers[f"R{i}"] = {
+            "index": i,
+            "router_id": router_id(i),
+            "eigrp": eigrp,
+            "subnets": eigrp,
+            "interfaces": {},
+        }
+
+    # === Pasangkan port antar router === #
+    stubs = [name for name in routers for _ in range(links_per_router)]
+    rnd.shuffle(stubs)
+    port = {name: 0 for name in routers}
+    injected = {"links": [], "redistribute": [], "router_id": []}
+
+    for k in range(len(stubs) // 2):
+        a, b = stubs[2 * k], stubs[2 * k + 1]
+        if a == b:
+            continue
+        ia, ib = nama_intf(port[a]), nama_intf(port[b])
+        port[a] += 1
+        port[b] += 1
+
+        attr = {
+            "area": rnd.choice(AREAS),
+            "hello": 10,
+            "dead": 40,
+            "network": rnd.choice(["POINT_TO_POINT"] * 4 + ["BROADCAST"]),
+            "mtu": 1500,
+            "passive": False,
+            "auth": rnd.choice(AUTH),
+            "key": f"key{k % 97}",
+        }
+        sa, sb = dict(attr), dict(attr)
+
+        # === Injeksi mismatch di sisi b === #
+        if rnd.random() < mismatch_rate:
+            t = rnd.choice(jenis)
+            if t == "hello":
+                sb["hello"], sb["dead"] = 5, 20
+            elif t == "dead":
+                sb["dead"] = 60
+            elif t == "area":
+                sb["area"] = rnd.choice([x for x in set(AREAS) if x != attr["area"]])
+            elif t == "network":
+                sb["network"] = "BROADCAST" if attr["network"] == "POINT_TO_POINT" else "POINT_TO_POINT"
+            elif t == "mtu":
+                sb["mtu"] = 1400
+            elif t == "passive":
+                sb["passive"] = True
+            elif t == "auth":
+                sb["auth"] = {"none": "simple", "simple": "md5", "md5": "simple"}[attr["auth"]]
+            elif t == "auth_key":
+                if attr["auth"] == "none":
+                    sa["auth"] = sb["auth"] = "simple"
+                sb["key"] = attr["key"] + "x"
+            injected["links"].append({"jenis": t, "a": [a, ia], "b": [b, ib]})
+
+        routers[a]["interfaces"][ia] = dict(sa, ip=ip_link(k, 1), nbr=(b, ib))
+        routers[b]["interfaces"][ib] = dict(sb, ip=ip_link(k, 2), nbr=(a, ia))
+
+    # === Mismatch level router === #
+    nama = list(routers)
+    for name in rnd.sample(nama, int(len(nama) * redistribute_miss)):
+        routers[name]["eigrp"], routers[name]["subnets"] = True, False
+        injected["redistribute"].append(name)
+    for _ in range(dup_router_id):
+        r1, r2 = rnd.sample(nama, 2)
+        routers[r2]["router_id"] = routers[r1]["router_id"]
+        injected["router_id"].append([r1, r2])
+
+    return routers, injected
+
+
+# ====== RENDER OUTPUT SHOW ====== #
+def render_config(r):
+    out = [
+        "interface Loopback0",
+        f" ip address {r['router_id']} 255.255.255.255",
+        " ip ospf network point-to-point",
+        "interface FastEthernet0/0",
+        f" ip address {ip_router(r['index'])} 255.255.255.0",
+        " duplex auto",
+        " speed auto",
+        " no cdp enable",
+    ]
+    for name, s in r["interfaces"].items():
+        out.append(f"interface {name}")
+        if s["mtu"] != 1500:
+            out.append(f" mtu {s['mtu']}")
+        out.append(f" ip address {s['ip']} 255.255.255.252")
+        if s["auth"] == "simple":
+            out += [" ip ospf authentication", f" ip ospf authentication-key {s['key']}"]
+        elif s["auth"] == "md5":
+            out += [" ip ospf authentication message-digest", f" ip ospf message-digest-key 1 md5 {s['key']}"]
+        if s["hello"] != 10:
+            out.append(f" ip ospf hello-interval {s['hello']}")
+        if s["dead"] != 4 * s["hello"]:
+            out.append(f" ip ospf dead-interval {s['dead']}")
+        if s["network"] == "POINT_TO_POINT":
+            out.append(" ip ospf network point-to-point")
+        out += [" duplex auto", " speed auto"]
+    return out
+
+
+def _blok_show_interface(name, ip, prefix, mtu, mac):
+    return [
+        f"{name} is up, line protocol is up ",
+        f"  Hardware is Gt96k FE, address is {mac} (bia {mac})",
+        f"  Internet address is {ip}/{prefix}",
+        f"  MTU {mtu} bytes, BW 10000 Kbit/sec, DLY 1000 usec, ",
+        "     reliability 255/255, txload 1/255, rxload 1/255",
+        "  Encapsulation ARPA, loopback not set",
+        "  Keepalive set (10 sec)",
+        "  Half-duplex, 10Mb/s, 100BaseTX/FX",
+        "  ARP type: ARPA, ARP Timeout 04:00:00",
+        "  Last input 00:00:00, output 00:00:00, output hang never",
+        '  Last clearing of "show interface" counters never',
+        "  Input queue: 0/75/0/0 (size/max/drops/flushes); Total output drops: 0",
+        "  Queueing strategy: fifo",
+        "  Output queue: 0/40 (size/max)",
+        "  5 minute input rate 2000 bits/sec, 3 packets/sec",
+        "  5 minute output rate 1000 bits/sec, 1 packets/sec",
+        "     21435 packets input, 1852751 bytes",
+        "     Received 15102 broadcasts, 0 runts, 0 giants, 0 throttles",
+        "     0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored",
+        "     21465 packets output, 2220762 bytes, 0 underruns",
+        "     0 output errors, 0 collisions, 0 interface resets",
+        "     0 output buffer failures, 0 output buffers swapped out",
+    ]
+
+
+def render_interfaces(r):
+    i = r["index"]
+    out = _blok_show_interface("FastEthernet0/0", ip_router(i), 24, 1500, f"c2{i % 256:02x}.{i // 256:04x}.0000")
+    for j, (name, s) in enumerate(r["interfaces"].items(), start=1):
+        out += _blok_show_interface(name, s["ip"], 30, s["mtu"], f"c2{i % 256:02x}.{i // 256:04x}.{j:04x}")
+    out += [
+        "Loopback0 is up, line protocol is up ",
+        "  Hardware is Loopback",
+        f"  Internet address is {r['router_id']}/32",
+        "  MTU 1514 bytes, BW 8000000 Kbit/sec, DLY 5000 usec, ",
+        "     reliability 255/255, txload 1/255, rxload 1/255",
+        "  Encapsulation LOOPBACK, loopback not set",
+    ]
+    return out
+
+
+def _blok_ospf(name, ip, prefix, area, rid, net, hello, dead, auth, cost):
+    out = [
+        f"{name} is up, line protocol is up ",
+        f"  Internet Address {ip}/{prefix}, Area {area} ",
+        f"  Process ID 1, Router ID {rid}, Network Type {net}, Cost: {cost}",
+        f"  Transmit Delay is 1 sec, State {'POINT_TO_POINT' if net == 'POINT_TO_POINT' else 'DR'}",
+        f"  Timer intervals configured, Hello {hello}, Dead {dead}, Wait {dead}, Retransmit 5",
+        f"    oob-resync timeout {dead}",
+        "    Hello due in 00:00:04",
+        "  Supports Link-local Signaling (LLS)",
+        "  Cisco NSF helper support enabled",
+        "  IETF NSF helper support enabled",
+        "  Index 1/1, flood queue length 0",
+        "  Next 0x0(0)/0x0(0)",
+        "  Last flood scan length is 1, maximum is 4",
+        "  Last flood scan time is 0 msec, maximum is 4 msec",
+        "  Neighbor Count is 1, Adjacent neighbor count is 1 ",
+        "  Suppress hello for 0 neighbor(s)",
+    ]
+    if auth == "simple":
+        out.append("  Simple password authentication enabled")
+    elif auth == "md5":
+        out += ["  Message digest authentication enabled", "    Youngest key id is 1"]
+    return out
+
+
+def render_ospf(r):
+    rid = r["router_id"]
+    out = []
+    for name, s in r["interfaces"].items():
+        out += _blok_ospf(name, s["ip"], 30, s["area"], rid, s["network"], s["hello"], s["dead"], s["auth"], 1)
+    out += _blok_ospf("Loopback0", rid, 32, 0, rid, "POINT_TO_POINT", 10, 40, "none", 1)
+    return out
+
+
+def render_ospf_config(r):
+    out = ["router ospf 1", f" router-id {r['router_id']}", " log-adjacency-changes"]
+    if r["eigrp"]:
+        out.append(" redistribute eigrp 1 subnets" if r["subnets"] else " redistribute eigrp 1")
+    out += [f" passive-interface {name}" for name, s in r["interfaces"].items() if s["passive"]]
+    out.append(f" network {r['router_id']} 0.0.0.0 area 0")
+    out += [f" network {s['ip']} 0.0.0.0 area {s['area']}" for s in r["interfaces"].values()]
+    return out
+
+
+def render_cdp(r):
+    out = [
+        "Capability Codes: R - Router, T - Trans Bridge, B - Source Route Bridge",
+        "                  S - Switch, H - Host, I - IGMP, r - Repeater",
+        "",
+        "Device ID        Local Intrfce     Holdtme    Capability  Platform  Port ID",
+    ]
+    for name, s in r["interfaces"].items():
+        nbr, nintf = s["nbr"]
+        lokal = name.replace("FastEthernet", "Fas ")
+        remote = nintf.replace("FastEthernet", "Fas ")
+        out.append(f"{nbr + '.cisco':<17}{lokal:<19}{150:<12}R S I     3725      {remote}")
+    return out
+
+
+def render_ip_protocols(r):
+    out = [
+        'Routing Protocol is "ospf 1"',
+        "  Outgoing update filter list for all interfaces is not set",
+        "  Incoming update filter list for all interfaces is not set",
+        f"  Router ID {r['router_id']}",
+    ]
+    if r["eigrp"]:
+        out += ["  It is an autonomous system boundary router", "  Redistributing External Routes from,"]
+        out.append("    eigrp 1, includes subnets in redistribution" if r["subnets"] else "    eigrp 1")
+    out += [
+        "  Number of areas in this router is 1. 1 normal 0 stub 0 nssa",
+        "  Maximum path: 4",
+        "  Routing for Networks:",
+        f"    {r['router_id']} 0.0.0.0 area 0",
+    ]
+    out += [f"    {s['ip']} 0.0.0.0 area {s['area']}" for s in r["interfaces"].values()]
+    out += [" Reference bandwidth unit is 100 mbps", "  Distance: (default is 110)", ""]
+    if r["eigrp"]:
+        out += [
+            'Routing Protocol is "eigrp 1"',
+            "  Outgoing update filter list for all interfaces is not set",
+            "  Incoming update filter list for all interfaces is not set",
+            "  EIGRP metric weight K1=1, K2=0, K3=1, K4=0, K5=0",
+            "  Redistributing: ospf 1, eigrp 1",
+            "  Automatic network summarization is not in effect",
+            "  Maximum path: 4",
+            "  Routing for Networks:",
+            "    0.0.0.0",
+            "  Distance: internal 90 external 170",
+            "",
+        ]
+    return out
+
+
+RENDER = {
+    "config": render_config,
+    "interfaces": render_interfaces,
+    "ospf": render_ospf,
+    "ospf_config": render_ospf_config,
+    "cdp": render_cdp,
+    "ip protocols": render_ip_protocols,
+}
+
+
+def tulis_rawdata(routers, out_dir):
+    """Tulis layout rawdata (sama dengan 03_Output/rawdata), diakhiri prompt 'Rn#' seperti hasil netmiko"""
+    for folder in FOLDERS:
+        os.makedirs(os.path.join(out_dir, folder), exist_ok=True)
+    for name, r in routers.items():
+        for folder, suffix in FOLDERS.items():
+            with open(os.path.join(out_dir, folder, f"{name}_{suffix}.txt"), "w") as f:
+                f.write("\n".join(RENDER[folder](r)) + f"\n{name}#")
+
+    with open(os.path.join(out_dir, "router_list.json"), "w") as f:
+        json.dump({name: ip_router(r["index"]) for name, r in routers.items()}, f, indent=4)
+
+
+def generate(out_dir, n_routers, links_per_router, **kwargs):
+    routers, injected = buat_topologi(n_routers, links_per_router, **kwargs)
+    tulis_rawdata(routers, out_dir)
+    with open(os.path.join(out_dir, "injected.json"), "w") as f:
+        json.dump(injected, f, indent=2)
+    return routers, injected
+
+
+# ====== MAIN ====== #
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generator rawdata show command sintetis (topologi besar)")
+    parser.add_argument("--routers", type=int, default=1000)
+    parser.add_argument("--links-per-router", type=int, default=4, help="jumlah interface link per router")
+    parser.add_argument("--out", default=os.path.join(ROOT_DIR, "03_Output", "rawdata_sintetis"))
+    parser.add_argument("--mismatch-rate", type=float, default=0.05, help="fraksi link yang diinjeksi mismatch")
+    parser.add_argument("--jenis", nargs="+", choices=MISMATCH_LINK, default=None,
+                        help="jenis mismatch link yang diinjeksi (default: semua)")
+    parser.add_argument("--eigrp-rate", type=float, default=0.1, help="fraksi router OSPF+EIGRP (redistribute benar)")
+    parser.add_argument("--redistribute-miss", type=float, default=0.0,
+                        help="fraksi router OSPF+EIGRP tanpa 'subnets'")
+    parser.add_argument("--dup-router-id", type=int, default=0, help="jumlah pasangan router-id duplikat")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    routers, injected = generate(args.out, args.routers, args.links_per_router,
+                                 mismatch_rate=args.mismatch_rate, jenis=args.jenis, eigrp_rate=args.eigrp_rate,
+                                 redistribute_miss=args.redistribute_miss, dup_router_id=args.dup_router_id,
+                                 seed=args.seed)
+    n_intf = sum(len(r["interfaces"]) for r in routers.values())
+    print(f"[✓] {len(routers)} router, {n_intf} interface link → {args.out} ({time.perf_counter() - t0:.2f}s)")
+    print(f"[i] Injeksi: {len(injected['links'])} link, {len(injected['redistribute'])} redistribute, "
+          f"{len(injected['router_id'])} router-id duplikat (lihat injected.json)")
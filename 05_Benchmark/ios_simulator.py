@@ -0,0 +1,335 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import time
+
+# === Path default === #
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RAWDATA_DIR = os.path.join(ROOT_DIR, "03_Output", "rawdata")
+
+USERNAME = "cisco"
+PASSWORD = "cisco"
+ADMIN_HOSTNAME = "ADMIN"
+NL = "\r\n"
+
+# command → (folder, suffix file) di 03_Output/rawdata (sama dengan 1_Ambil_RawData.py)
+SHOW_COMMANDS = {
+    "show interfaces": ("interfaces", "show_interfaces"),
+    "show ip ospf interface": ("ospf", "show_ip_ospf_interface"),
+    "show run | section interface": ("config", "show_run__section_interface"),
+    "show run | section router ospf": ("ospf_config", "show_run__section_router_ospf"),
+    "show cdp neighbor": ("cdp", "show_cdp_neighbor"),
+    "show ip protocols": ("ip protocols", "show_ip_protocols"),
+}
+# alias yang dipakai script 00_Init Konfig
+ALIAS = {
+    "show run | s ^interface": "show run | section interface",
+}
+
+
+# ====== DATA ROUTER PALSU ====== #
+def ip_router(i):
+    """IP management router ke-i (1-based); R1..R12 = router_list.json asli"""
+    return f"100.100.{100 + (i - 1) // 254}.{(i - 1) % 254 + 1}"
+
+
+def load_template(rawdata_dir):
+    """{router: {cmd: output tanpa prompt di baris terakhir}} dari rawdata asli"""
+    template = {}
+    pola_prompt = re.compile(r"\n?\S+#\s*$")
+    for cmd, (folder, suffix) in SHOW_COMMANDS.items():
+        folder_path = os.path.join(rawdata_dir, folder)
+        if not os.path.isdir(folder_path):
+            continue
+        for fname in os.listdir(folder_path):
+            m = re.match(rf"^(\S+?)_{re.escape(suffix)}\.txt$", fname)
+            if not m:
+                continue
+            with open(os.path.join(folder_path, fname)) as f:
+                teks = pola_prompt.sub("", f.read())
+            template.setdefault(m.group(1), {})[cmd] = teks.replace("\r\n", "\n").replace("\n", NL)
+    if not template:
+        raise SystemExit(f"[!] Tidak ada rawdata di {rawdata_dir}")
+    return template
+
+
+def show_ip_int_br(config_output):
+    """Sintesis 'show ip int br' dari 'show run | section interface'"""
+    baris = ["Interface                  IP-Address      OK? Method Status                Protocol"]
+    intf = None
+    for line in config_output.split(NL):
+        line = line.strip()
+        if line.startswith("interface"):
+            if intf:
+                baris.append(f"{intf:<27}unassigned      YES unset  administratively down down")
+            intf = line.split()[1]
+        elif line.startswith("ip address") and intf:
+            parts = line.split()
+            baris.append(f"{intf:<27}{parts[2]:<16}YES NVRAM  up                    up")
+            intf = None
+    if intf:
+        baris.append(f"{intf:<27}unassigned      YES unset  administratively down down")
+    return NL.join(baris)
+
+
+class Inventory:
+    """N router palsu; output diambil bergiliran dari router template (R1..R12)"""
+
+    def __init__(self, n_routers, template, churn=0.0):
+        self.template = template
+        nama_template = sorted(template, key=lambda r: int(re.sub(r"\D", "", r) or 0))
+        self.by_ip = {}
+        start = time.strftime("%H:%M:%S UTC %a %b %d %Y")
+        for i in range(1, n_routers + 1):
+            name = f"R{i}"
+            src = name if name in template else nama_template[(i - 1) % len(nama_template)]
+            # churn → sebagian router punya 'Last configuration change' baru setiap start simulator
+            waktu = start if random.random() < churn else "00:00:00 UTC Mon Mar 1 2002"
+            self.by_ip[ip_router(i)] = (name, src, waktu)
+
+    def router_list(self):
+        return {name: ip for ip, (name, _, _) in self.by_ip.items()}
+
+
+# ====== STATE MACHINE CLI ====== #
+class SesiCLI:
+    """
+    Satu sesi CLI: mulai di prompt router admin, bisa nested 'ssh -l cisco <ip>'
+    ke router palsu, menjawab show command, conf t, terminal length 0, dst.
+    proses() → (teks balasan termasuk echo & prompt berikutnya, tutup_koneksi)
+    """
+
+    def __init__(self, inventory, opts):
+        self.inv = inventory
+        self.opts = opts
+        self.router = None      # (name, src, waktu) kalau sedang di router target
+        self.router_ip = None
+        self.mode = ""          # "", "config", "config-if", "config-router"
+        self.tunggu_password = None
+
+    def prompt(self):
+        host = self.router[0] if self.router else ADMIN_HOSTNAME
+        return f"{host}({self.mode})#" if self.mode else f"{host}#"
+
+    async def _delay(self, base):
+        if base > 0:
+            await asyncio.sleep(base + random.uniform(0, self.opts.jitter))
+
+    async def proses(self, line):
+        line = line.strip()
+
+        # --- password untuk nested SSH (tidak di-echo) --- #
+        if self.tunggu_password is not None:
+            target = self.tunggu_password
+            self.tunggu_password = None
+            await self._delay(self.opts.login_latency)
+            if line != PASSWORD:
+                return f"{NL}% Authentication failed.{NL}{NL}[Connection to {target[0]} closed by foreign host]{NL}{self.prompt()}", False
+            self.router_ip, self.router = target
+            return f"{NL}{NL}{self.prompt()}", False
+
+        echo = line + NL
+
+        if not line or line.startswith("!") or line.startswith("terminal"):
+            return echo + self.prompt(), False
+
+        # --- di router admin --- #
+        if self.router is None:
+            m = re.match(r"^ssh -l (\S+) (\S+)$", line)
+            if m:
+                ip = m.group(2)
+                await self._delay(self.opts.login_latency)
+                if ip not in self.inv.by_ip:
+                    return f"{echo}% Destination unreachable; gateway or host down{NL}{NL}{self.prompt()}", False
+                if random.random() < self.opts.fail_rate:
+                    return f"{echo}% Connection refused by remote host{NL}{NL}{self.prompt()}", False
+                self.tunggu_password = (ip, self.inv.by_ip[ip])
+                return f"{echo}Password: ", False
+            if line in ("exit", "logout"):
+                return echo, True
+            return f"{echo}{NL}% Invalid input detected at '^' marker.{NL}{NL}{self.prompt()}", False
+
+        # --- di router target --- #
+        name, src, waktu = self.router
+
+        if self.mode:
+            return echo + self._config(line), False
+
+        if line in ("exit", "logout"):
+            ip, self.router = self.router_ip, None
+            return f"{echo}{NL}[Connection to {ip} closed by foreign host]{NL}{self.prompt()}", False
+
+        if line in ("conf t", "configure terminal"):
+            self.mode = "config"
+            return f"{echo}Enter configuration commands, one per line.  End with CNTL/Z.{NL}{self.prompt()}", False
+
+        if line in ("wr", "write memory"):
+            await self._delay(self.opts.latency)
+            return f"{echo}Building configuration...{NL}[OK]{NL}{self.prompt()}", False
+
+        cmd = ALIAS.get(line, line)
+        outputs = self.inv.template[src]
+        if cmd in SHOW_COMMANDS:
+            teks = outputs.get(cmd, "")
+        elif cmd == "show ip int br":
+            teks = show_ip_int_br(outputs.get("show run | section interface", ""))
+        elif cmd.startswith("show running-config | include Last configuration change"):
+            teks = f"! Last configuration change at {waktu} by cisco"
+        else:
+            return f"{echo}{NL}% Invalid input detected at '^' marker.{NL}{NL}{self.prompt()}", False
+
+        await self._delay(self.opts.latency + len(teks) / 1024 * self.opts.latency_per_kb)
+        if random.random() < self.opts.drop_rate:
+            return echo, True
+        return f"{echo}{teks}{NL}{self.prompt()}" if teks else f"{echo}{self.prompt()}", False
+
+    def _config(self, line):
+        if line == "end":
+            self.mode = ""
+        elif line == "exit":
+            self.mode = "config" if self.mode != "config" else ""
+        elif line.startswith("interface "):
+            self.mode = "config-if"
+        elif line.startswith("router "):
+            self.mode = "config-router"
+        return self.prompt()
+
+
+# ====== TRANSPORT ====== #
+def pecah_baris(buffer):
+    """Pisahkan input per baris (\\r\\n, \\r atau \\n) → (list baris, sisa buffer)"""
+    buffer = buffer.replace("\r\n", "\n").replace("\r", "\n")
+    *baris, sisa = buffer.split("\n")
+    return baris, sisa
+
+
+async def layani_telnet(reader, writer, inventory, opts):
+    """Transport TCP polos (gaya telnet) → netmiko device_type 'cisco_ios_telnet'"""
+    try:
+        await asyncio.sleep(opts.handshake)
+        writer.write(f"{NL}User Access Verification{NL}{NL}Username: ".encode())
+        username = (await reader.readline()).decode(errors="ignore").strip()
+        writer.write(b"Password: ")
+        password = (await reader.readline()).decode(errors="ignore").strip()
+        if username != USERNAME or password != PASSWORD:
+            writer.write(f"{NL}% Login invalid{NL}".encode())
+            return
+
+        sesi = SesiCLI(inventory, opts)
+        writer.write(f"{NL}{sesi.prompt()}".encode())
+        buffer = ""
+        while True:
+            data = await reader.read(4096)
+            if not data:
+                break
+            baris, buffer = pecah_baris(buffer + data.decode(errors="ignore"))
+            for line in baris:
+                balasan, tutup = await sesi.proses(line)
+                writer.write(balasan.encode())
+                await writer.drain()
+                if tutup:
+                    return
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def jalankan_ssh(host, port, inventory, opts):
+    """Transport SSH asli (butuh asyncssh) → netmiko device_type 'cisco_ios'"""
+    import asyncssh
+
+    class _Server(asyncssh.SSHServer):
+        def begin_auth(self, username):
+            return True
+
+        def password_auth_supported(self):
+            return True
+
+        def validate_password(self, username, password):
+            return username == USERNAME and password == PASSWORD
+
+    async def handle(process):
+        await asyncio.sleep(opts.handshake)
+        sesi = SesiCLI(inventory, opts)
+        process.stdout.write(f"{NL}{sesi.prompt()}")
+        buffer = ""
+        try:
+            while True:
+                data = await process.stdin.read(4096)
+                if not data:
+                    break
+                baris, buffer = pecah_baris(buffer + data)
+                for line in baris:
+                    balasan, tutup = await sesi.proses(line)
+                    process.stdout.write(balasan)
+                    if tutup:
+                        process.exit(0)
+                        return
+        except (asyncssh.BreakReceived, asyncssh.TerminalSizeChanged, ConnectionError):
+            pass
+        process.exit(0)
+
+    return await asyncssh.create_server(
+        _Server, host, port,
+        server_host_keys=[asyncssh.generate_private_key("ssh-rsa")],
+        process_factory=handle, line_editor=False, encoding="utf-8",
+    )
+
+
+# ====== MAIN ====== #
+async def main(opts):
+    template = load_template(opts.rawdata)
+    inventory = Inventory(opts.routers, template, churn=opts.churn)
+
+    if opts.inventory:
+        with open(opts.inventory, "w") as f:
+            json.dump(inventory.router_list(), f, indent=4)
+        print(f"[✓] Inventory {opts.routers} router ditulis ke {opts.inventory}")
+
+    transport = opts.transport
+    if transport == "auto":
+        try:
+            import asyncssh  # noqa: F401
+            transport = "ssh"
+        except ImportError:
+            transport = "telnet"
+
+    if transport == "ssh":
+        await jalankan_ssh(opts.host, opts.port, inventory, opts)
+        device_type = "cisco_ios"
+    else:
+        await asyncio.start_server(lambda r, w: layani_telnet(r, w, inventory, opts),
+                                   opts.host, opts.port, limit=2 ** 20, backlog=4096)
+        device_type = "cisco_ios_telnet"
+
+    print(f"[✓] Simulator {transport} jalan di {opts.host}:{opts.port} "
+          f"({opts.routers} router, template {len(template)} router, device_type={device_type})")
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulator router admin + router IOS untuk benchmark collector/pusher")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=2222)
+    parser.add_argument("--transport", choices=["auto", "ssh", "telnet"], default="auto",
+                        help="ssh butuh asyncssh; telnet = TCP polos (netmiko cisco_ios_telnet)")
+    parser.add_argument("--routers", type=int, default=12, help="jumlah router palsu")
+    parser.add_argument("--rawdata", default=RAWDATA_DIR, help="folder rawdata sumber output show command")
+    parser.add_argument("--inventory", help="tulis router_list.json untuk router palsu ke path ini")
+    parser.add_argument("--handshake", type=float, default=0.0, help="delay (detik) login ke router admin")
+    parser.add_argument("--login-latency", type=float, default=0.05, help="delay nested ssh ke router target")
+    parser.add_argument("--latency", type=float, default=0.02, help="delay dasar per command")
+    parser.add_argument("--latency-per-kb", type=float, default=0.0, help="delay tambahan per KB output")
+    parser.add_argument("--jitter", type=float, default=0.0, help="jitter acak (detik) per delay")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="peluang nested ssh ditolak")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="peluang koneksi putus saat show command")
+    parser.add_argument("--churn", type=float, default=0.0,
+                        help="fraksi router yang 'Last configuration change'-nya berubah (uji --incremental)")
+    try:
+        asyncio.run(main(parser.parse_args()))
+    except KeyboardInterrupt:
+        print("\n[i] Simulator dihentikan")
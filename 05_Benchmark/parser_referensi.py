@@ -0,0 +1,173 @@
+import re
+
+from nama_interface import lengkap
+
+# ====== PARSER REFERENSI (per baris, splitlines) ====== #
+# Implementasi awal 2_Pembuatan_JSON.py sebelum parser_engine. Tidak dipakai pipeline;
+# disimpan di sini sebagai acuan perilaku: bench_parser.py / bench_mmap_parse.py
+# memastikan hasil parser_engine identik dengan fungsi-fungsi ini.
+
+
+def parse_config_interface(config_output):
+    """Parse 'show run | section interface' → ambil IP & OSPF auth key"""
+    interfaces = {}
+    current_intf = None
+
+    for raw_line in config_output.splitlines():
+        line = raw_line.strip()
+
+        if line.startswith("interface"):
+            current_intf = line.split()[1]
+            interfaces[current_intf] = {}
+
+        elif current_intf:
+            if line.startswith("ip address"):
+                parts = line.split()
+                if len(parts) >= 4:
+                    interfaces[current_intf]["ip"] = parts[2]
+                    interfaces[current_intf]["subnet"] = parts[3]
+
+            if line.startswith("ip ospf authentication-key"):
+                key = line.split()[-1]
+                if "ospf" not in interfaces[current_intf]:
+                    interfaces[current_intf]["ospf"] = {"auth_key": {}}
+                interfaces[current_intf]["ospf"]["auth_key"] = {"simple": key}
+
+            elif line.startswith("ip ospf message-digest-key"):
+                parts = line.split()
+                if len(parts) >= 5:
+                    key_id = parts[3]
+                    key_val = parts[-1]
+                    if "ospf" not in interfaces[current_intf]:
+                        interfaces[current_intf]["ospf"] = {"auth_key": {}}
+                    interfaces[current_intf]["ospf"]["auth_key"][key_id] = key_val
+
+            elif line.startswith("ip ospf authentication") and "authentication-key" not in line:
+                if "ospf" not in interfaces[current_intf]:
+                    interfaces[current_intf]["ospf"] = {}
+                if "auth_key" not in interfaces[current_intf]["ospf"]:
+                    interfaces[current_intf]["ospf"]["auth_key"] = {}
+
+    for intf, data in interfaces.items():
+        if "ospf" in data and "auth_key" not in data["ospf"]:
+            data["ospf"]["auth_key"] = {}
+
+    return interfaces
+
+
+def parse_show_interfaces(interfaces_output):
+    """Parse 'show interfaces' → ambil MTU"""
+    mtu_data = {}
+    current_intf = None
+
+    for line in interfaces_output.splitlines():
+        if re.match(r"^(FastEthernet|GigabitEthernet|Loopback)", line):
+            current_intf = line.split()[0]
+        elif "MTU" in line and current_intf:
+            match = re.search(r"MTU (\d+) bytes", line)
+            if match:
+                mtu_data[current_intf] = int(match.group(1))
+    return mtu_data
+
+
+def parse_show_ip_ospf_interface(ospf_output):
+    """Parse 'show ip ospf interface' → area, hello/dead, net type, ospf auth"""
+    ospf_data = {}
+    current_intf = None
+
+    for line in ospf_output.splitlines():
+        if re.match(r"^(FastEthernet|GigabitEthernet|Loopback)", line):
+            parts = line.split()
+            current_intf = parts[0]
+            ospf_data[current_intf] = {}
+            ospf_data[current_intf]["ospf auth"] = "none"
+
+        if current_intf:
+            if "Internet Address" in line and "Area" in line:
+                area = re.search(r"Area (\d+)", line).group(1)
+                ospf_data[current_intf]["area"] = int(area)
+
+            if "Timer intervals" in line:
+                hello = re.search(r"Hello (\d+)", line).group(1)
+                dead = re.search(r"Dead (\d+)", line).group(1)
+                ospf_data[current_intf]["Hello"] = int(hello)
+                ospf_data[current_intf]["Dead"] = int(dead)
+
+            if "Network Type" in line:
+                net_type = re.search(r"Network Type (\S+)", line).group(1)
+                ospf_data[current_intf]["Network Type"] = net_type.rstrip(",").capitalize()
+
+            if "Simple password authentication enabled" in line:
+                ospf_data[current_intf]["ospf auth"] = "simple"
+            elif "Message digest authentication enabled" in line:
+                ospf_data[current_intf]["ospf auth"] = "message-digest"
+
+    return ospf_data
+
+
+def parse_show_run_ospf_config(ospf_config_output):
+    """Parse 'show run | section router ospf' → router-id, redistribute, passive"""
+    router_id = None
+    redistribute = False
+    passive = []
+
+    for line in ospf_config_output.splitlines():
+        line = line.strip()
+        if "router-id" in line:
+            router_id = line.split()[1]
+        if line.startswith("redistribute eigrp"):
+            if "subnets" in line:
+                redistribute = True
+            else:
+                redistribute = False
+        if "passive-interface" in line:
+            intf = line.split()[1]
+            passive.append(intf)
+
+    return router_id, redistribute, passive
+
+
+def parse_show_cdp_neighbor(cdp_output):
+    """Parse 'show cdp neighbor' → neighbor mapping"""
+    neighbors = {}
+    for line in cdp_output.splitlines():
+        if re.match(r"^\S+\.cisco", line):
+            parts = line.split()
+            device_id = parts[0].split(".")[0]  # contoh: R9.cisco -> R9
+            # Normalisasi nama lewat tabel kanonik (Fas/Gig/Ten/Se/Po... → nama lengkap)
+            local_intf = lengkap(parts[1]) + parts[2]           # contoh: Fas 2/0 → FastEthernet2/0
+            port_id = lengkap(parts[-2]) + " " + parts[-1]      # contoh: Fas 0/1 → FastEthernet 0/1
+
+            neighbors[local_intf] = {
+                "router": device_id,
+                "interface": port_id
+            }
+    return neighbors
+
+
+def parse_show_ip_protocols(proto_output):
+    """Parse 'show ip protocols' → routing protocols, redistribute, router-id"""
+    protocols = []
+    redistribute = False
+    router_id = None
+
+    for line in proto_output.splitlines():
+        line = line.strip()
+
+        if line.startswith("Routing Protocol is"):
+            if "ospf" in line and "ospf" not in protocols:
+                protocols.append("ospf")
+            if "eigrp" in line and "eigrp" not in protocols:
+                protocols.append("eigrp")
+
+        if line.startswith("Redistributing"):
+            if "subnets" in line:
+                redistribute = True
+            else:
+                redistribute = False
+
+        if "Router ID" in line:
+            parts = line.split()
+            router_id = parts[-1]
+
+    return protocols, redistribute, router_id